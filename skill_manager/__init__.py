@@ -27,7 +27,7 @@ Agent Skills Manager - 通用的 Agent Skills 解析和调用库
 # ============================================================================
 # 导出外观类（主要 API）
 # ============================================================================
-from .facades import SkillManager
+from .facades import SkillManager, AsyncSkillManager
 from .core.entities.message import MessageRole
 
 # ============================================================================
@@ -43,12 +43,12 @@ from .infrastructure.backends import (
 # ============================================================================
 # 导出接口（用于依赖注入和扩展）
 # ============================================================================
-from .core.interfaces import ILLMBackend, IModelConfig, IMessage
+from .core.interfaces import ILLMBackend, IModelConfig, IMessage, GenerationOptions, ISkillCatalogCache, ITextEncoder, IVectorStore, IRoutingStore, IResponseStore
 
 # ============================================================================
 # 导出实体（用于类型注解）
 # ============================================================================
-from .core.entities import Skill, SkillMetadata, Message
+from .core.entities import Skill, SkillMetadata, Message, CatalogSnapshot, PromptSegment, SegmentedPrompt
 
 # ============================================================================
 # 导出服务接口（用于自定义实现）
@@ -59,11 +59,28 @@ from .core.services import (
     IPromptBuilder,
     ISkillExecutor,
     FilesystemSkillLoader,
+    ArchiveSkillLoader,
+    StaleSkillError,
+    SkillDiscovery,
+    BlobStore,
+    ContentCache,
     SemanticSkillMatcher,
+    IndexedSkillMatcher,
+    EmbeddingSkillMatcher,
+    CachingSkillMatcher,
+    CachingLLMBackend,
+    HierarchicalSkillMatcher,
+    HashingTextEncoder,
     SystemPromptBuilder,
     SkillExecutor,
 )
 
+# ============================================================================
+# 导出缓存实现
+# ============================================================================
+from .infrastructure.cache import SqliteCatalogCache, SqliteRoutingStore, SqliteResponseStore
+from .infrastructure.vectors import NpyVectorStore
+
 # ============================================================================
 # 便捷函数
 # ============================================================================
@@ -83,6 +100,7 @@ __author__ = "LLM Skills Manager Contributors"
 __all__ = [
     # 主要 API
     'SkillManager',
+    'AsyncSkillManager',
 
     # 后端实现
     'OpenAIBackend',
@@ -94,12 +112,21 @@ __all__ = [
     'ILLMBackend',
     'IModelConfig',
     'IMessage',
+    'GenerationOptions',
+    'ISkillCatalogCache',
+    'ITextEncoder',
+    'IVectorStore',
+    'IRoutingStore',
+    'IResponseStore',
 
     # 实体
     'Skill',
     'SkillMetadata',
     'Message',
+    'CatalogSnapshot',
     'MessageRole',
+    'PromptSegment',
+    'SegmentedPrompt',
 
     # 服务接口
     'ISkillLoader',
@@ -109,10 +136,27 @@ __all__ = [
 
     # 服务实现
     'FilesystemSkillLoader',
+    'ArchiveSkillLoader',
+    'StaleSkillError',
+    'SkillDiscovery',
+    'BlobStore',
+    'ContentCache',
     'SemanticSkillMatcher',
+    'IndexedSkillMatcher',
+    'EmbeddingSkillMatcher',
+    'CachingSkillMatcher',
+    'CachingLLMBackend',
+    'HierarchicalSkillMatcher',
+    'HashingTextEncoder',
     'SystemPromptBuilder',
     'SkillExecutor',
 
+    # 缓存实现
+    'SqliteCatalogCache',
+    'SqliteRoutingStore',
+    'SqliteResponseStore',
+    'NpyVectorStore',
+
     # 便捷函数
     'create_skill_template',
     'validate_skill',
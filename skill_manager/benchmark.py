@@ -0,0 +1,249 @@
+"""
+路由基准测试 - 比较匹配器的准确率和代价
+
+读取带标注的 JSONL（每行 {"query": ..., "expected": <Skill 名称或 null>}），
+在确定性的模拟后端上逐个运行匹配器，输出机器可读的 JSON 结果：
+准确率、p50/p95/p99 延迟、每个查询的 LLM 调用次数和提示 token 数。
+
+使用示例：
+    python -m skill_manager.benchmark benchmarks/routing_queries.jsonl --skills skills
+    python -m skill_manager.benchmark queries.jsonl --matchers semantic indexed --output result.json
+"""
+import argparse
+import contextlib
+import json
+import math
+import re
+import sys
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .core.entities.skill import Skill
+from .core.entities.catalog import CatalogSnapshot
+from .core.interfaces.llm_backend import ILLMBackend, IModelConfig, GenerationOptions
+from .core.services.bm25_index import tokenize
+from .core.services.reference_index import estimate_tokens
+from .core.services.skill_matcher import ISkillMatcher, SemanticSkillMatcher, IndexedSkillMatcher, ExactSkillMatcher
+from .core.services.hierarchical_matcher import HierarchicalSkillMatcher
+from .core.services.skill_loader import FilesystemSkillLoader
+
+# 提示中列出候选的行，如 "- pdf: ..."
+LISTED_PATTERN = re.compile(r'^- (\S+?): (.*)$', re.MULTILINE)
+USER_REQUEST_PATTERN = re.compile(r'^User request: (.*)$', re.MULTILINE)
+
+
+@dataclass
+class BenchmarkCase:
+    """带标注的查询"""
+    query: str
+    expected: Optional[str] = None
+
+
+@dataclass
+class BenchmarkResult:
+    """单个匹配器的基准结果"""
+    matcher: str
+    queries: int
+    accuracy: float
+    latency_ms_p50: float
+    latency_ms_p95: float
+    latency_ms_p99: float
+    llm_calls_per_query: float
+    prompt_tokens_per_query: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return asdict(self)
+
+
+class FakeBackend(ILLMBackend):
+    """
+    确定性的模拟后端
+
+    不访问网络，只统计调用次数和提示 token 数。
+    回答规则：当前查询的标注答案出现在提示的候选中时返回它（oracle=True），
+    否则返回与用户请求词重叠最多的候选，没有重叠时返回 "none"。
+    因此准确率反映的是本地分级和候选召回的质量，而不是真实模型的判断能力。
+    """
+
+    def __init__(self, oracle: bool = True):
+        """
+        Args:
+            oracle: 候选中包含标注答案时是否直接返回
+        """
+        self.oracle = oracle
+        self.expected: Optional[str] = None
+        self.calls = 0
+        self.prompt_tokens = 0
+
+    def complete(
+        self,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> str:
+        """记录代价并按规则回答"""
+        self.calls += 1
+        prompt = "\n".join(str(message.get("content", "")) for message in messages)
+        self.prompt_tokens += estimate_tokens(prompt)
+        if system_prompt:
+            self.prompt_tokens += estimate_tokens(system_prompt)
+        if tools:
+            self.prompt_tokens += estimate_tokens(json.dumps(tools, ensure_ascii=False))
+
+        listed = {name.lower(): text for name, text in LISTED_PATTERN.findall(prompt)}
+        if options is not None and options.choices:
+            listed = {name: text for name, text in listed.items() if name in options.choices}
+
+        if self.oracle and self.expected is not None:
+            expected = self.expected.lower()
+            if expected in listed:
+                return expected
+            # 类别提示：概括中列出了标注的 Skill
+            pattern = re.compile(rf'(?<![\w-]){re.escape(expected)}(?![\w-])')
+            for name, text in listed.items():
+                if pattern.search(text):
+                    return name
+
+        request = USER_REQUEST_PATTERN.search(prompt)
+        query = set(tokenize(request.group(1) if request else prompt))
+        best, best_overlap = "none", 0
+        for name, text in listed.items():
+            overlap = len(query & set(tokenize(f"{name.replace('-', ' ')} {text}")))
+            if overlap > best_overlap:
+                best, best_overlap = name, overlap
+        return best
+
+    def get_model_name(self) -> str:
+        """获取模型名称"""
+        return "fake"
+
+    def configure(self, config: IModelConfig) -> None:
+        """模拟后端无需配置"""
+        pass
+
+
+def load_cases(path: str | Path) -> List[BenchmarkCase]:
+    """读取 JSONL 标注文件（空行和 # 开头的行忽略）"""
+    cases = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            data = json.loads(line)
+            cases.append(BenchmarkCase(query=data["query"], expected=data.get("expected")))
+    return cases
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """最近秩百分位数"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, math.ceil(q / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def run_benchmark(
+    matcher: ISkillMatcher,
+    cases: Sequence[BenchmarkCase],
+    skills: Sequence[Skill],
+    name: Optional[str] = None,
+    backend: Optional[FakeBackend] = None,
+    warmup: bool = True
+) -> BenchmarkResult:
+    """
+    运行单个匹配器
+
+    Args:
+        matcher: 匹配器
+        cases: 标注查询
+        skills: Skill 集合（建议传入目录快照，与线上一致地复用派生数据）
+        name: 结果中的匹配器名称（默认类名）
+        backend: 模拟后端（默认新建 FakeBackend）
+        warmup: 是否先用第一个查询预热（建立索引等一次性开销不计入结果）
+    """
+    backend = backend or FakeBackend()
+    if warmup and cases:
+        backend.expected = cases[0].expected
+        matcher.match(cases[0].query, skills, backend)
+
+    calls_before, tokens_before = backend.calls, backend.prompt_tokens
+    latencies = []
+    correct = 0
+    for case in cases:
+        backend.expected = case.expected
+        start = time.perf_counter()
+        skill = matcher.match(case.query, skills, backend)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if (skill.metadata.name if skill else None) == case.expected:
+            correct += 1
+
+    count = len(cases) or 1
+    return BenchmarkResult(
+        matcher=name or type(matcher).__name__,
+        queries=len(cases),
+        accuracy=correct / count,
+        latency_ms_p50=percentile(latencies, 50),
+        latency_ms_p95=percentile(latencies, 95),
+        latency_ms_p99=percentile(latencies, 99),
+        llm_calls_per_query=(backend.calls - calls_before) / count,
+        prompt_tokens_per_query=(backend.prompt_tokens - tokens_before) / count,
+    )
+
+
+def default_matchers() -> Dict[str, Callable[[], ISkillMatcher]]:
+    """内置匹配器（名称 -> 工厂）"""
+    matchers: Dict[str, Callable[[], ISkillMatcher]] = {
+        'semantic': SemanticSkillMatcher,
+        # 每个请求都调用 LLM，但只让它在 BM25 前 top_k 个候选中选择（不是全目录基线）
+        'semantic-topk-llm': lambda: SemanticSkillMatcher(threshold=float('inf'), exact_names=False),
+        'indexed': IndexedSkillMatcher,
+        'exact': ExactSkillMatcher,
+        'hierarchical': lambda: HierarchicalSkillMatcher(flat_limit=0),
+    }
+    from .core.services import embedding_matcher
+    if embedding_matcher.np is not None:
+        matchers['embedding'] = embedding_matcher.EmbeddingSkillMatcher
+    return matchers
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """命令行入口"""
+    available = default_matchers()
+    parser = argparse.ArgumentParser(description="Skill 路由基准测试")
+    parser.add_argument("cases", help="标注查询 JSONL 文件")
+    parser.add_argument("--skills", default="skills", help="Skills 目录")
+    parser.add_argument("--matchers", nargs="+", choices=sorted(available), default=sorted(available))
+    parser.add_argument("--no-oracle", action="store_true", help="模拟后端只按词重叠回答")
+    parser.add_argument("--output", help="结果 JSON 文件（默认输出到标准输出）")
+    args = parser.parse_args(argv)
+
+    cases = load_cases(args.cases)
+    # 加载器的警告输出到标准错误，保持标准输出为纯 JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        skills = CatalogSnapshot(FilesystemSkillLoader().load_skills_from_directory(Path(args.skills)), version=1)
+
+    results = [
+        run_benchmark(available[name](), cases, skills, name=name, backend=FakeBackend(oracle=not args.no_oracle))
+        for name in args.matchers
+    ]
+    report = json.dumps(
+        {"skills": len(skills), "queries": len(cases), "results": [result.to_dict() for result in results]},
+        ensure_ascii=False,
+        indent=2
+    )
+
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding='utf-8')
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
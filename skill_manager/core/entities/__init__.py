@@ -1,5 +1,8 @@
 """Entities - 领域实体（单一职责原则）"""
-from .skill import Skill, SkillMetadata
+from .skill import Skill, SkillMetadata, LazyValue, CachedValue
+from .blob import Blob
+from .catalog import CatalogSnapshot
 from .message import Message, MessageRole
+from .prompt import PromptSegment, SegmentedPrompt
 
-__all__ = ['Skill', 'SkillMetadata', 'Message', 'MessageRole']
+__all__ = ['Skill', 'SkillMetadata', 'LazyValue', 'CachedValue', 'Blob', 'CatalogSnapshot', 'Message', 'MessageRole', 'PromptSegment', 'SegmentedPrompt']
@@ -0,0 +1,31 @@
+"""
+内容块实体 - 单一职责原则
+
+只负责保存按内容寻址的不可变文本
+"""
+
+
+class Blob:
+    """
+    内容寻址的不可变文本块
+
+    相同内容的脚本、参考文档和正文共享同一个 Blob 实例，
+    由 BlobStore 负责去重
+    """
+
+    __slots__ = ('digest', 'text', '__weakref__')
+
+    def __init__(self, digest: bytes, text: str):
+        """
+        Args:
+            digest: 内容摘要
+            text: 文本内容
+        """
+        self.digest = digest
+        self.text = text
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        return f"Blob(digest={self.digest.hex()}, length={len(self.text)})"
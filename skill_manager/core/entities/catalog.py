@@ -0,0 +1,129 @@
+"""
+Skill 目录快照实体 - 单一职责原则
+
+只负责保存某一时刻不可变的 Skill 集合及其派生数据
+"""
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, TypeVar, overload
+
+from .skill import Skill, SkillMetadata
+
+T = TypeVar('T')
+
+
+class CatalogSnapshot(Sequence[Skill]):
+    """
+    不可变的 Skill 目录快照
+
+    重新加载时构建新快照并整体替换引用，读取方拿到的快照永远不会再变化，
+    因此请求线程无需加锁即可获得一致的视图。
+    快照本身就是 Skill 序列，可以直接传给匹配器、执行器和提示构建器；
+    按名称查找为 O(1)。
+    从完整目录中选出的子集（如类别）以 parent 指向完整目录，
+    维护索引的匹配器据此在完整目录的索引上检索后过滤，而不是为子集重建索引。
+    """
+
+    __slots__ = ('_skills', '_by_name', '_metadata', '_derived', 'version', 'parent')
+
+    def __init__(
+        self,
+        skills: Iterable[Skill] = (),
+        version: int = 0,
+        parent: Optional['CatalogSnapshot'] = None
+    ):
+        """
+        Args:
+            skills: Skill 集合（同名时后者覆盖前者）
+            version: 快照版本号，每次发布递增
+            parent: 本快照作为子集时所属的完整目录
+        """
+        by_name: Dict[str, Skill] = {}
+        for skill in skills:
+            by_name[skill.metadata.name] = skill
+
+        self._skills: Tuple[Skill, ...] = tuple(by_name.values())
+        self._by_name: Mapping[str, Skill] = MappingProxyType(by_name)
+        self._metadata: Tuple[SkillMetadata, ...] = tuple(skill.metadata for skill in self._skills)
+        self._derived: Dict[Any, Any] = {}
+        self.version = version
+        self.parent = root_catalog(parent) if parent is not None else None
+
+    @overload
+    def __getitem__(self, index: int) -> Skill: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Skill]: ...
+
+    def __getitem__(self, index):
+        return self._skills[index]
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def __iter__(self) -> Iterator[Skill]:
+        return iter(self._skills)
+
+    def __contains__(self, item: object) -> bool:
+        if isinstance(item, str):
+            return item in self._by_name
+        return item in self._skills
+
+    def get(self, name: str) -> Optional[Skill]:
+        """按名称获取 Skill"""
+        return self._by_name.get(name)
+
+    @property
+    def skills(self) -> Tuple[Skill, ...]:
+        """Skill 元组"""
+        return self._skills
+
+    @property
+    def names(self) -> Mapping[str, Skill]:
+        """名称 -> Skill 的只读索引"""
+        return self._by_name
+
+    @property
+    def metadata(self) -> Tuple[SkillMetadata, ...]:
+        """所有 Skill 的元数据"""
+        return self._metadata
+
+    def derived(self, key: Any, factory: Callable[['CatalogSnapshot'], T]) -> T:
+        """
+        获取基于本快照计算的派生数据（如描述列表、索引）
+
+        每个快照对每个 key 只计算一次；并发首次访问时 factory 可能被调用多次，
+        因此 factory 必须是无副作用的纯函数
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = factory(self)
+            return self._derived.setdefault(key, value)
+
+    def __repr__(self) -> str:
+        return f"CatalogSnapshot(version={self.version}, skills={len(self._skills)})"
+
+
+def find_skill(skills: Sequence[Skill], name: str) -> Optional[Skill]:
+    """按名称查找 Skill；传入快照时为 O(1) 查找"""
+    if isinstance(skills, CatalogSnapshot):
+        return skills.get(name)
+    # 与 {name: skill} 字典语义一致：同名时后者优先
+    for skill in reversed(skills):
+        if skill.metadata.name == name:
+            return skill
+    return None
+
+
+def root_catalog(skills: Sequence[Skill]) -> Sequence[Skill]:
+    """子集快照所属的完整目录；其他情况返回 skills 本身"""
+    if isinstance(skills, CatalogSnapshot) and skills.parent is not None:
+        return skills.parent
+    return skills
+
+
+def derive(skills: Sequence[Skill], key: Any, factory: Callable[[Sequence[Skill]], T]) -> T:
+    """计算派生数据；传入快照时按快照缓存，普通列表每次重新计算"""
+    if isinstance(skills, CatalogSnapshot):
+        return skills.derived(key, factory)
+    return factory(skills)
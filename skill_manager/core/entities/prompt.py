@@ -0,0 +1,57 @@
+"""
+分段系统提示实体 - 单一职责原则
+
+只负责保存系统提示的有序分段及其稳定性标记
+"""
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+
+@dataclass(frozen=True)
+class PromptSegment:
+    """
+    系统提示分段
+
+    stable 为 True 表示内容在多次调用间保持不变（Skill 指令、参考文档、Skill 列表），
+    可以被服务端前缀缓存；False 表示随请求变化
+    """
+    text: str
+    stable: bool = True
+
+
+class SegmentedPrompt(str):
+    """
+    分段的系统提示
+
+    本身就是完整的提示字符串（各分段以换行连接），不认识分段的后端按普通字符串使用；
+    稳定分段总是排在易变分段之前，因此稳定前缀在多次调用间逐字节相同，
+    OpenAI、Ollama 等的自动前缀缓存可以复用。
+    认识分段的后端（如 Anthropic）可以读取 segments，为稳定前缀设置缓存标记。
+    """
+
+    SEPARATOR = "\n"
+
+    segments: Tuple[PromptSegment, ...]
+
+    def __new__(cls, segments: Iterable[PromptSegment]) -> 'SegmentedPrompt':
+        # 稳定分段在前，各组内部保持原有顺序
+        ordered = tuple(sorted(
+            (segment for segment in segments if segment.text),
+            key=lambda segment: not segment.stable
+        ))
+        prompt = super().__new__(cls, cls.SEPARATOR.join(segment.text for segment in ordered))
+        prompt.segments = ordered
+        return prompt
+
+    @property
+    def stable_prefix(self) -> str:
+        """稳定分段组成的前缀"""
+        return self.SEPARATOR.join(segment.text for segment in self.segments if segment.stable)
+
+    @property
+    def volatile_suffix(self) -> str:
+        """易变分段组成的后缀"""
+        return self.SEPARATOR.join(segment.text for segment in self.segments if not segment.stable)
+
+    def __reduce__(self):
+        return (type(self), (self.segments,))
@@ -2,13 +2,106 @@
 Skill 实体 - 单一职责原则
 
 只负责数据存储，业务逻辑由服务层处理
+
+所有实体都使用 __slots__，以便在加载上万个 Skill 时控制每个实体的内存开销
 """
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Generic, TypeVar, Union
+
+from .blob import Blob
+
+T = TypeVar('T')
+
+
+class LazyValue(Generic[T]):
+    """
+    延迟加载值
+
+    首次访问时调用 loader(*args) 从磁盘读取，之后缓存结果。
+    直接保存 loader 和参数而不是 functools.partial，以减少每个实体的内存占用。
+    并发首次访问时 loader 可能被调用多次，因此 loader 必须是幂等的。
+    """
+
+    __slots__ = ('_loader', '_args', '_value')
+
+    _UNSET = object()
+
+    def __init__(self, loader: Callable[..., T], *args: Any):
+        """
+        Args:
+            loader: 加载函数
+            *args: 传给加载函数的参数
+        """
+        self._loader = loader
+        self._args = args
+        self._value = self._UNSET
+
+    @property
+    def loaded(self) -> bool:
+        """是否已加载"""
+        return self._value is not self._UNSET
+
+    def get(self) -> T:
+        """获取值（必要时触发加载）"""
+        # 先取出 loader 和参数再检查值：另一个线程可能在检查之后完成加载并清空 _args，
+        # 此时本线程仍用取出的原参数调用（loader 幂等），而不会以空参数调用
+        loader, args = self._loader, self._args
+        value = self._value
+        if value is self._UNSET:
+            value = loader(*args)
+            self._value = value
+            self._args = ()
+        return value
+
+
+class CachedValue(LazyValue[T]):
+    """
+    经由内容缓存加载的值
+
+    与 LazyValue 不同，结果不保存在实体上，而是交给共享的内容缓存；
+    缓存按字节预算淘汰冷门内容，被淘汰后再次访问会重新调用 loader。
+    cache 只需提供 get_or_load(key, loader, *args) 和 __contains__，
+    本对象自身即缓存键，因此重新加载的 Skill 不会命中旧内容。
+    """
+
+    __slots__ = ('_cache',)
+
+    def __init__(self, cache: Any, loader: Callable[..., T], *args: Any):
+        """
+        Args:
+            cache: 内容缓存
+            loader: 加载函数
+            *args: 传给加载函数的参数
+        """
+        super().__init__(loader, *args)
+        self._cache = cache
+
+    @property
+    def loaded(self) -> bool:
+        """是否在缓存中"""
+        return self in self._cache
+
+    def get(self) -> T:
+        """从缓存获取值（未命中时触发加载）"""
+        return self._cache.get_or_load(self, self._loader, *self._args)
 
 
-@dataclass
+def _resolve(value: Union[T, Blob, LazyValue[T]]) -> T:
+    """解析可能延迟加载或指向共享 Blob 的值"""
+    if isinstance(value, LazyValue):
+        value = value.get()
+    if isinstance(value, Blob):
+        return value.text
+    return value
+
+
+def _is_pending(value: Any) -> bool:
+    """判断值是否仍未加载"""
+    return isinstance(value, LazyValue) and not value.loaded
+
+
+@dataclass(slots=True)
 class SkillMetadata:
     """
     Skill 元数据
@@ -38,45 +131,162 @@ class SkillMetadata:
         }
 
 
-@dataclass
 class SkillScript:
     """
     Skill 脚本实体
 
     遵循单一职责原则 - 只负责脚本元数据
+    content 可以是 LazyValue，首次访问时才读取文件；
+    也可以是共享的 Blob，相同内容的脚本只在内存中保存一份
     """
-    name: str
-    content: str
-    path: Path
-    language: str  # python, bash, javascript, etc.
+
+    __slots__ = ('name', 'path', 'language', '_content')
+
+    def __init__(
+        self,
+        name: str,
+        content: Union[str, Blob, LazyValue],
+        path: Path,
+        language: str  # python, bash, javascript, etc.
+    ):
+        self.name = name
+        self.path = path
+        self.language = language
+        self._content = content
+
+    @property
+    def content(self) -> str:
+        """脚本内容"""
+        return _resolve(self._content)
+
+    @content.setter
+    def content(self, value: Union[str, Blob, LazyValue]) -> None:
+        self._content = value
+
+    @property
+    def is_loaded(self) -> bool:
+        """内容是否已读入内存"""
+        return not _is_pending(self._content)
+
+    def __repr__(self) -> str:
+        return f"SkillScript(name={self.name!r}, path={self.path!r}, language={self.language!r})"
 
 
-@dataclass
 class SkillReference:
     """
     Skill 参考文档实体
 
     遵循单一职责原则 - 只负责参考文档元数据
+    content 可以是 LazyValue，首次访问时才读取文件；
+    也可以是共享的 Blob，相同内容的文档只在内存中保存一份
     """
-    name: str
-    content: str
-    path: Path
+
+    __slots__ = ('name', 'path', '_content')
+
+    def __init__(
+        self,
+        name: str,
+        content: Union[str, Blob, LazyValue],
+        path: Path
+    ):
+        self.name = name
+        self.path = path
+        self._content = content
+
+    @property
+    def content(self) -> str:
+        """文档内容"""
+        return _resolve(self._content)
+
+    @content.setter
+    def content(self, value: Union[str, Blob, LazyValue]) -> None:
+        self._content = value
+
+    @property
+    def is_loaded(self) -> bool:
+        """内容是否已读入内存"""
+        return not _is_pending(self._content)
+
+    def __repr__(self) -> str:
+        return f"SkillReference(name={self.name!r}, path={self.path!r})"
 
 
-@dataclass
 class Skill:
     """
     Skill 实体
 
     遵循单一职责原则 - 只负责数据聚合
     执行逻辑由 SkillExecutor 服务处理
+
+    instructions、scripts、references、assets 均可传入 LazyValue，
+    此时只有元数据常驻内存，正文在首次访问时才从磁盘读取。
     """
-    metadata: SkillMetadata
-    instructions: str
-    path: Path
-    scripts: Dict[str, SkillScript] = field(default_factory=dict)
-    references: Dict[str, SkillReference] = field(default_factory=dict)
-    assets: List[Path] = field(default_factory=list)
+
+    __slots__ = ('metadata', 'path', '_instructions', '_scripts', '_references', '_assets')
+
+    def __init__(
+        self,
+        metadata: SkillMetadata,
+        instructions: Union[str, Blob, LazyValue],
+        path: Path,
+        scripts: Union[Dict[str, SkillScript], LazyValue[Dict[str, SkillScript]], None] = None,
+        references: Union[Dict[str, SkillReference], LazyValue[Dict[str, SkillReference]], None] = None,
+        assets: Union[List[Path], LazyValue[List[Path]], None] = None
+    ):
+        self.metadata = metadata
+        self.path = path
+        self._instructions = instructions
+        self._scripts = scripts if scripts is not None else {}
+        self._references = references if references is not None else {}
+        self._assets = assets if assets is not None else []
+
+    @property
+    def instructions(self) -> str:
+        """SKILL.md 正文"""
+        return _resolve(self._instructions)
+
+    @instructions.setter
+    def instructions(self, value: Union[str, Blob, LazyValue]) -> None:
+        self._instructions = value
+
+    @property
+    def scripts(self) -> Dict[str, SkillScript]:
+        """脚本文件（文件名 -> 脚本）"""
+        return _resolve(self._scripts)
+
+    @scripts.setter
+    def scripts(self, value: Union[Dict[str, SkillScript], LazyValue[Dict[str, SkillScript]]]) -> None:
+        self._scripts = value
+
+    @property
+    def references(self) -> Dict[str, SkillReference]:
+        """参考文档（文件名 -> 文档）"""
+        return _resolve(self._references)
+
+    @references.setter
+    def references(self, value: Union[Dict[str, SkillReference], LazyValue[Dict[str, SkillReference]]]) -> None:
+        self._references = value
+
+    @property
+    def assets(self) -> List[Path]:
+        """资源文件路径"""
+        return _resolve(self._assets)
+
+    @assets.setter
+    def assets(self, value: Union[List[Path], LazyValue[List[Path]]]) -> None:
+        self._assets = value
+
+    @property
+    def is_loaded(self) -> bool:
+        """正文是否已全部读入内存（不会触发加载）"""
+        if any(_is_pending(v) for v in (self._instructions, self._scripts, self._references, self._assets)):
+            return False
+        for group in (self._scripts, self._references):
+            if isinstance(group, LazyValue):
+                group = group.get()
+            if any(not item.is_loaded for item in group.values()):
+                return False
+        return True
 
     @property
     def full_content(self) -> str:
@@ -98,3 +308,6 @@ class Skill:
     def list_script_names(self) -> List[str]:
         """列出所有脚本名称"""
         return list(self.scripts.keys())
+
+    def __repr__(self) -> str:
+        return f"Skill(name={self.metadata.name!r}, path={self.path!r})"
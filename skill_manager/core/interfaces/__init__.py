@@ -1,4 +1,15 @@
 """Interfaces - 接口定义（依赖倒置原则）"""
-from .llm_backend import ILLMBackend, IMessage, IModelConfig
+from .llm_backend import ILLMBackend, IMessage, IModelConfig, GenerationOptions
+from .catalog_cache import ISkillCatalogCache, CatalogEntry
+from .skill_watcher import ISkillWatcher, SkillChangeSet
+from .text_encoder import ITextEncoder
+from .vector_store import IVectorStore
+from .routing_store import IRoutingStore
+from .response_store import IResponseStore
 
-__all__ = ['ILLMBackend', 'IMessage', 'IModelConfig']
+__all__ = [
+    'ILLMBackend', 'IMessage', 'IModelConfig', 'GenerationOptions',
+    'ISkillCatalogCache', 'CatalogEntry',
+    'ISkillWatcher', 'SkillChangeSet',
+    'ITextEncoder', 'IVectorStore', 'IRoutingStore', 'IResponseStore',
+]
@@ -0,0 +1,49 @@
+"""
+Skill 目录索引缓存接口 - 依赖倒置原则
+
+加载服务依赖此抽象，具体存储（SQLite 等）由基础设施层实现
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, List, Dict
+
+from ..entities.skill import SkillMetadata
+
+
+@dataclass
+class CatalogEntry:
+    """
+    目录索引条目
+
+    记录一个 Skill 目录解析后的元数据、文件列表和源文件指纹
+    """
+    skill_dir: str
+    metadata: SkillMetadata
+    # 分组文件列表（scripts / references / assets），路径相对于 skill_dir
+    files: Dict[str, List[str]] = field(default_factory=dict)
+    # 相对路径 -> (mtime_ns, size, inode)；文件不存在时为 None
+    fingerprints: Dict[str, Optional[tuple]] = field(default_factory=dict)
+
+
+class ISkillCatalogCache(ABC):
+    """
+    Skill 目录索引缓存接口
+
+    遵循接口隔离原则 - 只定义读写条目所需的方法
+    """
+
+    @abstractmethod
+    def get(self, skill_dir: Path) -> Optional[CatalogEntry]:
+        """获取 Skill 目录对应的缓存条目"""
+        pass
+
+    @abstractmethod
+    def put(self, entry: CatalogEntry) -> None:
+        """写入缓存条目"""
+        pass
+
+    @abstractmethod
+    def remove(self, skill_dir: Path) -> None:
+        """删除缓存条目"""
+        pass
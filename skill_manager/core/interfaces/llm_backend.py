@@ -3,9 +3,13 @@ LLM 后端接口 - 依赖倒置原则
 
 高层模块（服务层）依赖这些抽象接口，而非具体实现
 """
+import asyncio
+import inspect
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterator
 
 
 @dataclass
@@ -25,6 +29,57 @@ class IModelConfig:
     temperature: Optional[float] = None
 
 
+@dataclass
+class GenerationOptions:
+    """
+    单次调用的生成参数
+
+    未设置的字段使用后端自身的默认值。
+    choices 把输出限制为若干候选之一：支持结构化输出的后端会以
+    {"answer": "<候选>"} 的 JSON 返回，用 choice() 解析；
+    json_schema 则直接约束输出的 JSON 结构（两者同时设置时 choices 优先）。
+    """
+    max_tokens: Optional[int] = None
+    temperature: Optional[float] = None
+    stop: Optional[List[str]] = None
+    json_schema: Optional[Dict[str, Any]] = None
+    choices: Optional[List[str]] = None
+
+    def response_schema(self) -> Optional[Dict[str, Any]]:
+        """需要约束输出时返回 JSON Schema"""
+        if self.choices:
+            return {
+                "type": "object",
+                "properties": {"answer": {"type": "string", "enum": list(self.choices)}},
+                "required": ["answer"],
+                "additionalProperties": False,
+            }
+        return self.json_schema
+
+    def choice(self, response: str) -> Optional[str]:
+        """
+        从响应中解析候选
+
+        兼容结构化输出（{"answer": ...} 或 JSON 字符串）和不支持约束输出的后端返回的纯文本；
+        不区分大小写，返回 choices 中的原始写法，不在候选中时返回 None
+        """
+        answer = response.strip()
+        try:
+            data = json.loads(answer)
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            data = data.get("answer")
+        if isinstance(data, str):
+            answer = data
+
+        answer = answer.strip().strip('"\'`').strip().lower()
+        for choice in self.choices or ():
+            if choice.lower() == answer:
+                return choice
+        return None
+
+
 class ILLMBackend(ABC):
     """
     LLM 后端抽象接口
@@ -38,7 +93,8 @@ class ILLMBackend(ABC):
         self,
         messages: List[IMessage],
         system_prompt: Optional[str] = None,
-        tools: Optional[List[Dict[str, Any]]] = None
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
     ) -> str:
         """
         发送消息并获取响应
@@ -47,12 +103,43 @@ class ILLMBackend(ABC):
             messages: 消息列表
             system_prompt: 系统提示
             tools: 函数调用工具列表
+            options: 本次调用的生成参数（可选）
 
         Returns:
             LLM 响应文本
         """
         pass
 
+    def complete_stream(
+        self,
+        messages: List[IMessage],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> Iterator[str]:
+        """
+        流式发送消息，逐段返回生成的文本
+
+        默认实现调用 complete 并一次性返回完整响应；支持流式接口的后端应覆盖此方法，
+        使首个 token 到达即可开始显示
+        """
+        yield complete(self, messages, system_prompt, tools, options)
+
+    async def acomplete(
+        self,
+        messages: List[IMessage],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> str:
+        """
+        complete 的异步版本
+
+        默认实现在线程池中运行 complete；使用原生异步客户端的后端应覆盖此方法，
+        这样一个事件循环即可同时等待大量请求，而不必为每个请求占用一个线程
+        """
+        return await asyncio.to_thread(complete, self, messages, system_prompt, tools, options)
+
     @abstractmethod
     def get_model_name(self) -> str:
         """获取当前模型名称"""
@@ -67,3 +154,58 @@ class ILLMBackend(ABC):
             config: 模型配置
         """
         pass
+
+
+def complete(
+    backend: ILLMBackend,
+    messages: List[Dict[str, Any]],
+    system_prompt: Optional[str] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    options: Optional[GenerationOptions] = None
+) -> str:
+    """
+    调用后端，兼容尚未支持 options 参数的自定义后端
+
+    后端的 complete 不接受 options 时忽略生成参数，按旧签名调用
+    """
+    if options is not None and _accepts_options(type(backend), 'complete'):
+        return backend.complete(messages, system_prompt=system_prompt, tools=tools, options=options)
+    return backend.complete(messages, system_prompt=system_prompt, tools=tools)
+
+
+@lru_cache(maxsize=None)
+def _accepts_options(backend_type: type, method: str) -> bool:
+    """后端的 complete / acomplete / complete_stream 是否接受 options 参数"""
+    try:
+        parameters = inspect.signature(getattr(backend_type, method)).parameters
+    except (TypeError, ValueError):
+        return False
+    return 'options' in parameters or any(
+        parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()
+    )
+
+
+async def acomplete(
+    backend: ILLMBackend,
+    messages: List[Dict[str, Any]],
+    system_prompt: Optional[str] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    options: Optional[GenerationOptions] = None
+) -> str:
+    """complete() 的异步版本，同样兼容不接受 options 参数的自定义后端"""
+    if options is not None and _accepts_options(type(backend), 'acomplete'):
+        return await backend.acomplete(messages, system_prompt=system_prompt, tools=tools, options=options)
+    return await backend.acomplete(messages, system_prompt=system_prompt, tools=tools)
+
+
+def complete_stream(
+    backend: ILLMBackend,
+    messages: List[Dict[str, Any]],
+    system_prompt: Optional[str] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    options: Optional[GenerationOptions] = None
+) -> Iterator[str]:
+    """complete() 的流式版本，同样兼容不接受 options 参数的自定义后端"""
+    if options is not None and _accepts_options(type(backend), 'complete_stream'):
+        return backend.complete_stream(messages, system_prompt=system_prompt, tools=tools, options=options)
+    return backend.complete_stream(messages, system_prompt=system_prompt, tools=tools)
@@ -0,0 +1,33 @@
+"""
+LLM 响应存储接口 - 依赖倒置原则
+
+响应缓存依赖此抽象，持久化存储（SQLite 等）由基础设施层实现
+"""
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class IResponseStore(ABC):
+    """
+    LLM 响应存储接口
+
+    键为请求内容（模型、系统提示、消息、tools、生成参数）的摘要，
+    值为响应文本和过期时间（Unix 时间戳）
+
+    遵循接口隔离原则 - 只定义读写响应所需的方法
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """获取 (响应文本, 过期时间)；不存在时返回 None"""
+        pass
+
+    @abstractmethod
+    def put(self, key: str, response: str, expires_at: float) -> None:
+        """写入响应"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """清空所有响应"""
+        pass
@@ -0,0 +1,33 @@
+"""
+路由决策存储接口 - 依赖倒置原则
+
+路由缓存依赖此抽象，持久化存储（SQLite 等）由基础设施层实现
+"""
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class IRoutingStore(ABC):
+    """
+    路由决策存储接口
+
+    键为规范化后的用户输入加目录指纹，值为选中的 Skill 名称（None 表示无匹配）
+    和过期时间（Unix 时间戳）
+
+    遵循接口隔离原则 - 只定义读写决策所需的方法
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[Optional[str], float]]:
+        """获取 (Skill 名称, 过期时间)；不存在时返回 None"""
+        pass
+
+    @abstractmethod
+    def put(self, key: str, skill_name: Optional[str], expires_at: float) -> None:
+        """写入路由决策"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """清空所有决策"""
+        pass
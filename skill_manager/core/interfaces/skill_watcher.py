@@ -0,0 +1,50 @@
+"""
+Skill 目录监听接口 - 依赖倒置原则
+
+外观类依赖此抽象检测 Skill 变化，具体实现（inotify、轮询）位于基础设施层
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+
+@dataclass
+class SkillChangeSet:
+    """
+    Skill 目录变化集合
+
+    每一项都是 Skill 目录（包含 SKILL.md 的目录）
+    """
+    added: List[Path] = field(default_factory=list)
+    modified: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+class ISkillWatcher(ABC):
+    """
+    Skill 目录监听器接口
+
+    遵循接口隔离原则 - 只暴露轮询变化和关闭两个操作
+    """
+
+    @abstractmethod
+    def poll(self, timeout: float = 0.0) -> SkillChangeSet:
+        """
+        等待并返回自上次调用以来发生变化的 Skill 目录
+
+        Args:
+            timeout: 最长等待秒数
+
+        Returns:
+            变化集合（无变化时为空）
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """停止监听并释放资源，同时唤醒阻塞中的 poll"""
+        pass
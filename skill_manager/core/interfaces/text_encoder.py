@@ -0,0 +1,43 @@
+"""
+文本编码器接口 - 依赖倒置原则
+
+向量匹配服务依赖此抽象，具体编码方式（哈希向量、嵌入模型等）可自由替换
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Sequence
+
+
+class ITextEncoder(ABC):
+    """
+    文本编码器接口
+
+    遵循接口隔离原则 - 只定义编码所需的方法
+    """
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """向量维度"""
+        pass
+
+    @abstractmethod
+    def encode(self, texts: Sequence[str]) -> Any:
+        """
+        编码文本
+
+        Args:
+            texts: 文本列表
+
+        Returns:
+            形状为 (len(texts), dimension) 的 float32 numpy 矩阵，每行已 L2 归一化
+        """
+        pass
+
+    @property
+    def signature(self) -> str:
+        """
+        编码器签名
+
+        持久化的向量只在签名一致时复用；编码规则或参数变化时签名也应变化
+        """
+        return f"{type(self).__name__}:{self.dimension}"
@@ -0,0 +1,39 @@
+"""
+向量存储接口 - 依赖倒置原则
+
+向量匹配服务依赖此抽象，具体存储（内存映射 .npy 等）由基础设施层实现
+"""
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Tuple
+
+
+class IVectorStore(ABC):
+    """
+    向量矩阵存储接口
+
+    每行向量对应一个键（包含 Skill 名称和文本摘要），
+    内容未变化的行可以在重新编码时直接复用
+    """
+
+    @abstractmethod
+    def load(self, signature: str) -> Optional[Tuple[List[str], Any]]:
+        """
+        读取向量矩阵
+
+        Args:
+            signature: 编码器签名
+
+        Returns:
+            (行键列表, 矩阵)；不存在或签名不一致时返回 None
+        """
+        pass
+
+    @abstractmethod
+    def save(self, signature: str, keys: List[str], matrix: Any) -> Any:
+        """
+        保存向量矩阵
+
+        Returns:
+            保存后应使用的矩阵（可能是只读的内存映射）
+        """
+        pass
@@ -1,12 +1,33 @@
 """Services - 领域服务（单一职责原则）"""
 from .skill_loader import ISkillLoader, FilesystemSkillLoader
-from .skill_matcher import ISkillMatcher, SemanticSkillMatcher
+from .archive_skill_loader import ArchiveSkillLoader, StaleSkillError
+from .skill_discovery import SkillDiscovery, SkillManifest
+from .blob_store import BlobStore
+from .frontmatter import FrontmatterParser
+from .content_cache import ContentCache
+from .ttl_cache import TTLCache
+from .skill_matcher import ISkillMatcher, SemanticSkillMatcher, IndexedSkillMatcher, ExactSkillMatcher
+from .bm25_index import BM25Index
+from .hashing_encoder import HashingTextEncoder
+from .embedding_matcher import EmbeddingSkillMatcher
+from .skill_taxonomy import SkillCategory, build_categories
+from .hierarchical_matcher import HierarchicalSkillMatcher
+from .routing_cache import CachingSkillMatcher, normalize_query
+from .response_cache import CachingLLMBackend, response_cache_key
+from .reference_index import ReferenceIndex, ReferenceChunk, chunk_markdown
 from .prompt_builder import IPromptBuilder, SystemPromptBuilder
 from .skill_executor import ISkillExecutor, SkillExecutor
 
 __all__ = [
-    'ISkillLoader', 'FilesystemSkillLoader',
-    'ISkillMatcher', 'SemanticSkillMatcher',
+    'ISkillLoader', 'FilesystemSkillLoader', 'ArchiveSkillLoader', 'StaleSkillError',
+    'SkillDiscovery', 'SkillManifest', 'BlobStore', 'FrontmatterParser',
+    'ContentCache', 'TTLCache',
+    'ISkillMatcher', 'SemanticSkillMatcher', 'IndexedSkillMatcher', 'BM25Index',
+    'ExactSkillMatcher', 'EmbeddingSkillMatcher', 'HashingTextEncoder',
+    'CachingSkillMatcher', 'normalize_query',
+    'CachingLLMBackend', 'response_cache_key',
+    'HierarchicalSkillMatcher', 'SkillCategory', 'build_categories',
+    'ReferenceIndex', 'ReferenceChunk', 'chunk_markdown',
     'IPromptBuilder', 'SystemPromptBuilder',
     'ISkillExecutor', 'SkillExecutor',
 ]
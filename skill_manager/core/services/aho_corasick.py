@@ -0,0 +1,116 @@
+"""
+Aho–Corasick 多模式匹配服务 - 单一职责原则
+
+只负责把大量关键词编译为自动机，并在一次扫描中找出文本里出现的所有关键词
+"""
+from typing import Dict, Generic, Iterator, List, Tuple, TypeVar
+
+V = TypeVar('V')
+
+
+class AhoCorasick(Generic[V]):
+    """
+    Aho–Corasick 自动机
+
+    add() 添加模式后调用 build() 编译失败指针；
+    匹配时间与文本长度加命中次数成正比，与模式数量无关。
+    word_boundary=True 时，模式两端的 ASCII 字母数字不能与文本中相邻的
+    ASCII 字母数字相连（中文等其他字符不受影响）。
+    """
+
+    def __init__(self, word_boundary: bool = False):
+        """
+        Args:
+            word_boundary: 是否要求英文单词边界
+        """
+        self.word_boundary = word_boundary
+        # 状态转移表：状态 -> {字符: 下一状态}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 状态 -> 以该状态结尾的 (模式, 值) 列表
+        self._own: List[List[Tuple[str, V]]] = [[]]
+        # 状态 -> 包含失败链上所有输出的列表（build 时计算）
+        self._output: List[List[Tuple[str, V]]] = [[]]
+        self._built = True
+
+    def add(self, pattern: str, value: V) -> None:
+        """添加模式（空模式忽略）"""
+        if not pattern:
+            return
+
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._own.append([])
+            state = next_state
+        self._own[state].append((pattern, value))
+        self._built = False
+
+    def build(self) -> None:
+        """按广度优先顺序计算失败指针"""
+        self._output = [list(own) for own in self._own]
+        queue = list(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[next_state] = target
+                self._output[next_state].extend(self._output[target])
+
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str, V]]:
+        """
+        扫描文本
+
+        Yields:
+            (起始位置, 模式, 值)
+        """
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for index, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern, value in output[state]:
+                start = index - len(pattern) + 1
+                if self.word_boundary and not self._at_boundary(text, start, index + 1, pattern):
+                    continue
+                yield start, pattern, value
+
+    def __len__(self) -> int:
+        """状态数量"""
+        return len(self._goto)
+
+    @staticmethod
+    def _at_boundary(text: str, start: int, end: int, pattern: str) -> bool:
+        """模式两端的英文字母数字是否与相邻字符断开"""
+        if _is_ascii_word(pattern[0]) and start > 0 and _is_ascii_word(text[start - 1]):
+            return False
+        if _is_ascii_word(pattern[-1]) and end < len(text) and _is_ascii_word(text[end]):
+            return False
+        return True
+
+
+def _is_ascii_word(ch: str) -> bool:
+    """是否为 ASCII 字母、数字或下划线"""
+    return ch.isascii() and (ch.isalnum() or ch == '_')
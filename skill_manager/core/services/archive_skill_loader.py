@@ -0,0 +1,184 @@
+"""
+归档 Skill 加载服务 - 单一职责原则
+
+只负责从打包好的 .skill 归档（zip 格式）加载 Skill，无需解压
+"""
+import os
+import threading
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..entities.skill import Skill, SkillMetadata, SkillScript, SkillReference, LazyValue
+from .skill_loader import ISkillLoader, FilesystemSkillLoader
+
+
+class StaleSkillError(RuntimeError):
+    """归档在 Skill 加载之后被替换或删除，延迟内容已无法按原版本读取（需重新加载 Skill）"""
+
+
+class ArchiveSkillLoader(ISkillLoader):
+    """
+    .skill 归档加载器
+
+    每个归档只读取一次中央目录，启动时只解析 SKILL.md 成员；
+    脚本和参考文档在首次访问时才从归档中流式读取。
+    归档文件句柄按 (路径, mtime_ns, size) 缓存：归档被替换后重新打开并关闭旧句柄。
+    调用 close() 释放所有句柄；之后首次访问尚未读取的脚本和参考文档时会重新打开归档，
+    但 path / assets 中的 zipfile.Path 依赖原句柄，close() 后不能再用于读取。
+    延迟内容记录了加载时归档的签名：归档已被替换或删除时抛出 StaleSkillError，
+    不会把新版本的内容混入按旧版本加载的 Skill。
+
+    遵循单一职责原则 - 只负责从归档加载
+    """
+
+    ARCHIVE_SUFFIX = ".skill"
+
+    def __init__(self):
+        # 复用文件系统加载器的 frontmatter 解析与校验逻辑
+        self._parser = FilesystemSkillLoader()
+        # 归档绝对路径 -> ((mtime_ns, size), 句柄)
+        self._archives: Dict[str, Tuple[tuple, zipfile.ZipFile]] = {}
+        self._lock = threading.Lock()
+
+    def parse_skill_metadata(self, skill_md_path: Path) -> tuple[SkillMetadata, str]:
+        """解析归档中的 SKILL.md（skill_md_path 为 .skill 归档路径）"""
+        _, archive = self._open(Path(skill_md_path))
+        prefix = self._find_root(archive)
+        return self._parse_skill_md(archive, prefix)
+
+    def load_skill(self, skill_dir: Path) -> Skill:
+        """加载单个 .skill 归档"""
+        archive_path = Path(skill_dir)
+        signature, archive = self._open(archive_path)
+        prefix = self._find_root(archive)
+        metadata, instructions = self._parse_skill_md(archive, prefix)
+
+        scripts: Dict[str, SkillScript] = {}
+        references: Dict[str, SkillReference] = {}
+        root_references: Dict[str, SkillReference] = {}
+        assets: List[Path] = []
+
+        for info in archive.infolist():
+            if info.is_dir() or not info.filename.startswith(prefix):
+                continue
+            parts = info.filename[len(prefix):].split("/")
+            member = zipfile.Path(archive, at=info.filename)
+
+            if len(parts) == 2 and parts[0] == "scripts":
+                scripts[member.name] = SkillScript(
+                    name=member.stem,
+                    content=self._member_content(archive_path, signature, info.filename),
+                    path=member,
+                    language=FilesystemSkillLoader.LANGUAGE_MAP.get(member.suffix.lower(), 'unknown')
+                )
+            elif len(parts) == 2 and parts[0] == "references" and member.suffix.lower() == ".md":
+                references[member.name] = SkillReference(
+                    name=member.stem,
+                    content=self._member_content(archive_path, signature, info.filename),
+                    path=member
+                )
+            elif len(parts) == 2 and parts[0] == "assets":
+                assets.append(member)
+            elif len(parts) == 1 and member.suffix.lower() == ".md" and member.name != "SKILL.md":
+                root_references[member.name] = SkillReference(
+                    name=member.stem,
+                    content=self._member_content(archive_path, signature, info.filename),
+                    path=member
+                )
+
+        # references 目录优先于根目录同名文件
+        for name, ref in root_references.items():
+            references.setdefault(name, ref)
+
+        return Skill(
+            metadata=metadata,
+            instructions=instructions,
+            path=archive_path,
+            scripts=scripts,
+            references=references,
+            assets=assets
+        )
+
+    def load_skills_from_directory(self, base_dir: Path) -> List[Skill]:
+        """从目录加载所有 .skill 归档"""
+        loaded = []
+
+        for item in sorted(Path(base_dir).iterdir()):
+            if item.is_file() and item.suffix == self.ARCHIVE_SUFFIX:
+                try:
+                    loaded.append(self.load_skill(item))
+                except Exception as e:
+                    print(f"Warning: Failed to load skill from {item}: {e}")
+
+        return loaded
+
+    def close(self) -> None:
+        """关闭所有已打开的归档"""
+        with self._lock:
+            for _, archive in self._archives.values():
+                archive.close()
+            self._archives.clear()
+
+    def _open(self, archive_path: Path) -> Tuple[tuple, zipfile.ZipFile]:
+        """打开归档（未变化的归档只读取一次中央目录），返回 ((mtime_ns, size), 句柄)"""
+        with self._lock:
+            return self._open_locked(archive_path)
+
+    def _open_locked(self, archive_path: Path) -> Tuple[tuple, zipfile.ZipFile]:
+        """打开归档（调用方持有锁）；归档已被替换时关闭旧句柄"""
+        key = str(archive_path.resolve())
+        st = os.stat(key)
+        signature = (st.st_mtime_ns, st.st_size)
+
+        cached = self._archives.get(key)
+        if cached is not None:
+            if cached[0] == signature:
+                return cached
+            cached[1].close()
+
+        self._archives[key] = (signature, zipfile.ZipFile(key))
+        return self._archives[key]
+
+    def _find_root(self, archive: zipfile.ZipFile) -> str:
+        """找到 SKILL.md 所在的目录前缀（如 "pdf/"，位于归档根部时为 ""）"""
+        candidates = [
+            name for name in archive.namelist()
+            if name == "SKILL.md" or name.endswith("/SKILL.md")
+        ]
+        if not candidates:
+            raise FileNotFoundError(f"SKILL.md not found in {archive.filename}")
+
+        skill_md = min(candidates, key=lambda name: name.count("/"))
+        return skill_md[:-len("SKILL.md")]
+
+    def _parse_skill_md(self, archive: zipfile.ZipFile, prefix: str) -> tuple[SkillMetadata, str]:
+        """解析归档中的 SKILL.md 成员"""
+        content = self._read_member(archive, prefix + "SKILL.md")
+        return self._parser._parse_content(content)
+
+    def _member_content(self, archive_path: Path, signature: tuple, name: str) -> LazyValue:
+        """延迟读取归档成员（signature 为加载 Skill 时归档的签名）"""
+        return LazyValue(self._read_archive_member, archive_path, signature, name)
+
+    def _read_archive_member(self, archive_path: Path, signature: tuple, name: str) -> str:
+        """
+        按路径读取归档成员（句柄已关闭时重新打开）
+
+        Raises:
+            StaleSkillError: 归档在加载 Skill 之后被替换或删除
+        """
+        with self._lock:
+            try:
+                current, archive = self._open_locked(archive_path)
+            except OSError as e:
+                raise StaleSkillError(f"Archive {archive_path} is no longer readable; reload the skill") from e
+            if current != signature:
+                raise StaleSkillError(f"Archive {archive_path} changed after the skill was loaded; reload the skill")
+            return self._read_member(archive, name)
+
+    @staticmethod
+    def _read_member(archive: zipfile.ZipFile, name: str) -> str:
+        """读取归档成员文本（统一换行符，与 Path.read_text 行为一致）"""
+        text = archive.read(name).decode("utf-8")
+        return text.replace("\r\n", "\n").replace("\r", "\n")
@@ -0,0 +1,56 @@
+"""
+内容寻址存储服务 - 单一职责原则
+
+只负责按内容摘要对文本去重，不关心文本来源
+"""
+import hashlib
+import threading
+import weakref
+from typing import Optional
+
+from ..entities.blob import Blob
+
+
+class BlobStore:
+    """
+    内容寻址的 Blob 存储
+
+    以内容哈希为键，相同内容只保留一份；
+    存储只持有弱引用，不再被任何 Skill 引用的 Blob 会被自动回收
+    """
+
+    def __init__(self):
+        self._blobs: "weakref.WeakValueDictionary[bytes, Blob]" = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest_of(text: str) -> bytes:
+        """计算文本摘要"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+    def put(self, text: str) -> Blob:
+        """存入文本，返回共享的 Blob（内容已存在时返回已有实例）"""
+        digest = self.digest_of(text)
+        with self._lock:
+            blob = self._blobs.get(digest)
+            if blob is not None:
+                self.hits += 1
+                return blob
+            blob = Blob(digest, text)
+            self._blobs[digest] = blob
+            self.misses += 1
+            return blob
+
+    def get(self, digest: bytes) -> Optional[Blob]:
+        """按摘要获取 Blob"""
+        return self._blobs.get(digest)
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    @property
+    def total_chars(self) -> int:
+        """当前存储的去重后字符总数"""
+        return sum(len(blob) for blob in list(self._blobs.values()))
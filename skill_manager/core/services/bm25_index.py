@@ -0,0 +1,163 @@
+"""
+BM25 倒排索引服务 - 单一职责原则
+
+只负责文本分词、建立倒排索引和 BM25 打分，不关心文档来源
+"""
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+# 中日韩统一表意文字、平假名/片假名、韩文音节
+CJK_RANGES = (
+    '\u3040-\u30ff'
+    '\u3400-\u4dbf'
+    '\u4e00-\u9fff'
+    '\uac00-\ud7af'
+    '\uf900-\ufaff'
+)
+
+TOKEN_PATTERN = re.compile(rf'[{CJK_RANGES}]+|[^\W_{CJK_RANGES}]+')
+CJK_PATTERN = re.compile(rf'[{CJK_RANGES}]')
+
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'into',
+    'is', 'it', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'with',
+})
+
+
+def normalize_text(text: str) -> str:
+    """NFKC 规范化并做大小写折叠（全角字母数字转为半角）"""
+    return unicodedata.normalize('NFKC', text).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    分词
+
+    拉丁字母和数字按单词切分并去掉常见停用词；
+    中日韩文字没有空格分词，按相邻字符二元组（bigram）切分，单字成词时保留单字
+    """
+    tokens = []
+    for run in TOKEN_PATTERN.findall(normalize_text(text)):
+        if CJK_PATTERN.match(run):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        elif run not in STOPWORDS:
+            tokens.append(run)
+    return tokens
+
+
+class BM25Index:
+    """
+    BM25 倒排索引
+
+    支持增量添加和删除文档；IDF 和平均文档长度在查询时根据当前统计量计算，
+    因此单个文档的变更不需要重建整个索引
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Args:
+            k1: 词频饱和参数
+            b: 文档长度归一化参数
+        """
+        self.k1 = k1
+        self.b = b
+        # 词 -> {文档键: 词频}
+        self._postings: Dict[str, Dict[Hashable, int]] = {}
+        # 文档键 -> 词频统计
+        self._docs: Dict[Hashable, Counter] = {}
+        # 文档键 -> 文档长度（词数）
+        self._lengths: Dict[Hashable, int] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def add(self, key: Hashable, tokens: Iterable[str]) -> None:
+        """添加或替换文档"""
+        counts = Counter(tokens)
+        with self._lock:
+            self._remove_locked(key)
+            length = sum(counts.values())
+            self._docs[key] = counts
+            self._lengths[key] = length
+            self._total_length += length
+            for token, tf in counts.items():
+                self._postings.setdefault(token, {})[key] = tf
+
+    def remove(self, key: Hashable) -> None:
+        """删除文档"""
+        with self._lock:
+            self._remove_locked(key)
+
+    def reference_score(self, tokens: Iterable[str]) -> float:
+        """
+        查询的参照分数：一个平均长度、每个已索引查询词恰好出现一次的文档的 BM25 分数
+        （即已索引查询词的 IDF 之和）
+
+        BM25 原始分数的量级随目录规模和查询长度变化，除以参照分数后可用固定阈值比较
+        """
+        query = Counter(tokens)
+        with self._lock:
+            n = len(self._docs)
+            total = 0.0
+            for token, qtf in query.items():
+                df = len(self._postings.get(token, ()))
+                total += math.log(1 + (n - df + 0.5) / (df + 0.5)) * qtf
+        return total
+
+    def search(self, tokens: Iterable[str], limit: int = 10) -> List[Tuple[Hashable, float]]:
+        """
+        按 BM25 分数检索
+
+        Returns:
+            (文档键, 分数) 列表，按分数降序，只包含分数大于 0 的文档
+        """
+        query = Counter(tokens)
+        scores: Dict[Hashable, float] = {}
+        with self._lock:
+            n = len(self._docs)
+            if not n or not query:
+                return []
+            avg_length = self._total_length / n or 1.0
+            for token, qtf in query.items():
+                postings = self._postings.get(token)
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                for key, tf in postings.items():
+                    length = self._lengths[key]
+                    norm = tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / avg_length))
+                    scores[key] = scores.get(key, 0.0) + idf * norm * qtf
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._docs
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def keys(self) -> List[Hashable]:
+        """所有文档键"""
+        with self._lock:
+            return list(self._docs)
+
+    def _remove_locked(self, key: Hashable) -> None:
+        """删除文档（调用方持有锁）"""
+        counts = self._docs.pop(key, None)
+        if counts is None:
+            return
+        self._total_length -= self._lengths.pop(key)
+        for token in counts:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[token]
@@ -0,0 +1,138 @@
+"""
+内容缓存服务 - 单一职责原则
+
+只负责在字节预算内缓存 Skill 正文和参考文档，不关心内容来源
+"""
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from ..entities.blob import Blob
+
+
+class ContentCache:
+    """
+    按字节预算淘汰的 LRU 内容缓存
+
+    热门 Skill 的 instructions 和 references 常驻内存，
+    超出预算时淘汰最久未访问的条目，下次访问时重新从磁盘读取。
+    compress=True 时条目以 zlib 压缩形式保存，用 CPU 换内存。
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, compress: bool = False, level: int = 6):
+        """
+        Args:
+            max_bytes: 缓存内容的字节预算
+            compress: 是否在内存中压缩保存
+            level: zlib 压缩级别
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.level = level
+        # 键 -> (值, 占用字节数)；值为原始内容或压缩后的 bytes
+        self._entries: "OrderedDict[Hashable, tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """获取缓存内容；未命中返回 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            stored = entry[0]
+
+        return self._decode(stored)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """写入内容，必要时淘汰最久未访问的条目"""
+        stored = self._encode(value)
+        size = self._sizeof(stored)
+        if size > self.max_bytes:
+            # 单个条目超出预算时不缓存
+            self.discard(key)
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._entries[key] = (stored, size)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[..., Any], *args: Any) -> Any:
+        """获取缓存内容，未命中时调用 loader(*args) 加载并写入缓存"""
+        value = self.get(key)
+        if value is None:
+            value = loader(*args)
+            self.put(key, value)
+        return value
+
+    def discard(self, key: Hashable) -> None:
+        """移除条目"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= entry[1]
+
+    def clear(self) -> None:
+        """清空缓存（计数器保留）"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """缓存统计信息"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / total if total else 0.0,
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _encode(self, value: Any) -> Any:
+        """压缩模式下把文本编码为 zlib bytes"""
+        if not self.compress:
+            return value
+        text = value.text if isinstance(value, Blob) else value
+        return zlib.compress(text.encode('utf-8'), self.level)
+
+    def _decode(self, stored: Any) -> Any:
+        """压缩模式下解压为文本"""
+        if not self.compress:
+            return stored
+        return zlib.decompress(stored).decode('utf-8')
+
+    @staticmethod
+    def _sizeof(stored: Any) -> int:
+        """估算条目占用的内存字节数"""
+        if isinstance(stored, Blob):
+            return sys.getsizeof(stored.text)
+        return sys.getsizeof(stored)
@@ -0,0 +1,203 @@
+"""
+向量匹配服务 - 单一职责原则
+
+只负责用向量相似度为 Skill 打分，编码方式和向量存储通过接口注入
+"""
+import hashlib
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+from ..entities.skill import Skill
+from ..entities.catalog import CatalogSnapshot, root_catalog
+from ..interfaces.llm_backend import ILLMBackend
+from ..interfaces.text_encoder import ITextEncoder
+from ..interfaces.vector_store import IVectorStore
+from .skill_matcher import ISkillMatcher
+from .hashing_encoder import HashingTextEncoder
+
+try:
+    import numpy as np
+except ImportError:  # numpy 为可选依赖
+    np = None
+
+
+class EmbeddingSkillMatcher(ISkillMatcher):
+    """
+    向量相似度匹配器
+
+    Skill 的名称和描述只编码一次，组成 (Skill 数, 维度) 的矩阵；
+    每个查询只需一次矩阵-向量乘法即可得到所有 Skill 的余弦相似度，
+    多个查询可以合并为一次矩阵乘法。
+
+    提供 store 时矩阵会持久化（如内存映射 .npy），内容未变化的 Skill
+    在重新加载时直接复用已有的向量，多个工作进程共享同一份映射。
+
+    遵循单一职责原则 - 只负责向量打分
+    """
+
+    def __init__(
+        self,
+        encoder: Optional[ITextEncoder] = None,
+        store: Optional[IVectorStore] = None,
+        min_score: float = 0.2
+    ):
+        """
+        Args:
+            encoder: 文本编码器（默认 HashingTextEncoder，无需网络）
+            store: 向量存储（可选，默认只保存在内存中）
+            min_score: 最低余弦相似度，低于该值视为不匹配
+        """
+        if np is None:
+            raise ImportError("请安装 numpy: pip install numpy")
+
+        self.encoder = encoder or HashingTextEncoder()
+        self.store = store
+        self.min_score = min_score
+        # (行键, 行号 -> Skill, 矩阵)，整体替换以保证并发读取一致
+        self._state: Tuple[List[str], List[Skill], "np.ndarray"] = (
+            [], [], np.zeros((0, self.encoder.dimension), dtype=np.float32)
+        )
+        self._synced: Optional[CatalogSnapshot] = None
+        self._sync_lock = threading.Lock()
+
+    def match(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend
+    ) -> Optional[Skill]:
+        """返回相似度最高的 Skill"""
+        ranked = self.rank(user_input, skills, limit=1)
+        if ranked and ranked[0][1] >= self.min_score:
+            return ranked[0][0]
+        return None
+
+    def match_topk(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend,
+        k: int = 5
+    ) -> List[Tuple[Skill, float]]:
+        """返回相似度最高的 k 个候选（低于 min_score 的不返回）"""
+        return [(skill, score) for skill, score in self.rank(user_input, skills, k) if score >= self.min_score]
+
+    def match_batch(
+        self,
+        user_inputs: Sequence[str],
+        skills: List[Skill],
+        backend: ILLMBackend
+    ) -> List[Optional[Skill]]:
+        """批量匹配：一次矩阵乘法为所有请求打分"""
+        return [
+            ranked[0][0] if ranked and ranked[0][1] >= self.min_score else None
+            for ranked in self.rank_batch(user_inputs, skills, limit=1)
+        ]
+
+    def rank(
+        self,
+        user_input: str,
+        skills: Sequence[Skill],
+        limit: int = 5
+    ) -> List[tuple[Skill, float]]:
+        """按余弦相似度排序候选 Skill"""
+        return self.rank_batch([user_input], skills, limit)[0]
+
+    def rank_batch(
+        self,
+        user_inputs: Sequence[str],
+        skills: Sequence[Skill],
+        limit: int = 5
+    ) -> List[List[tuple[Skill, float]]]:
+        """
+        批量排序：所有查询一起编码，一次矩阵乘法完成打分
+
+        Returns:
+            与 user_inputs 一一对应的 (Skill, 相似度) 列表
+        """
+        # 子集快照（如类别）在完整目录的向量矩阵上打分后屏蔽非成员，避免为每个子集重建矩阵
+        universe = root_catalog(skills)
+        _, rows, matrix = self.sync(universe)
+        if not rows or not user_inputs:
+            return [[] for _ in user_inputs]
+
+        queries = self.encoder.encode(list(user_inputs))
+        # (Skill 数, 查询数)
+        scores = matrix @ queries.T
+        k = min(limit, len(rows))
+        if universe is not skills:
+            members = np.fromiter((row.metadata.name in skills for row in rows), dtype=bool, count=len(rows))
+            scores[~members] = -np.inf
+            k = min(limit, int(members.sum()))
+            if k == 0:
+                return [[] for _ in user_inputs]
+
+        results = []
+        for column in scores.T:
+            top = np.argpartition(-column, k - 1)[:k]
+            top = top[np.argsort(-column[top], kind='stable')]
+            results.append([(rows[i], float(column[i])) for i in top])
+        return results
+
+    def sync(self, skills: Sequence[Skill]) -> Tuple[List[str], List[Skill], "np.ndarray"]:
+        """使向量矩阵与 Skill 集合一致（只编码新增或内容变化的 Skill）"""
+        if skills is self._synced:
+            return self._state
+
+        with self._sync_lock:
+            if skills is self._synced:
+                return self._state
+
+            keys, _, matrix = self._state
+            skills = list(skills) if not isinstance(skills, CatalogSnapshot) else skills
+            texts = [self._skill_text(skill) for skill in skills]
+            new_keys = [self._row_key(skill, text) for skill, text in zip(skills, texts)]
+
+            if new_keys != keys:
+                if not keys and self.store is not None:
+                    stored = self.store.load(self.encoder.signature)
+                    if stored is not None:
+                        keys, matrix = stored
+                if new_keys != keys:
+                    matrix = self._rebuild(keys, matrix, new_keys, texts)
+
+            self._state = (new_keys, list(skills), matrix)
+            self._synced = skills if isinstance(skills, CatalogSnapshot) else None
+            return self._state
+
+    def _rebuild(
+        self,
+        old_keys: List[str],
+        old_matrix: "np.ndarray",
+        new_keys: List[str],
+        texts: List[str]
+    ) -> "np.ndarray":
+        """复用未变化的行，只编码新增或变化的 Skill"""
+        old_rows = {key: i for i, key in enumerate(old_keys)}
+        matrix = np.empty((len(new_keys), self.encoder.dimension), dtype=np.float32)
+
+        missing = []
+        for i, key in enumerate(new_keys):
+            old = old_rows.get(key)
+            if old is not None:
+                matrix[i] = old_matrix[old]
+            else:
+                missing.append(i)
+
+        if missing:
+            matrix[missing] = self.encoder.encode([texts[i] for i in missing])
+
+        if self.store is not None:
+            matrix = self.store.save(self.encoder.signature, new_keys, matrix)
+        return matrix
+
+    @staticmethod
+    def _skill_text(skill: Skill) -> str:
+        """参与编码的文本：名称和描述"""
+        return f"{skill.metadata.name.replace('-', ' ')}\n{skill.metadata.description}"
+
+    @staticmethod
+    def _row_key(skill: Skill, text: str) -> str:
+        """行键：Skill 名称加文本摘要，文本不变时向量可复用"""
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+        return f"{skill.metadata.name}:{digest}"
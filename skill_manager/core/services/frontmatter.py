@@ -0,0 +1,229 @@
+"""
+Frontmatter 解析服务 - 单一职责原则
+
+只负责读取、拆分和解析 SKILL.md 的 YAML frontmatter
+"""
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+from yaml.reader import Reader
+from yaml.resolver import Resolver
+
+# 有 libyaml 时使用 C 实现的加载器
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class FrontmatterParser:
+    """
+    Frontmatter 解析器
+
+    绝大多数 SKILL.md 的 frontmatter 只是扁平的 key: value，
+    外加偶尔出现的 > 折叠块或 | 字面块。这部分子集直接逐行解析；
+    只要出现嵌套、列表、锚点、转义、注释等任何不确定的写法，
+    就整体交给完整的 YAML 解析器，保证结果与 yaml.safe_load 一致。
+    """
+
+    MISSING_FRONTMATTER = "Invalid SKILL.md format: missing YAML frontmatter"
+
+    FRONTMATTER_PATTERN = re.compile(
+        r'^---\s*\n(.*?)\n---\s*\n(.*)$',
+        re.DOTALL
+    )
+
+    # 顶层 key: value 行（冒号后必须是空格或行尾）
+    KEY_PATTERN = re.compile(r'^([A-Za-z_][A-Za-z0-9_-]*):(?: (.*))?$')
+
+    # 不能作为纯量开头的 YAML 指示符
+    PLAIN_INDICATORS = frozenset('-?:,[]{}#&*!|>\'"%@`')
+
+    BLOCK_HEADERS = {'>': ('>', True), '>-': ('>', False), '|': ('|', True), '|-': ('|', False)}
+
+    STR_TAG = 'tag:yaml.org,2002:str'
+
+    # 制表符、BOM 以及 YAML 认定的额外换行符
+    SPECIAL_CHARS = re.compile('[\t\r\ufeff\x85\u2028\u2029]')
+
+    def __init__(self, chunk_size: int = 4096):
+        """
+        Args:
+            chunk_size: 读取头部时每次读取的字节数
+        """
+        self.chunk_size = chunk_size
+        self._resolver = Resolver()
+        self._lock = threading.Lock()
+        self.fast_hits = 0
+        self.fallbacks = 0
+
+    def read_header(self, skill_md: Path) -> str:
+        """只读取 SKILL.md 头部字节中的 frontmatter，不读取正文"""
+        with open(skill_md, 'rb') as f:
+            buffer = b''
+            start = 0
+            lines: Optional[List[str]] = None
+            while True:
+                end = buffer.find(b'\n', start)
+                if end < 0:
+                    chunk = f.read(self.chunk_size)
+                    if chunk:
+                        buffer = buffer[start:] + chunk
+                        start = 0
+                        continue
+                    # 文件结束：最后一行没有换行符
+                    if start >= len(buffer):
+                        break
+                    end = len(buffer)
+
+                line = buffer[start:end].decode('utf-8')
+                start = end + 1
+
+                if lines is None:
+                    if line.rstrip() != '---':
+                        break
+                    lines = []
+                elif line.rstrip() == '---':
+                    return '\n'.join(lines)
+                else:
+                    lines.append(line[:-1] if line.endswith('\r') else line)
+
+        raise ValueError(self.MISSING_FRONTMATTER)
+
+    def split(self, content: str) -> tuple[str, str]:
+        """拆分 frontmatter 和 Markdown 正文"""
+        # 常见情况（分隔线后紧跟换行）用 str.find 定位，其余情况交给正则
+        if content.startswith('---\n') and content[4:5] and not content[4].isspace():
+            end = content.find('\n---', 4)
+            if end >= 0 and content[end + 4:end + 5] == '\n':
+                return content[4:end], content[end + 5:].strip()
+
+        match = self.FRONTMATTER_PATTERN.match(content)
+        if not match:
+            raise ValueError(self.MISSING_FRONTMATTER)
+
+        return match.group(1), match.group(2).strip()
+
+    def parse(self, yaml_content: str) -> Any:
+        """解析 frontmatter；简单子集走快速路径，其余交给 YAML 解析器"""
+        data = self._parse_simple(yaml_content)
+        if data is not None:
+            with self._lock:
+                self.fast_hits += 1
+            return data
+
+        with self._lock:
+            self.fallbacks += 1
+        try:
+            return yaml.load(yaml_content, Loader=YAML_LOADER)
+        except yaml.YAMLError:
+            if YAML_LOADER is yaml.SafeLoader:
+                raise
+        # libyaml 的错误描述和行号与纯 Python 实现不同，
+        # 出错时用 SafeLoader 重新解析，保证报错与 yaml.safe_load 一致
+        return yaml.load(yaml_content, Loader=yaml.SafeLoader)
+
+    def _parse_simple(self, text: str) -> Optional[Dict[str, Any]]:
+        """解析扁平 frontmatter；遇到不支持的写法返回 None"""
+        if self.SPECIAL_CHARS.search(text) or Reader.NON_PRINTABLE.search(text):
+            return None
+
+        lines = text.split('\n')
+        data: Dict[str, Any] = {}
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            i += 1
+            if not line or line.startswith('#'):
+                continue
+
+            match = self.KEY_PATTERN.match(line)
+            if not match:
+                return None
+
+            key = match.group(1)
+            if not self._is_plain_str(key):
+                return None
+
+            raw = (match.group(2) or '').strip(' ')
+            if raw in self.BLOCK_HEADERS:
+                value, i = self._parse_block(lines, i, *self.BLOCK_HEADERS[raw])
+            else:
+                value = self._parse_scalar(raw)
+                # 下一行缩进表示多行纯量或嵌套结构
+                if i < len(lines) and lines[i].startswith(' '):
+                    return None
+
+            if value is None:
+                return None
+            data[key] = value
+
+        return data or None
+
+    def _parse_scalar(self, raw: str) -> Optional[str]:
+        """解析单行纯量；只接受解析结果为字符串的写法"""
+        if not raw:
+            return None
+
+        if raw[0] == '"':
+            inner = raw[1:-1]
+            if len(raw) < 2 or raw[-1] != '"' or '"' in inner or '\\' in inner:
+                return None
+            return inner
+
+        if raw[0] == "'":
+            inner = raw[1:-1]
+            if len(raw) < 2 or raw[-1] != "'" or "'" in inner:
+                return None
+            return inner
+
+        if raw[0] in self.PLAIN_INDICATORS or ': ' in raw or ' #' in raw or raw.endswith(':'):
+            return None
+        if not self._is_plain_str(raw):
+            return None
+        return raw
+
+    def _parse_block(self, lines: List[str], i: int, style: str, clip: bool) -> tuple[Optional[str], int]:
+        """解析 > 或 | 块纯量，返回 (值, 下一行索引)"""
+        body = []
+        indent = 0
+        while i < len(lines):
+            line = lines[i]
+            if line and not line.startswith(' '):
+                break
+            if line.strip(' ') == '':
+                # 空白行的折叠规则较复杂，交给完整解析器
+                if line or not body:
+                    return None, i
+                body.append('')
+            else:
+                stripped = line.lstrip(' ')
+                current = len(line) - len(stripped)
+                if not body:
+                    indent = current
+                elif current < indent:
+                    return None, i
+                elif current > indent and style == '>':
+                    return None, i
+                body.append(line[indent:])
+            i += 1
+
+        # 块末尾的空行属于 chomping 处理范围
+        ended_with_newline = i < len(lines)
+        while body and body[-1] == '':
+            body.pop()
+            ended_with_newline = True
+
+        if not body:
+            return None, i
+        if '' in body and style == '>':
+            return None, i
+
+        value = ' '.join(body) if style == '>' else '\n'.join(body)
+        if clip and ended_with_newline:
+            value += '\n'
+        return value, i
+
+    def _is_plain_str(self, value: str) -> bool:
+        """纯量按 YAML 隐式类型解析后仍然是字符串"""
+        return self._resolver.resolve(yaml.ScalarNode, value, (True, False)) == self.STR_TAG
@@ -0,0 +1,83 @@
+"""
+哈希向量编码服务 - 单一职责原则
+
+只负责把文本确定性地映射为固定维度的稀疏特征向量，不依赖网络或模型文件
+"""
+import hashlib
+from typing import Sequence
+
+from ..interfaces.text_encoder import ITextEncoder
+from .bm25_index import tokenize
+
+try:
+    import numpy as np
+except ImportError:  # numpy 为可选依赖
+    np = None
+
+
+class HashingTextEncoder(ITextEncoder):
+    """
+    哈希向量编码器
+
+    特征为分词结果（英文单词、中文二元组）以及英文单词的字符三元组，
+    用 BLAKE2b 哈希到固定维度并带符号，词频取对数后做 L2 归一化。
+    结果只取决于文本本身，不同进程、不同机器上完全一致。
+    """
+
+    def __init__(self, dimension: int = 2048, char_ngrams: bool = True):
+        """
+        Args:
+            dimension: 向量维度
+            char_ngrams: 是否加入英文单词的字符三元组（对词形变化更鲁棒）
+        """
+        if np is None:
+            raise ImportError("请安装 numpy: pip install numpy")
+        if dimension < 1:
+            raise ValueError("dimension must be >= 1")
+
+        self._dimension = dimension
+        self.char_ngrams = char_ngrams
+
+    @property
+    def dimension(self) -> int:
+        """向量维度"""
+        return self._dimension
+
+    @property
+    def signature(self) -> str:
+        """编码器签名"""
+        return f"{type(self).__name__}:{self._dimension}:{int(self.char_ngrams)}"
+
+    def encode(self, texts: Sequence[str]) -> "np.ndarray":
+        """编码文本为 L2 归一化的 float32 矩阵"""
+        matrix = np.zeros((len(texts), self._dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            counts = {}
+            for feature in self._features(text):
+                digest = int.from_bytes(
+                    hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'little'
+                )
+                # 最高位决定符号，减少哈希冲突带来的偏差
+                index = digest % self._dimension
+                sign = 1.0 if digest >> 63 else -1.0
+                counts[index] = counts.get(index, 0.0) + sign
+
+            if counts:
+                indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+                values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+                matrix[row, indices] = np.sign(values) * np.log1p(np.abs(values))
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def _features(self, text: str) -> list[str]:
+        """提取特征"""
+        tokens = tokenize(text)
+        features = list(tokens)
+        if self.char_ngrams:
+            for token in tokens:
+                if token.isascii() and len(token) > 3:
+                    padded = f"<{token}>"
+                    features.extend(f"#{padded[i:i + 3]}" for i in range(len(padded) - 2))
+        return features
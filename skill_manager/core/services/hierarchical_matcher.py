@@ -0,0 +1,228 @@
+"""
+分层路由服务 - 单一职责原则
+
+只负责两级路由：先在简短的类别列表中选出类别，再交给匹配器在类别内选择 Skill
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..entities.skill import Skill
+from ..entities.catalog import derive
+from ..entities.message import Message, MessageRole
+from ..interfaces.llm_backend import ILLMBackend, GenerationOptions, complete, acomplete
+from .skill_matcher import ISkillMatcher, SemanticSkillMatcher, IndexedSkillMatcher
+from .skill_taxonomy import SkillCategory, build_categories
+
+
+class HierarchicalSkillMatcher(ISkillMatcher):
+    """
+    两级路由匹配器
+
+    Skill 数量不超过 flat_limit 时直接交给内层匹配器；
+    否则把目录划分为约 sqrt(N) 个类别（frontmatter metadata 中声明的类别优先，
+    其余自动聚类），第一步选出类别，第二步由内层匹配器在该类别约 sqrt(N) 个 Skill 中选择。
+    选类别时先在本地用 BM25 打分，按类别取最高的归一化分数：最高分不低于 threshold
+    且领先第二个类别的相对差距不小于 margin 时直接选定（与 SemanticSkillMatcher 的
+    本地判定相同），否则才让 LLM 只看类别概括选出类别。
+    两步的提示长度都随 sqrt(N) 增长，而不是随 N 线性增长。
+    类别划分按目录快照只计算一次。
+
+    遵循单一职责原则 - 只负责类别选择，类别内的匹配委托给内层匹配器
+    """
+
+    def __init__(
+        self,
+        matcher: Optional[ISkillMatcher] = None,
+        category_key: str = 'category',
+        flat_limit: int = 50,
+        max_category_size: Optional[int] = None,
+        local_matcher: Optional[IndexedSkillMatcher] = None,
+        threshold: Optional[float] = None,
+        margin: Optional[float] = None
+    ):
+        """
+        Args:
+            matcher: 类别内的匹配器（默认 SemanticSkillMatcher）
+            category_key: frontmatter metadata 中声明类别的字段名
+            flat_limit: 不超过该数量时不分层
+            max_category_size: 单个类别的最大 Skill 数（默认 ceil(sqrt(N))）
+            local_matcher: 本地检索匹配器（默认复用内层匹配器的，没有时新建 IndexedSkillMatcher）
+            threshold: 本地选定类别所需的最低归一化分数（默认与内层匹配器相同）
+            margin: 本地选定类别所需的领先幅度（默认与内层匹配器相同）
+        """
+        self.matcher = matcher or SemanticSkillMatcher()
+        self.category_key = category_key
+        self.flat_limit = flat_limit
+        self.max_category_size = max_category_size
+        self.local_matcher = local_matcher or getattr(self.matcher, 'local_matcher', None) or IndexedSkillMatcher()
+        if threshold is None:
+            threshold = getattr(self.matcher, 'threshold', SemanticSkillMatcher.DEFAULT_THRESHOLD)
+        if margin is None:
+            margin = getattr(self.matcher, 'margin', SemanticSkillMatcher.DEFAULT_MARGIN)
+        self.threshold = threshold
+        self.margin = margin
+        self.local_hits = 0
+        self.llm_calls = 0
+
+    def match(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend
+    ) -> Optional[Skill]:
+        """先选类别，再在类别内匹配"""
+        if len(skills) <= self.flat_limit:
+            return self.matcher.match(user_input, skills, backend)
+
+        category = self.select_category(user_input, skills, backend)
+        if category is None:
+            return None
+        return self.matcher.match(user_input, category.skills, backend)
+
+    async def amatch(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend
+    ) -> Optional[Skill]:
+        """异步两级路由"""
+        if len(skills) <= self.flat_limit:
+            return await self.matcher.amatch(user_input, skills, backend)
+
+        category = await self.aselect_category(user_input, skills, backend)
+        if category is None:
+            return None
+        return await self.matcher.amatch(user_input, category.skills, backend)
+
+    def match_topk(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend,
+        k: int = 5
+    ) -> List[Tuple[Skill, float]]:
+        """候选排序不涉及 LLM，直接在全部 Skill 上委托"""
+        return self.matcher.match_topk(user_input, skills, backend, k)
+
+    def categories(self, skills: Sequence[Skill]) -> List[SkillCategory]:
+        """当前目录的类别划分（按快照缓存）"""
+        return derive(
+            skills,
+            (type(self), self.category_key, self.max_category_size),
+            lambda items: build_categories(items, self.category_key, self.max_category_size)
+        )
+
+    def select_category(
+        self,
+        user_input: str,
+        skills: Sequence[Skill],
+        backend: ILLMBackend
+    ) -> Optional[SkillCategory]:
+        """本地打分能明确区分类别时直接选定，否则让 LLM 在类别列表中选择"""
+        categories = self.categories(skills)
+        if len(categories) <= 1:
+            return categories[0] if categories else None
+
+        category = self._local_category(user_input, skills, categories)
+        if category is not None:
+            return category
+
+        messages, options = self._category_request(user_input, skills, categories)
+        return self._category_answer(complete(backend, messages, options=options), categories, options)
+
+    async def aselect_category(
+        self,
+        user_input: str,
+        skills: Sequence[Skill],
+        backend: ILLMBackend
+    ) -> Optional[SkillCategory]:
+        """select_category 的异步版本"""
+        categories = self.categories(skills)
+        if len(categories) <= 1:
+            return categories[0] if categories else None
+
+        category = self._local_category(user_input, skills, categories)
+        if category is not None:
+            return category
+
+        messages, options = self._category_request(user_input, skills, categories)
+        return self._category_answer(await acomplete(backend, messages, options=options), categories, options)
+
+    def _local_category(
+        self,
+        user_input: str,
+        skills: Sequence[Skill],
+        categories: List[SkillCategory]
+    ) -> Optional[SkillCategory]:
+        """
+        本地选定类别：各类别取成员的最高归一化 BM25 分数，
+        第一名足够高且明显领先第二名时返回该类别，否则返回 None
+        """
+        owners = derive(
+            skills,
+            (type(self), 'category_owners', self.category_key, self.max_category_size),
+            lambda _: {skill.metadata.name: category for category in categories for skill in category.skills}
+        )
+        # 最大类别的成员数加一：结果中一定会出现第二个类别（如果它有任何得分）
+        limit = max(len(category.skills) for category in categories) + 1
+        ranked = self.local_matcher.rank(user_input, skills, limit=limit, normalize=True)
+        if not ranked:
+            return None
+
+        best = owners[ranked[0][0].metadata.name]
+        top_score = ranked[0][1]
+        runner_up = next((score for skill, score in ranked if owners[skill.metadata.name] is not best), 0.0)
+        if top_score < self.threshold or (top_score - runner_up) / top_score < self.margin:
+            return None
+
+        self.local_hits += 1
+        return best
+
+    def _category_request(
+        self,
+        user_input: str,
+        skills: Sequence[Skill],
+        categories: List[SkillCategory]
+    ) -> Tuple[List[Dict[str, str]], GenerationOptions]:
+        """构建类别选择调用的消息和生成参数"""
+        self.llm_calls += 1
+        listing = derive(
+            skills,
+            (type(self), 'category_listing', self.category_key, self.max_category_size),
+            lambda _: self._describe_categories(categories)
+        )
+
+        prompt = f"""Based on the user's request, determine which skill category (if any) is most relevant.
+
+Categories:
+{listing}
+
+User request: {user_input}
+
+Respond with ONLY the category name (e.g., "{categories[0].name}") if a category matches, or "none" if no category is relevant.
+Do not include any explanation."""
+
+        options = GenerationOptions(
+            max_tokens=SemanticSkillMatcher.ANSWER_MAX_TOKENS,
+            temperature=0,
+            choices=[category.name for category in categories] + ["none"]
+        )
+        messages = [Message(role=MessageRole.USER, content=prompt)]
+        return [message.to_llm_format() for message in messages], options
+
+    @staticmethod
+    def _category_answer(
+        response: str,
+        categories: List[SkillCategory],
+        options: GenerationOptions
+    ) -> Optional[SkillCategory]:
+        """解析类别选择的回答"""
+        answer = options.choice(response)
+        for category in categories:
+            if category.name == answer:
+                return category
+        return None
+
+    @staticmethod
+    def _describe_categories(categories: List[SkillCategory]) -> str:
+        """类别列表描述"""
+        return "\n".join(f"- {category.name}: {category.summary()}" for category in categories)
@@ -3,11 +3,18 @@
 
 只负责构建系统提示和消息
 """
+import inspect
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 from ..entities.skill import Skill
+from ..entities.catalog import derive, find_skill
 from ..entities.message import Message, MessageRole
+from ..entities.prompt import PromptSegment, SegmentedPrompt
+from .skill_matcher import ISkillMatcher, IndexedSkillMatcher
+from .reference_index import ReferenceIndex
+from .skill_taxonomy import build_categories
 
 
 class IPromptBuilder(ABC):
@@ -22,9 +29,10 @@ class IPromptBuilder(ABC):
         self,
         skill: Optional[Skill],
         all_skills: List[Skill],
-        include_references: bool = False
+        include_references: bool = False,
+        user_input: Optional[str] = None
     ) -> Optional[str]:
-        """构建系统提示"""
+        """构建系统提示（user_input 用于挑选相关的参考文档片段）"""
         pass
 
     @abstractmethod
@@ -37,24 +45,106 @@ class IPromptBuilder(ABC):
         pass
 
 
+def build_system_prompt(
+    builder: IPromptBuilder,
+    skill: Optional[Skill],
+    all_skills: List[Skill],
+    include_references: bool = False,
+    user_input: Optional[str] = None
+) -> Optional[str]:
+    """
+    调用提示构建器，兼容尚未支持 user_input 参数的自定义构建器
+
+    构建器的 build_system_prompt 不接受 user_input 时按旧签名调用
+    """
+    if user_input is not None and _accepts_keyword(type(builder), 'build_system_prompt', 'user_input'):
+        return builder.build_system_prompt(skill, all_skills, include_references, user_input=user_input)
+    return builder.build_system_prompt(skill, all_skills, include_references)
+
+
+def build_tools_definition(
+    builder: IPromptBuilder,
+    skills: List[Skill],
+    user_input: Optional[str] = None
+) -> Optional[List[dict]]:
+    """
+    获取构建器的 tools 定义；构建器没有 build_tools_definition 时返回 None
+
+    构建器的 build_tools_definition 不接受 user_input 时按旧签名调用（发送全部工具）
+    """
+    if not hasattr(builder, 'build_tools_definition'):
+        return None
+    if user_input is not None and _accepts_keyword(type(builder), 'build_tools_definition', 'user_input'):
+        return builder.build_tools_definition(skills, user_input=user_input)
+    return builder.build_tools_definition(skills)
+
+
+@lru_cache(maxsize=None)
+def _accepts_keyword(builder_type: type, method: str, keyword: str) -> bool:
+    """构建器的方法是否接受指定的关键字参数"""
+    try:
+        parameters = inspect.signature(getattr(builder_type, method)).parameters
+    except (TypeError, ValueError, AttributeError):
+        return False
+    return keyword in parameters or any(
+        parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()
+    )
+
+
 class SystemPromptBuilder(IPromptBuilder):
     """
     系统提示构建器
 
+    Skill 数量超过 compact_threshold 时，可用 Skills 列表改为按类别分组、
+    只列名称，避免每个请求都携带全部描述。
+    返回 SegmentedPrompt：Skill 指令和 Skill 列表是稳定分段，
+    多轮对话中逐字节相同，可以命中服务端的前缀缓存。
+    包含参考文档时，不再拼接全部文档，而是把文档按 Markdown 标题切分，
+    只放入与用户输入最相关、总量不超过 reference_budget 的片段（易变分段）；
+    片段索引在首次需要时建立（参考文档正文是延迟加载的，加载目录时不读取），
+    之后按目录快照为每个 Skill 缓存
+
     遵循单一职责原则 - 只负责提示构建
     """
 
+    # 参考文档片段的默认 token 预算
+    DEFAULT_REFERENCE_BUDGET = 4000
+
+    def __init__(
+        self,
+        compact_threshold: Optional[int] = None,
+        category_key: str = 'category',
+        reference_budget: Optional[int] = DEFAULT_REFERENCE_BUDGET,
+        max_chunk_tokens: int = 800
+    ):
+        """
+        Args:
+            compact_threshold: 超过该数量时使用分组的紧凑列表（None 表示始终列出描述）
+            category_key: frontmatter metadata 中声明类别的字段名
+            reference_budget: 参考文档片段的 token 预算（None 表示包含全部参考文档）
+            max_chunk_tokens: 单个参考文档片段的最大 token 数
+        """
+        self.compact_threshold = compact_threshold
+        self.category_key = category_key
+        self.reference_budget = reference_budget
+        self.max_chunk_tokens = max_chunk_tokens
+
     def build_system_prompt(
         self,
         skill: Optional[Skill],
         all_skills: List[Skill],
-        include_references: bool = False
+        include_references: bool = False,
+        user_input: Optional[str] = None
     ) -> Optional[str]:
         """构建系统提示"""
         if skill:
-            return self._build_skill_prompt(skill, include_references)
+            return self._build_skill_prompt(skill, include_references, all_skills, user_input)
         else:
-            return self._build_available_skills_prompt(all_skills)
+            return derive(
+                all_skills,
+                (type(self), 'available_skills_prompt', self.compact_threshold, self.category_key),
+                self._build_available_skills_prompt
+            )
 
     def build_messages(
         self,
@@ -66,21 +156,56 @@ class SystemPromptBuilder(IPromptBuilder):
         messages.append(Message(role=MessageRole.USER, content=user_input))
         return messages
 
-    def _build_skill_prompt(self, skill: Skill, include_references: bool) -> str:
+    def _build_skill_prompt(
+        self,
+        skill: Skill,
+        include_references: bool,
+        all_skills: Optional[List[Skill]] = None,
+        user_input: Optional[str] = None
+    ) -> SegmentedPrompt:
         """构建单个 Skill 的提示"""
         parts = [
             f"# Active Skill: {skill.metadata.name}\n",
             skill.instructions
         ]
 
-        if include_references and skill.references:
+        if not include_references or not skill.references:
+            return SegmentedPrompt([PromptSegment("\n".join(parts))])
+
+        if self.reference_budget is None:
             parts.append("\n\n# Reference Documents\n")
-            for ref_name, ref in skill.references.items():
+            # 按名称排序，与目录扫描顺序无关，保证稳定前缀逐字节相同
+            for ref_name, ref in sorted(skill.references.items(), key=lambda item: item[0]):
                 parts.append(f"\n## {ref.name}\n{ref.content}")
+            return SegmentedPrompt([PromptSegment("\n".join(parts))])
+
+        chunks = self._reference_index(skill, all_skills).select(user_input, self.reference_budget)
+        segments = [PromptSegment("\n".join(parts))]
+        if chunks:
+            lines = ["\n# Reference Documents (relevant excerpts)"]
+            for ref_name, group in ReferenceIndex.group(chunks).items():
+                lines.append(f"\n## {ref_name}\n")
+                lines.append("\n\n".join(chunk.text for chunk in group))
+            segments.append(PromptSegment("\n".join(lines), stable=False))
+        return SegmentedPrompt(segments)
+
+    def _reference_index(self, skill: Skill, all_skills: Optional[List[Skill]]) -> ReferenceIndex:
+        """Skill 的参考文档片段索引（skill 属于传入的目录快照时按快照缓存）"""
+        # 片段不超过预算，任何片段都有机会被选中
+        max_chunk_tokens = max(1, min(self.max_chunk_tokens, self.reference_budget))
+
+        def build(_: object) -> ReferenceIndex:
+            return ReferenceIndex(skill.references, max_chunk_tokens)
 
-        return "\n".join(parts)
+        if all_skills is None or find_skill(all_skills, skill.metadata.name) is not skill:
+            return build(None)
+        return derive(
+            all_skills,
+            (type(self), 'reference_index', skill.metadata.name, max_chunk_tokens),
+            build
+        )
 
-    def _build_available_skills_prompt(self, skills: List[Skill]) -> Optional[str]:
+    def _build_available_skills_prompt(self, skills: List[Skill]) -> Optional[SegmentedPrompt]:
         """构建可用 Skills 列表提示"""
         if not skills:
             return None
@@ -88,25 +213,45 @@ class SystemPromptBuilder(IPromptBuilder):
         lines = ["# Available Skills\n"]
         lines.append("The following skills are available. Use them when relevant:\n")
 
-        for skill in skills:
-            lines.append(f"- **{skill.metadata.name}**: {skill.metadata.description}")
+        if self.compact_threshold is not None and len(skills) > self.compact_threshold:
+            for category in build_categories(skills, self.category_key):
+                names = ", ".join(skill.metadata.name for skill in category.skills)
+                topics = f" ({', '.join(category.keywords)})" if category.keywords else ""
+                lines.append(f"- **{category.name}**{topics}: {names}")
+        else:
+            for skill in skills:
+                lines.append(f"- **{skill.metadata.name}**: {skill.metadata.description}")
 
         lines.append("\nTo use a skill, identify which one is most relevant to the task.")
-        return "\n".join(lines)
+        return SegmentedPrompt([PromptSegment("\n".join(lines))])
 
 
 class ToolCallPromptBuilder(IPromptBuilder):
     """
     函数调用提示构建器
 
-    用于 function calling 模式的提示构建
+    用于 function calling 模式的提示构建。
+    每个 Skill 的工具定义按目录快照只构建一次；设置 top_k 并提供用户输入时，
+    先用本地排序器（默认 BM25）打分，只发送最相关的 top_k 个工具定义，
+    请求的输入 token 数和服务端处理工具的耗时不再随目录规模增长。
+    本地命中不足 top_k 个时按目录顺序补足，本地排序与模型用词不一致时模型仍有工具可选。
     """
 
+    def __init__(self, top_k: Optional[int] = None, ranker: Optional[ISkillMatcher] = None):
+        """
+        Args:
+            top_k: 默认发送的工具数上限（None 表示发送全部）
+            ranker: 本地排序器，使用其 match_topk（默认 IndexedSkillMatcher）
+        """
+        self.top_k = top_k
+        self.ranker = ranker or IndexedSkillMatcher()
+
     def build_system_prompt(
         self,
         skill: Optional[Skill],
         all_skills: List[Skill],
-        include_references: bool = False
+        include_references: bool = False,
+        user_input: Optional[str] = None
     ) -> Optional[str]:
         """构建函数调用的系统提示"""
         return """You have access to specialized skills that can help with specific tasks.
@@ -123,11 +268,40 @@ If no skill is needed, respond directly."""
         messages.append(Message(role=MessageRole.USER, content=user_input))
         return messages
 
-    def build_tools_definition(self, skills: List[Skill]) -> List[dict]:
-        """构建 tools 定义列表"""
-        tools = []
-        for skill in skills:
-            tools.append({
+    def build_tools_definition(
+        self,
+        skills: List[Skill],
+        user_input: Optional[str] = None,
+        top_k: Optional[int] = None
+    ) -> List[dict]:
+        """
+        构建 tools 定义列表
+
+        Args:
+            skills: 可用 Skill 列表
+            user_input: 用户输入（提供时按相关性筛选）
+            top_k: 工具数上限（默认使用构造时的 top_k）
+
+        Returns:
+            新的列表，调用方可以直接追加其他工具；列表中的定义为缓存对象，不应修改
+        """
+        definitions = derive(skills, (type(self), 'tool_definitions'), self._build_tool_definitions)
+        top_k = top_k if top_k is not None else self.top_k
+        if user_input is None or top_k is None or len(skills) <= top_k:
+            return list(definitions.values())
+
+        names = [skill.metadata.name for skill, _ in self.ranker.match_topk(user_input, skills, None, top_k)]
+        if len(names) < top_k:
+            chosen = set(names)
+            names.extend(name for name in definitions if name not in chosen)
+            del names[top_k:]
+        return [definitions[name] for name in names]
+
+    @staticmethod
+    def _build_tool_definitions(skills: List[Skill]) -> Dict[str, dict]:
+        """Skill 名称 -> 工具定义"""
+        return {
+            skill.metadata.name: {
                 "type": "function",
                 "function": {
                     "name": f"activate_skill_{skill.metadata.name.replace('-', '_')}",
@@ -138,5 +312,6 @@ If no skill is needed, respond directly."""
                         "required": []
                     }
                 }
-            })
-        return tools
+            }
+            for skill in skills
+        }
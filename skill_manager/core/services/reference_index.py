@@ -0,0 +1,226 @@
+"""
+参考文档检索服务 - 单一职责原则
+
+只负责把参考文档按 Markdown 标题切分成片段、建立索引，并在 token 预算内选出最相关的片段
+"""
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional
+
+from ..entities.skill import SkillReference
+from .bm25_index import BM25Index, CJK_PATTERN, tokenize
+
+# ATX 标题（"# 标题" 到 "###### 标题"）
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+
+
+def estimate_tokens(text: str) -> int:
+    """粗略估算 token 数：中日韩文字每字 1 个，其余约每 4 个字符 1 个"""
+    cjk = len(CJK_PATTERN.findall(text))
+    return cjk + math.ceil((len(text) - cjk) / 4)
+
+
+@dataclass(frozen=True)
+class ReferenceChunk:
+    """
+    参考文档片段
+
+    reference 为所属文档名，heading 为片段所在的标题路径（如 "Tables > Borders"），
+    position 为片段在所属文档中的序号
+    """
+    reference: str
+    heading: str
+    text: str
+    position: int
+    tokens: int
+
+
+def chunk_markdown(reference: str, text: str, max_tokens: int = 800) -> List[ReferenceChunk]:
+    """
+    按 Markdown 标题切分文档
+
+    每个标题（围栏代码块内的除外）开始一个新片段，标题前的内容单独成为一个片段；
+    超过 max_tokens 的片段继续切分（见 _split_section），每个片段都不超过 max_tokens
+    """
+    sections = []
+    path: List[str] = []
+    lines: List[str] = []
+    in_fence = False
+
+    for line in text.splitlines():
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_PATTERN.match(line)
+        if match:
+            sections.append((" > ".join(path), lines))
+            level = len(match.group(1))
+            path = path[:level - 1] + [match.group(2)]
+            lines = []
+        lines.append(line)
+    sections.append((" > ".join(path), lines))
+
+    chunks: List[ReferenceChunk] = []
+    for heading, section in sections:
+        for part in _split_section("\n".join(section).strip(), max_tokens):
+            chunks.append(ReferenceChunk(
+                reference=reference,
+                heading=heading,
+                text=part,
+                position=len(chunks),
+                tokens=estimate_tokens(part)
+            ))
+    return chunks
+
+
+def _split_section(text: str, max_tokens: int) -> List[str]:
+    """
+    把过长的片段切分为不超过 max_tokens 的部分
+
+    先按空行切分为块（围栏代码块整体算一个块），相邻的块合并到接近上限；
+    单个块超长时按行切分（代码块的每一部分都重新补上围栏），单行超长时按字符切分。
+    这样任何内容都能放进不小于 max_tokens 的预算，不会因为过长而从提示中消失
+    """
+    if not text:
+        return []
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+
+    parts, current, current_tokens = [], [], 0
+    for block in _blocks(text):
+        for piece in _split_block(block, max_tokens):
+            # 每个块另计 1 个 token 作为连接空行的余量
+            tokens = estimate_tokens(piece) + 1
+            if current and current_tokens + tokens > max_tokens:
+                parts.append("\n\n".join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += tokens
+    if current:
+        parts.append("\n\n".join(current))
+    return parts
+
+
+def _blocks(text: str) -> List[str]:
+    """按空行切分为块；围栏代码块内的空行不切分"""
+    blocks, current, in_fence = [], [], False
+    for line in text.split("\n"):
+        if not in_fence and not line.strip():
+            if current:
+                blocks.append("\n".join(current))
+                current = []
+            continue
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        current.append(line)
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+def _split_block(block: str, max_tokens: int) -> List[str]:
+    """按行切分超长的块；围栏代码块的每一部分都以同样的围栏包裹"""
+    if estimate_tokens(block) <= max_tokens:
+        return [block]
+
+    lines = block.split("\n")
+    fence = FENCE_PATTERN.match(lines[0])
+    opener = closer = None
+    if fence:
+        opener, closer = lines[0], fence.group(1)
+        lines = lines[1:-1] if len(lines) > 1 and FENCE_PATTERN.match(lines[-1]) else lines[1:]
+        limit = max(1, max_tokens - estimate_tokens(opener) - estimate_tokens(closer) - 2)
+    else:
+        limit = max_tokens
+
+    pieces, current, current_tokens = [], [], 0
+    for line in lines:
+        for segment in _split_line(line, limit - 1):
+            tokens = estimate_tokens(segment) + 1
+            if current and current_tokens + tokens > limit:
+                pieces.append("\n".join(current))
+                current, current_tokens = [], 0
+            current.append(segment)
+            current_tokens += tokens
+    if current:
+        pieces.append("\n".join(current))
+
+    if opener is not None:
+        pieces = [f"{opener}\n{piece}\n{closer}" for piece in pieces]
+    return pieces
+
+
+def _split_line(line: str, max_tokens: int) -> List[str]:
+    """按字符切分超长的单行（每个字符至多计 1 个 token）"""
+    if estimate_tokens(line) <= max_tokens:
+        return [line]
+    step = max(1, max_tokens)
+    return [line[i:i + step] for i in range(0, len(line), step)]
+
+
+class ReferenceIndex:
+    """
+    单个 Skill 参考文档的片段索引
+
+    片段用 BM25 打分（标题词计两次）；select 按分数从高到低在 token 预算内
+    贪心选取，再按文档顺序输出，保持上下文连贯。
+    没有任何片段与输入相关（或未提供输入）时，按文档顺序选取开头的片段。
+
+    遵循单一职责原则 - 只负责片段检索，不关心提示格式
+    """
+
+    def __init__(self, references: Mapping[str, SkillReference], max_chunk_tokens: int = 800):
+        """
+        Args:
+            references: 参考文档（文件名 -> 文档）
+            max_chunk_tokens: 单个片段的最大 token 数
+        """
+        self.chunks: List[ReferenceChunk] = []
+        for name in sorted(references):
+            self.chunks.extend(chunk_markdown(name, references[name].content, max_chunk_tokens))
+
+        self._index = BM25Index()
+        for i, chunk in enumerate(self.chunks):
+            self._index.add(i, tokenize(f"{chunk.heading}\n{chunk.heading}\n{chunk.text}"))
+
+    def select(self, query: Optional[str], budget: int) -> List[ReferenceChunk]:
+        """
+        在 token 预算内选出与输入最相关的片段
+
+        Args:
+            query: 用户输入
+            budget: token 预算
+
+        Returns:
+            按文档顺序排列的片段
+        """
+        ranked: List[int] = []
+        if query:
+            ranked = [i for i, _ in self._index.search(tokenize(query), limit=len(self.chunks))]
+        if not ranked:
+            ranked = list(range(len(self.chunks)))
+
+        selected, used = [], 0
+        for i in ranked:
+            tokens = self.chunks[i].tokens
+            if used + tokens <= budget:
+                selected.append(i)
+                used += tokens
+        return [self.chunks[i] for i in sorted(selected)]
+
+    @property
+    def total_tokens(self) -> int:
+        """全部参考文档的估算 token 数"""
+        return sum(chunk.tokens for chunk in self.chunks)
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    @staticmethod
+    def group(chunks: List[ReferenceChunk]) -> Dict[str, List[ReferenceChunk]]:
+        """按所属文档分组（保持顺序）"""
+        groups: Dict[str, List[ReferenceChunk]] = {}
+        for chunk in chunks:
+            groups.setdefault(chunk.reference, []).append(chunk)
+        return groups
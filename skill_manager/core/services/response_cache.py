@@ -0,0 +1,180 @@
+"""
+LLM 响应缓存服务 - 单一职责原则
+
+只负责缓存"请求 -> 响应"，实际调用委托给被包装的后端
+"""
+import dataclasses
+import hashlib
+import json
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from ..interfaces.llm_backend import (
+    ILLMBackend, IModelConfig, GenerationOptions, complete, acomplete, complete_stream
+)
+from ..interfaces.response_store import IResponseStore
+from .ttl_cache import TTLCache
+
+
+def response_cache_key(
+    model: str,
+    messages: List[Dict[str, Any]],
+    system_prompt: Optional[str] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    options: Optional[GenerationOptions] = None
+) -> str:
+    """
+    请求的稳定摘要：模型名称、系统提示、消息、tools 和生成参数
+
+    以排序键的 JSON 序列化后计算 SHA-256，与字典键顺序和进程无关
+    """
+    payload = {
+        'model': model,
+        'system': system_prompt,
+        'messages': messages,
+        'tools': tools,
+        'options': dataclasses.asdict(options) if options is not None else None,
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class CachingLLMBackend(ILLMBackend):
+    """
+    带响应缓存的后端（装饰器）
+
+    缓存键为 response_cache_key：模型名称取自被包装后端的 get_model_name()，
+    切换模型后旧响应自然不再命中。内存中为 LRU + TTL（见 TTLCache）；提供 store 时响应
+    同时写入持久化存储，进程重启后仍可命中。
+    默认只缓存确定性调用（生成参数中 temperature 为 0，如路由调用）；
+    deterministic_only=False 时缓存所有调用（适合重复的评测运行）。
+
+    遵循开闭原则 - 不修改已有后端即可增加缓存
+    """
+
+    def __init__(
+        self,
+        backend: ILLMBackend,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        store: Optional[IResponseStore] = None,
+        deterministic_only: bool = True,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            backend: 被包装的后端
+            max_entries: 内存中最多保存的响应数
+            ttl: 响应有效期（秒），None 表示永不过期
+            store: 持久化存储（可选）
+            deterministic_only: 是否只缓存 temperature 为 0 的调用
+            clock: 时间函数（返回 Unix 时间戳）
+        """
+        self.backend = backend
+        self.deterministic_only = deterministic_only
+        # 键 -> 响应文本
+        self.cache = TTLCache(max_entries, ttl, store, clock)
+
+    def complete(
+        self,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> str:
+        """优先返回缓存的响应，未命中时调用被包装的后端"""
+        key = self._key(messages, system_prompt, tools, options)
+        if key is None:
+            return complete(self.backend, messages, system_prompt, tools, options)
+
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        response = complete(self.backend, messages, system_prompt, tools, options)
+        self._remember(key, response)
+        return response
+
+    async def acomplete(
+        self,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> str:
+        """异步版本：命中时不等待，未命中时委托给被包装后端的 acomplete"""
+        key = self._key(messages, system_prompt, tools, options)
+        if key is None:
+            return await acomplete(self.backend, messages, system_prompt, tools, options)
+
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        response = await acomplete(self.backend, messages, system_prompt, tools, options)
+        self._remember(key, response)
+        return response
+
+    def complete_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> Iterator[str]:
+        """流式版本：命中时一次性返回；未命中时边转发边累积，完整结束后才写入缓存"""
+        key = self._key(messages, system_prompt, tools, options)
+        if key is not None:
+            cached = self._lookup(key)
+            if cached is not None:
+                yield cached
+                return
+
+        chunks = []
+        for chunk in complete_stream(self.backend, messages, system_prompt, tools, options):
+            chunks.append(chunk)
+            yield chunk
+
+        if key is not None:
+            self._remember(key, "".join(chunks))
+
+    def get_model_name(self) -> str:
+        """获取被包装后端的模型名称"""
+        return self.backend.get_model_name()
+
+    def configure(self, config: IModelConfig) -> None:
+        """配置被包装的后端（模型名称是缓存键的一部分，无需清空缓存）"""
+        self.backend.configure(config)
+
+    def clear(self) -> None:
+        """清空缓存（计数器保留）"""
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """缓存统计信息"""
+        return self.cache.stats()
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def _key(
+        self,
+        messages: List[Dict[str, Any]],
+        system_prompt: Optional[str],
+        tools: Optional[List[Dict[str, Any]]],
+        options: Optional[GenerationOptions]
+    ) -> Optional[str]:
+        """缓存键；调用不应被缓存时返回 None"""
+        if self.deterministic_only and (options is None or options.temperature != 0):
+            return None
+        return response_cache_key(self.backend.get_model_name(), messages, system_prompt, tools, options)
+
+    def _lookup(self, key: str) -> Optional[str]:
+        """查找缓存；未命中或已过期时返回 None"""
+        entry = self.cache.lookup(key)
+        self.cache.record(hit=entry is not None)
+        return entry[0] if entry is not None else None
+
+    def _remember(self, key: str, response: str) -> None:
+        """记录响应"""
+        self.cache.remember(key, response)
@@ -0,0 +1,187 @@
+"""
+路由缓存服务 - 单一职责原则
+
+只负责缓存"用户输入 -> Skill"的路由决策，实际匹配委托给被包装的匹配器
+"""
+import hashlib
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..entities.skill import Skill
+from ..entities.catalog import find_skill, derive
+from ..interfaces.llm_backend import ILLMBackend
+from ..interfaces.routing_store import IRoutingStore
+from .bm25_index import CJK_RANGES, normalize_text
+from .skill_matcher import ISkillMatcher
+from .ttl_cache import TTLCache
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# 与中日韩文字相邻的空白（中文书写中这类空格可有可无）
+CJK_SPACE_PATTERN = re.compile(rf'(?<=[{CJK_RANGES}]) | (?=[{CJK_RANGES}])')
+
+# 缓存未命中标记（None 是合法的缓存值，表示"没有匹配的 Skill"）
+_MISS = object()
+
+
+def normalize_query(text: str) -> str:
+    """
+    规范化用户输入，作为路由缓存的键
+
+    NFKC 规范化（全角转半角）并做大小写折叠，连续空白折叠为一个空格，
+    去掉与中日韩文字相邻的空格："帮我处理 PDF" 与 "帮我处理pdf" 得到相同的键
+    """
+    text = WHITESPACE_PATTERN.sub(' ', normalize_text(text)).strip()
+    return CJK_SPACE_PATTERN.sub('', text)
+
+
+def catalog_fingerprint(skills: Sequence[Skill]) -> str:
+    """目录指纹：所有 Skill 名称和描述的摘要，与顺序无关"""
+    digest = hashlib.blake2b(digest_size=16)
+    for name, description in sorted((s.metadata.name, s.metadata.description) for s in skills):
+        digest.update(name.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(description.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class CachingSkillMatcher(ISkillMatcher):
+    """
+    带路由缓存的匹配器（装饰器）
+
+    缓存键为规范化后的输入加目录指纹：Skill 被增删或描述被修改后指纹变化，
+    旧决策自然失效，无需显式清理；指纹按快照只计算一次。
+    内存中为 LRU + TTL（见 TTLCache）；提供 store 时决策同时写入持久化存储，
+    进程重启后仍可命中。"没有匹配"的决策同样会被缓存。
+
+    遵循开闭原则 - 不修改已有匹配器即可增加缓存
+    """
+
+    def __init__(
+        self,
+        matcher: ISkillMatcher,
+        max_entries: int = 1024,
+        ttl: Optional[float] = 3600.0,
+        store: Optional[IRoutingStore] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            matcher: 被包装的匹配器
+            max_entries: 内存中最多保存的决策数
+            ttl: 决策有效期（秒），None 表示永不过期
+            store: 持久化存储（可选）
+            clock: 时间函数（返回 Unix 时间戳）
+        """
+        self.matcher = matcher
+        # 键 -> Skill 名称（None 表示没有匹配）
+        self.cache = TTLCache(max_entries, ttl, store, clock)
+
+    def match(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend
+    ) -> Optional[Skill]:
+        """优先返回缓存的决策，未命中时委托给被包装的匹配器"""
+        key = self._key(user_input, skills)
+        cached = self._lookup(key, skills)
+        if cached is not _MISS:
+            return cached
+
+        skill = self.matcher.match(user_input, skills, backend)
+        self._remember(key, skill)
+        return skill
+
+    async def amatch(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend
+    ) -> Optional[Skill]:
+        """异步版本：命中时不等待，未命中时委托给被包装匹配器的 amatch"""
+        key = self._key(user_input, skills)
+        cached = self._lookup(key, skills)
+        if cached is not _MISS:
+            return cached
+
+        skill = await self.matcher.amatch(user_input, skills, backend)
+        self._remember(key, skill)
+        return skill
+
+    def match_topk(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend,
+        k: int = 5
+    ) -> List[Tuple[Skill, float]]:
+        """候选列表不缓存，直接委托"""
+        return self.matcher.match_topk(user_input, skills, backend, k)
+
+    def match_batch(
+        self,
+        user_inputs: Sequence[str],
+        skills: List[Skill],
+        backend: ILLMBackend
+    ) -> List[Optional[Skill]]:
+        """批量匹配：只把未命中的请求（去重后）交给被包装的匹配器"""
+        results: List[Optional[Skill]] = [None] * len(user_inputs)
+        pending: Dict[str, List[int]] = {}
+        first_input: Dict[str, str] = {}
+
+        for i, user_input in enumerate(user_inputs):
+            key = self._key(user_input, skills)
+            if key in pending:
+                pending[key].append(i)
+                continue
+            cached = self._lookup(key, skills)
+            if cached is _MISS:
+                pending[key] = [i]
+                first_input[key] = user_input
+            else:
+                results[i] = cached
+
+        if pending:
+            keys = list(pending)
+            matched = self.matcher.match_batch([first_input[key] for key in keys], skills, backend)
+            for key, skill in zip(keys, matched):
+                self._remember(key, skill)
+                for i in pending[key]:
+                    results[i] = skill
+
+        return results
+
+    def clear(self) -> None:
+        """清空缓存（计数器保留）"""
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """缓存统计信息"""
+        return self.cache.stats()
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def _key(self, user_input: str, skills: Sequence[Skill]) -> str:
+        """缓存键：目录指纹 + 规范化输入"""
+        fingerprint = derive(skills, (CachingSkillMatcher, 'fingerprint'), catalog_fingerprint)
+        return f"{fingerprint}:{normalize_query(user_input)}"
+
+    def _lookup(self, key: str, skills: Sequence[Skill]) -> Any:
+        """查找缓存；未命中、已过期或 Skill 已不存在时返回 _MISS"""
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            name = entry[0]
+            skill = find_skill(skills, name) if name is not None else None
+            if name is None or skill is not None:
+                self.cache.record(hit=True)
+                return skill
+
+        self.cache.record(hit=False)
+        return _MISS
+
+    def _remember(self, key: str, skill: Optional[Skill]) -> None:
+        """记录路由决策"""
+        self.cache.remember(key, skill.metadata.name if skill is not None else None)
@@ -0,0 +1,187 @@
+"""
+Skill 发现服务 - 单一职责原则
+
+只负责遍历目录树、找出 Skill 并生成文件清单，不读取文件内容
+"""
+import os
+import fnmatch
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Sequence
+
+
+@dataclass
+class SkillManifest:
+    """
+    Skill 文件清单
+
+    记录一个 Skill 目录中加载器需要的全部文件路径
+    """
+    skill_dir: Path
+    skill_md: Path
+    scripts: List[Path] = field(default_factory=list)
+    references: List[Path] = field(default_factory=list)
+    assets: List[Path] = field(default_factory=list)
+
+
+class SkillDiscovery:
+    """
+    基于 os.scandir 的 Skill 发现器
+
+    单次遍历目录树：包含 SKILL.md 的目录即为 Skill，不再继续向下查找；
+    其余目录在 max_depth 范围内递归，从而支持
+    skills/obsidian-skills-main/json-canvas 这样的嵌套结构。
+
+    根目录下的 .skillignore 文件可声明忽略规则（每行一个 fnmatch 模式，
+    匹配目录名或相对路径，# 开头为注释）。
+    """
+
+    SKILL_FILE = "SKILL.md"
+    IGNORE_FILE = ".skillignore"
+    DEFAULT_IGNORE_PATTERNS = ('.*', '__pycache__', 'node_modules')
+
+    def __init__(
+        self,
+        max_depth: int = 3,
+        ignore_patterns: Optional[Sequence[str]] = None,
+        ignore_file: Optional[str] = IGNORE_FILE
+    ):
+        """
+        Args:
+            max_depth: 最大查找深度（根目录的直接子目录深度为 1）
+            ignore_patterns: 忽略模式，默认忽略隐藏目录、__pycache__ 和 node_modules
+            ignore_file: 根目录下的忽略规则文件名（None 表示不读取）
+        """
+        if max_depth < 1:
+            raise ValueError("max_depth must be >= 1")
+
+        self.max_depth = max_depth
+        self.ignore_patterns = list(
+            self.DEFAULT_IGNORE_PATTERNS if ignore_patterns is None else ignore_patterns
+        )
+        self.ignore_file = ignore_file
+
+    def discover(self, base_dir: Path) -> List[SkillManifest]:
+        """遍历根目录，返回所有 Skill 的文件清单（按路径排序）"""
+        return [
+            self._build_manifest(Path(path), entries)
+            for path, entries in self._walk(Path(base_dir))
+        ]
+
+    def find_skill_dirs(self, base_dir: Path) -> List[Path]:
+        """遍历根目录，只返回 Skill 目录（不列出子目录内容）"""
+        return [Path(path) for path, _ in self._walk(Path(base_dir))]
+
+    def scan_skill(self, skill_dir: Path) -> SkillManifest:
+        """生成单个 Skill 目录的文件清单"""
+        skill_dir = Path(skill_dir)
+        entries = self._scandir(skill_dir)
+        if not any(e.name == self.SKILL_FILE and e.is_file() for e in entries):
+            raise FileNotFoundError(f"SKILL.md not found in {skill_dir}")
+        return self._build_manifest(skill_dir, entries)
+
+    def _walk(self, base_dir: Path) -> Iterator[tuple[str, List[os.DirEntry]]]:
+        """深度优先遍历，产出 (Skill 目录, 目录项列表)"""
+        is_ignored = self.load_ignore_rules(base_dir)
+        base = str(base_dir)
+
+        def walk(path: str, depth: int) -> Iterator[tuple[str, List[os.DirEntry]]]:
+            for entry in self._scandir(path):
+                if not entry.is_dir():
+                    continue
+                rel = os.path.relpath(entry.path, base).replace(os.sep, "/")
+                if is_ignored(entry.name, rel):
+                    continue
+
+                sub_entries = self._scandir(entry.path)
+                if any(e.name == self.SKILL_FILE and e.is_file() for e in sub_entries):
+                    yield entry.path, sub_entries
+                elif depth < self.max_depth:
+                    yield from walk(entry.path, depth + 1)
+
+        yield from walk(base, 1)
+
+    def _build_manifest(self, skill_dir: Path, entries: List[os.DirEntry]) -> SkillManifest:
+        """根据 Skill 目录项生成清单"""
+        manifest = SkillManifest(skill_dir=skill_dir, skill_md=skill_dir / self.SKILL_FILE)
+        root_docs = []
+
+        for entry in entries:
+            if entry.is_dir():
+                if entry.name == "scripts":
+                    manifest.scripts = [
+                        skill_dir / "scripts" / e.name
+                        for e in self._scandir(entry.path) if e.is_file()
+                    ]
+                elif entry.name == "references":
+                    manifest.references = [
+                        skill_dir / "references" / e.name
+                        for e in self._scandir(entry.path)
+                        if e.is_file() and e.name.lower().endswith(".md")
+                    ]
+                elif entry.name == "assets":
+                    manifest.assets = [
+                        skill_dir / "assets" / e.name for e in self._scandir(entry.path)
+                    ]
+            elif entry.name.endswith(".md") and entry.name != self.SKILL_FILE and entry.is_file():
+                root_docs.append(skill_dir / entry.name)
+
+        # references 目录优先于根目录同名文件
+        names = {p.name for p in manifest.references}
+        manifest.references.extend(p for p in root_docs if p.name not in names)
+        return manifest
+
+    def in_scope(
+        self,
+        base_dir: Path,
+        path: Path,
+        is_ignored: Optional[Callable[[str, str], bool]] = None
+    ) -> bool:
+        """
+        判断目录是否在遍历范围内：深度不超过 max_depth，且自身及各级父目录都未被忽略
+
+        Args:
+            base_dir: Skills 根目录
+            path: 根目录下的目录
+            is_ignored: load_ignore_rules 的结果（批量判断时复用，避免重复读取 .skillignore）
+        """
+        try:
+            parts = Path(path).relative_to(base_dir).parts
+        except ValueError:
+            return False
+        if len(parts) > self.max_depth:
+            return False
+
+        is_ignored = is_ignored or self.load_ignore_rules(Path(base_dir))
+        return not any(
+            is_ignored(part, "/".join(parts[:i + 1]))
+            for i, part in enumerate(parts)
+        )
+
+    def load_ignore_rules(self, base_dir: Path) -> Callable[[str, str], bool]:
+        """合并默认忽略模式与 .skillignore 中的规则，返回 is_ignored(目录名, 相对路径)"""
+        patterns = list(self.ignore_patterns)
+        if self.ignore_file:
+            ignore_path = base_dir / self.ignore_file
+            if ignore_path.is_file():
+                for line in ignore_path.read_text(encoding='utf-8').splitlines():
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        patterns.append(line.rstrip('/'))
+
+        def is_ignored(name: str, rel: str) -> bool:
+            return any(
+                fnmatch.fnmatch(name, p) or fnmatch.fnmatch(rel, p)
+                for p in patterns
+            )
+
+        return is_ignored
+
+    @staticmethod
+    def _scandir(path) -> List[os.DirEntry]:
+        """列出目录项（按名称排序，目录不可读时返回空列表）"""
+        try:
+            with os.scandir(path) as it:
+                return sorted(it, key=lambda e: e.name)
+        except OSError:
+            return []
@@ -3,14 +3,16 @@ Skill 执行服务 - 单一职责原则
 
 只负责协调执行流程
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from ..entities.skill import Skill
+from ..entities.catalog import find_skill
 from ..entities.message import Message
-from ..interfaces.llm_backend import ILLMBackend
+from ..interfaces.llm_backend import ILLMBackend, acomplete
 from .skill_matcher import ISkillMatcher
-from .prompt_builder import IPromptBuilder
+from .prompt_builder import IPromptBuilder, build_system_prompt, build_tools_definition
 
 
 class ISkillExecutor(ABC):
@@ -48,6 +50,57 @@ class ISkillExecutor(ABC):
         """
         pass
 
+    async def aexecute(
+        self,
+        user_input: str,
+        backend: ILLMBackend,
+        skills: List[Skill],
+        conversation_history: Optional[List[Message]] = None,
+        auto_match: bool = True,
+        skill_name: Optional[str] = None,
+        include_references: bool = False
+    ) -> str:
+        """
+        execute 的异步版本
+
+        默认实现在线程池中运行 execute；内置执行器使用匹配器的 amatch 和后端的 acomplete
+        """
+        return await asyncio.to_thread(
+            self.execute,
+            user_input,
+            backend,
+            skills,
+            conversation_history,
+            auto_match,
+            skill_name,
+            include_references
+        )
+
+    def execute_stream(
+        self,
+        user_input: str,
+        backend: ILLMBackend,
+        skills: List[Skill],
+        conversation_history: Optional[List[Message]] = None,
+        auto_match: bool = True,
+        skill_name: Optional[str] = None,
+        include_references: bool = False
+    ) -> Iterator[str]:
+        """
+        execute 的流式版本，逐段返回 LLM 响应
+
+        默认实现一次性返回 execute 的结果；内置执行器使用后端的 complete_stream
+        """
+        yield self.execute(
+            user_input,
+            backend,
+            skills,
+            conversation_history,
+            auto_match,
+            skill_name,
+            include_references
+        )
+
 
 class SkillExecutor(ISkillExecutor):
     """
@@ -90,11 +143,73 @@ class SkillExecutor(ISkillExecutor):
             skill_name
         )
 
+        # 调用 LLM
+        llm_messages, system_prompt = self._build_request(
+            user_input, skill, skills, conversation_history, include_references
+        )
+        return backend.complete(llm_messages, system_prompt=system_prompt)
+
+    async def aexecute(
+        self,
+        user_input: str,
+        backend: ILLMBackend,
+        skills: List[Skill],
+        conversation_history: Optional[List[Message]] = None,
+        auto_match: bool = True,
+        skill_name: Optional[str] = None,
+        include_references: bool = False
+    ) -> str:
+        """异步执行用户请求（路由和生成都不占用线程）"""
+        if skill_name or not auto_match:
+            skill = self._select_skill(user_input, skills, backend, auto_match, skill_name)
+        else:
+            skill = await self.matcher.amatch(user_input, skills, backend)
+
+        llm_messages, system_prompt = self._build_request(
+            user_input, skill, skills, conversation_history, include_references
+        )
+        return await acomplete(backend, llm_messages, system_prompt=system_prompt)
+
+    def execute_stream(
+        self,
+        user_input: str,
+        backend: ILLMBackend,
+        skills: List[Skill],
+        conversation_history: Optional[List[Message]] = None,
+        auto_match: bool = True,
+        skill_name: Optional[str] = None,
+        include_references: bool = False
+    ) -> Iterator[str]:
+        """流式执行用户请求（路由完成后逐段返回生成的文本）"""
+        skill = self._select_skill(
+            user_input,
+            skills,
+            backend,
+            auto_match,
+            skill_name
+        )
+
+        llm_messages, system_prompt = self._build_request(
+            user_input, skill, skills, conversation_history, include_references
+        )
+        yield from backend.complete_stream(llm_messages, system_prompt=system_prompt)
+
+    def _build_request(
+        self,
+        user_input: str,
+        skill: Optional[Skill],
+        skills: List[Skill],
+        conversation_history: Optional[List[Message]],
+        include_references: bool
+    ) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """构建 LLM 消息和系统提示"""
         # 构建系统提示
-        system_prompt = self.prompt_builder.build_system_prompt(
+        system_prompt = build_system_prompt(
+            self.prompt_builder,
             skill,
             skills,
-            include_references
+            include_references,
+            user_input
         )
 
         # 构建消息
@@ -102,10 +217,7 @@ class SkillExecutor(ISkillExecutor):
             user_input,
             conversation_history
         )
-
-        # 调用 LLM
-        llm_messages = [msg.to_llm_format() for msg in messages]
-        return backend.complete(llm_messages, system_prompt=system_prompt)
+        return [msg.to_llm_format() for msg in messages], system_prompt
 
     def _select_skill(
         self,
@@ -117,9 +229,8 @@ class SkillExecutor(ISkillExecutor):
     ) -> Optional[Skill]:
         """选择要使用的 Skill"""
         if skill_name:
-            # 按名称查找
-            skill_map = {s.metadata.name: s for s in skills}
-            skill = skill_map.get(skill_name)
+            # 按名称查找（传入目录快照时为 O(1)）
+            skill = find_skill(skills, skill_name)
             if not skill:
                 raise ValueError(f"Skill not found: {skill_name}")
             return skill
@@ -156,11 +267,57 @@ class ToolCallExecutor(ISkillExecutor):
         include_references: bool = False
     ) -> str:
         """使用函数调用模式执行"""
+        llm_messages, system_prompt, tools = self._build_request(
+            user_input, skills, conversation_history, include_references
+        )
+        return backend.complete(
+            llm_messages,
+            system_prompt=system_prompt,
+            tools=tools
+        )
+
+    async def aexecute(
+        self,
+        user_input: str,
+        backend: ILLMBackend,
+        skills: List[Skill],
+        conversation_history: Optional[List[Message]] = None,
+        auto_match: bool = True,
+        skill_name: Optional[str] = None,
+        include_references: bool = False
+    ) -> str:
+        """异步函数调用模式执行"""
+        llm_messages, system_prompt, tools = self._build_request(
+            user_input, skills, conversation_history, include_references
+        )
+        return await acomplete(backend, llm_messages, system_prompt=system_prompt, tools=tools)
+
+    def execute_stream(
+        self,
+        user_input: str,
+        backend: ILLMBackend,
+        skills: List[Skill],
+        conversation_history: Optional[List[Message]] = None,
+        auto_match: bool = True,
+        skill_name: Optional[str] = None,
+        include_references: bool = False
+    ) -> Iterator[str]:
+        """流式函数调用模式执行"""
+        llm_messages, system_prompt, tools = self._build_request(
+            user_input, skills, conversation_history, include_references
+        )
+        yield from backend.complete_stream(llm_messages, system_prompt=system_prompt, tools=tools)
+
+    def _build_request(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        conversation_history: Optional[List[Message]],
+        include_references: bool
+    ) -> Tuple[List[Dict[str, str]], Optional[str], Optional[List[dict]]]:
+        """构建 LLM 消息、系统提示和 tools 定义"""
         # 构建 tools 定义
-        if hasattr(self.prompt_builder, 'build_tools_definition'):
-            tools = self.prompt_builder.build_tools_definition(skills)
-        else:
-            tools = None
+        tools = build_tools_definition(self.prompt_builder, skills, user_input)
 
         # 构建系统提示
         system_prompt = self.prompt_builder.build_system_prompt(
@@ -175,10 +332,4 @@ class ToolCallExecutor(ISkillExecutor):
             conversation_history
         )
 
-        # 调用 LLM
-        llm_messages = [msg.to_llm_format() for msg in messages]
-        return backend.complete(
-            llm_messages,
-            system_prompt=system_prompt,
-            tools=tools
-        )
+        return [msg.to_llm_format() for msg in messages], system_prompt, tools
@@ -3,15 +3,28 @@ Skill 加载服务 - 单一职责原则
 
 只负责从文件系统加载 Skill
 """
+import os
 import re
-import yaml
+import sys
+import time
+import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
-from ..entities.skill import Skill, SkillMetadata, SkillScript, SkillReference
+from ..entities.blob import Blob
+from ..entities.skill import Skill, SkillMetadata, SkillScript, SkillReference, LazyValue, CachedValue
 from ..interfaces.llm_backend import ILLMBackend
+from ..interfaces.catalog_cache import ISkillCatalogCache, CatalogEntry
+from .skill_discovery import SkillDiscovery, SkillManifest
+from .blob_store import BlobStore
+from .frontmatter import FrontmatterParser
+from .content_cache import ContentCache
+
+logger = logging.getLogger(__name__)
 
 
 class ISkillLoader(ABC):
@@ -42,12 +55,71 @@ class FilesystemSkillLoader(ISkillLoader):
     文件系统 Skill 加载器
 
     遵循单一职责原则 - 只负责从文件系统加载
+
+    lazy=True 时启动阶段只解析 YAML frontmatter，
+    正文、脚本、参考文档和资源列表在首次访问时才从磁盘读取。
+
+    提供 catalog_cache 时，指纹（mtime, size, inode）未变化的 Skill
+    直接使用缓存的元数据和文件列表，跳过 YAML 解析和目录遍历。
+
+    max_workers > 1 时使用线程池并发加载目录中的 Skills，
+    结果顺序与目录名排序一致，每个 Skill 的耗时记录在 load_timings 中。
+
+    目录遍历由 SkillDiscovery 完成：单次 scandir 遍历生成文件清单，
+    支持嵌套目录、深度限制和 .skillignore 忽略规则。
+
+    读取的正文、脚本和参考文档都存入 BlobStore，内容相同的文件
+    （如 docx/ooxml 与 pptx/ooxml）只在内存中保存一份；延迟模式下
+    Skill 只持有相对路径元组，不为未访问的文件创建 Path 对象。
+
+    frontmatter 由 FrontmatterParser 解析：扁平的 key: value 和 >/| 块
+    直接逐行解析，复杂 YAML 才交给（优先 C 实现的）YAML 解析器。
+
+    延迟模式下提供 content_cache 时，正文、参考文档和脚本内容不再保存在实体上，
+    而是放入按字节预算淘汰的共享缓存，冷门 Skill 的内容会被释放。
     """
 
-    FRONTMATTER_PATTERN = re.compile(
-        r'^---\s*\n(.*?)\n---\s*\n(.*)$',
-        re.DOTALL
-    )
+    LANGUAGE_MAP = {
+        '.py': 'python',
+        '.sh': 'bash',
+        '.js': 'javascript',
+    }
+
+    # 文件增删会改变这些目录的 mtime，用于判断文件列表是否仍然有效
+    TRACKED_DIRS = ('.', 'scripts', 'references', 'assets')
+
+    def __init__(
+        self,
+        lazy: bool = False,
+        catalog_cache: Optional[ISkillCatalogCache] = None,
+        max_workers: int = 1,
+        discovery: Optional[SkillDiscovery] = None,
+        blob_store: Optional[BlobStore] = None,
+        frontmatter: Optional[FrontmatterParser] = None,
+        content_cache: Optional[ContentCache] = None
+    ):
+        """
+        Args:
+            lazy: 是否延迟加载 Skill 正文和附属文件
+            catalog_cache: 目录索引缓存（可选）
+            max_workers: 并发加载的线程数（1 表示顺序加载）
+            discovery: Skill 发现器（默认最大深度 3）
+            blob_store: 内容寻址存储（默认每个加载器独立一个）
+            frontmatter: frontmatter 解析器
+            content_cache: 文件内容缓存（仅延迟模式生效）
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        self.lazy = lazy
+        self.catalog_cache = catalog_cache
+        self.max_workers = max_workers
+        self.discovery = discovery or SkillDiscovery()
+        self.blob_store = blob_store or BlobStore()
+        self.frontmatter = frontmatter or FrontmatterParser()
+        self.content_cache = content_cache
+        # Skill 目录 -> 最近一次加载耗时（秒）
+        self.load_timings: Dict[str, float] = {}
 
     def parse_skill_metadata(self, skill_md_path: Path) -> tuple[SkillMetadata, str]:
         """解析 SKILL.md 文件"""
@@ -60,53 +132,207 @@ class FilesystemSkillLoader(ISkillLoader):
         if not skill_md.exists():
             raise FileNotFoundError(f"SKILL.md not found in {skill_dir}")
 
-        metadata, instructions = self.parse_skill_metadata(skill_md)
+        if self.catalog_cache is not None:
+            return self._load_skill_cached(skill_dir, skill_md)
 
-        # 加载脚本
-        scripts = self._load_scripts(skill_dir)
+        return self._load_from_manifest(self.discovery.scan_skill(skill_dir))
 
-        # 加载参考文档
-        references = self._load_references(skill_dir)
+    def load_skills_from_directory(self, base_dir: Path) -> List[Skill]:
+        """从目录（含嵌套目录）加载所有 Skills"""
+        if self.catalog_cache is not None:
+            # 缓存命中时不需要列出子目录，只定位 Skill 目录
+            candidates = self.discovery.find_skill_dirs(base_dir)
+        else:
+            candidates = self.discovery.discover(base_dir)
+
+        if self.max_workers > 1 and len(candidates) > 1:
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="skill-loader"
+            ) as pool:
+                results = list(pool.map(self._load_skill_timed, candidates))
+        else:
+            results = [self._load_skill_timed(item) for item in candidates]
+
+        return [skill for skill in results if skill is not None]
+
+    def get_slowest_skills(self, limit: int = 10) -> List[tuple[str, float]]:
+        """获取加载最慢的 Skills（目录, 耗时秒数）"""
+        ranked = sorted(self.load_timings.items(), key=lambda kv: kv[1], reverse=True)
+        return ranked[:limit]
+
+    def _load_skill_timed(self, target: Path | SkillManifest) -> Optional[Skill]:
+        """加载单个 Skill（目录或清单）并记录耗时；失败时打印警告并返回 None"""
+        if isinstance(target, SkillManifest):
+            skill_dir = target.skill_dir
+            load = partial(self._load_from_manifest, target)
+        else:
+            skill_dir = target
+            load = partial(self.load_skill, target)
+
+        start = time.perf_counter()
+        try:
+            return load()
+        except Exception as e:
+            print(f"Warning: Failed to load skill from {skill_dir}: {e}")
+            return None
+        finally:
+            elapsed = time.perf_counter() - start
+            self.load_timings[str(skill_dir)] = elapsed
+            logger.debug(f"⏱️ Loaded {skill_dir} in {elapsed * 1000:.1f} ms")
+
+    def _load_from_manifest(self, manifest: SkillManifest) -> Skill:
+        """根据文件清单构建 Skill；延迟模式下只解析 frontmatter"""
+        skill_dir = manifest.skill_dir
+        files = {
+            'scripts': self._relatives(skill_dir, manifest.scripts),
+            'references': self._relatives(skill_dir, manifest.references),
+            'assets': self._relatives(skill_dir, manifest.assets),
+        }
 
-        # 收集资源文件
-        assets = self._load_assets(skill_dir)
+        if self.lazy:
+            metadata = self._build_metadata(self._read_frontmatter(manifest.skill_md))
+            return self._assemble_skill(skill_dir, metadata, files)
+
+        metadata, instructions = self.parse_skill_metadata(manifest.skill_md)
+        return self._assemble_skill(skill_dir, metadata, files, instructions)
+
+    def _assemble_skill(
+        self,
+        skill_dir: Path,
+        metadata: SkillMetadata,
+        files: Dict[str, Sequence[str]],
+        instructions: Optional[str] = None
+    ) -> Skill:
+        """根据元数据和相对路径分组构建 Skill"""
+        scripts = tuple(files.get('scripts', ()))
+        references = tuple(files.get('references', ()))
+        assets = tuple(files.get('assets', ()))
+
+        if self.lazy:
+            # 使用未绑定函数加参数，避免为每个 Skill 创建绑定方法和 partial 对象
+            cls = type(self)
+            return Skill(
+                metadata=metadata,
+                instructions=self._lazy_content(cls._read_instructions, self, skill_dir),
+                path=skill_dir,
+                scripts=LazyValue(cls._build_scripts, self, skill_dir, scripts) if scripts else {},
+                references=LazyValue(cls._build_references, self, skill_dir, references) if references else {},
+                assets=LazyValue(self._build_paths, skill_dir, assets) if assets else []
+            )
+
+        if instructions is None:
+            instructions = self._read_instructions(skill_dir)
+        else:
+            instructions = self.blob_store.put(instructions)
 
         return Skill(
             metadata=metadata,
             instructions=instructions,
             path=skill_dir,
-            scripts=scripts,
-            references=references,
-            assets=assets
+            scripts=self._build_scripts(skill_dir, scripts),
+            references=self._build_references(skill_dir, references),
+            assets=self._build_paths(skill_dir, assets)
         )
 
-    def load_skills_from_directory(self, base_dir: Path) -> List[Skill]:
-        """从目录加载所有 Skills"""
-        loaded = []
+    def _load_skill_cached(self, skill_dir: Path, skill_md: Path) -> Skill:
+        """通过目录索引缓存加载，只重新解析指纹变化的 Skill"""
+        entry = self.catalog_cache.get(skill_dir)
+        if entry is None or not self._is_entry_fresh(skill_dir, entry):
+            entry = self._build_catalog_entry(skill_dir, skill_md)
+            self.catalog_cache.put(entry)
+
+        return self._skill_from_entry(skill_dir, entry)
+
+    def _build_catalog_entry(self, skill_dir: Path, skill_md: Path) -> CatalogEntry:
+        """解析 Skill 并生成缓存条目"""
+        metadata = self._build_metadata(self._read_frontmatter(skill_md))
+        manifest = self.discovery.scan_skill(skill_dir)
+        files = {
+            'scripts': list(self._relatives(skill_dir, manifest.scripts)),
+            'references': list(self._relatives(skill_dir, manifest.references)),
+            'assets': list(self._relatives(skill_dir, manifest.assets)),
+        }
+
+        tracked = ['SKILL.md', *self.TRACKED_DIRS]
+        for group in files.values():
+            tracked.extend(group)
 
-        for item in base_dir.iterdir():
-            if item.is_dir():
-                skill_md = item / "SKILL.md"
-                if skill_md.exists():
-                    try:
-                        skill = self.load_skill(item)
-                        loaded.append(skill)
-                    except Exception as e:
-                        print(f"Warning: Failed to load skill from {item}: {e}")
+        return CatalogEntry(
+            skill_dir=str(skill_dir),
+            metadata=metadata,
+            files=files,
+            fingerprints={rel: self._fingerprint(skill_dir / rel) for rel in tracked}
+        )
 
-        return loaded
+    def _is_entry_fresh(self, skill_dir: Path, entry: CatalogEntry) -> bool:
+        """检查缓存条目中所有文件的指纹是否未变化"""
+        for rel, fingerprint in entry.fingerprints.items():
+            if self._fingerprint(skill_dir / rel) != fingerprint:
+                return False
+        return True
+
+    def _skill_from_entry(self, skill_dir: Path, entry: CatalogEntry) -> Skill:
+        """根据缓存条目构建 Skill（不解析 YAML、不遍历目录）"""
+        return self._assemble_skill(skill_dir, entry.metadata, entry.files)
+
+    @staticmethod
+    def _fingerprint(path: Path) -> Optional[tuple]:
+        """文件指纹 (mtime_ns, size, inode)；文件不存在时为 None"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    @staticmethod
+    def _relatives(skill_dir: Path, paths: List[Path]) -> tuple[str, ...]:
+        """转换为相对 Skill 目录的 POSIX 路径（驻留字符串，跨 Skill 共享）"""
+        return tuple(sys.intern(path.relative_to(skill_dir).as_posix()) for path in paths)
+
+    @staticmethod
+    def _build_paths(skill_dir: Path, rels: Sequence[str]) -> List[Path]:
+        """相对路径转换为绝对路径列表"""
+        return [skill_dir / rel for rel in rels]
+
+    def _read_frontmatter(self, skill_md: Path) -> str:
+        """只读取 SKILL.md 头部的 YAML frontmatter，不读取正文"""
+        return self.frontmatter.read_header(skill_md)
+
+    def _read_instructions(self, skill_dir: Path) -> Blob:
+        """读取 SKILL.md 正文（去掉 frontmatter）"""
+        content = (skill_dir / "SKILL.md").read_text(encoding='utf-8')
+        return self.blob_store.put(self._split_frontmatter(content)[1])
+
+    def _read_blob(self, path: Path) -> Blob:
+        """读取文本文件并存入 BlobStore"""
+        return self.blob_store.put(path.read_text(encoding='utf-8'))
+
+    def _file_content(self, path: Path):
+        """返回文件内容；延迟模式下返回 LazyValue"""
+        if self.lazy:
+            return self._lazy_content(type(self)._read_blob, self, path)
+        return self._read_blob(path)
+
+    def _lazy_content(self, loader, *args) -> LazyValue:
+        """延迟加载的内容；配置了内容缓存时经由缓存加载"""
+        if self.content_cache is not None:
+            return CachedValue(self.content_cache, loader, *args)
+        return LazyValue(loader, *args)
+
+    def _split_frontmatter(self, content: str) -> tuple[str, str]:
+        """拆分 frontmatter 和 Markdown 正文"""
+        return self.frontmatter.split(content)
 
     def _parse_content(self, content: str) -> tuple[SkillMetadata, str]:
         """解析 SKILL.md 内容"""
-        match = self.FRONTMATTER_PATTERN.match(content)
-        if not match:
-            raise ValueError("Invalid SKILL.md format: missing YAML frontmatter")
-
-        yaml_content = match.group(1)
-        markdown_content = match.group(2).strip()
+        yaml_content, markdown_content = self._split_frontmatter(content)
+        return self._build_metadata(yaml_content), markdown_content
 
+    def _build_metadata(self, yaml_content: str) -> SkillMetadata:
+        """解析并验证 frontmatter，构建元数据"""
         # 解析 YAML
-        data = yaml.safe_load(yaml_content)
+        data = self.frontmatter.parse(yaml_content)
         if not isinstance(data, dict):
             raise ValueError("Invalid YAML frontmatter")
 
@@ -135,10 +361,15 @@ class FilesystemSkillLoader(ISkillLoader):
         }
         extra_metadata = {k: v for k, v in data.items() if k not in known_fields}
 
+        # license 在大量 Skill 间重复（如 "Complete terms in LICENSE.txt"），驻留以共享
+        license_text = data.get('license')
+        if isinstance(license_text, str):
+            license_text = sys.intern(license_text)
+
         metadata = SkillMetadata(
             name=name,
             description=description,
-            license=data.get('license'),
+            license=license_text,
             version=data.get('version') or data.get('metadata', {}).get('version'),
             author=data.get('author') or data.get('metadata', {}).get('author'),
             allowed_tools=data.get('allowed-tools') or data.get('allowed_tools'),
@@ -146,59 +377,27 @@ class FilesystemSkillLoader(ISkillLoader):
             metadata={**data.get('metadata', {}), **extra_metadata}
         )
 
-        return metadata, markdown_content
+        return metadata
 
-    def _load_scripts(self, skill_dir: Path) -> dict:
-        """加载脚本文件"""
+    def _build_scripts(self, skill_dir: Path, rels: Sequence[str]) -> Dict[str, SkillScript]:
+        """根据相对路径构建脚本实体"""
         scripts = {}
-        scripts_dir = skill_dir / "scripts"
-        if scripts_dir.exists():
-            for script_file in scripts_dir.iterdir():
-                if script_file.is_file():
-                    ext = script_file.suffix.lower()
-                    language_map = {
-                        '.py': 'python',
-                        '.sh': 'bash',
-                        '.js': 'javascript',
-                    }
-                    scripts[script_file.name] = SkillScript(
-                        name=script_file.stem,
-                        content=script_file.read_text(encoding='utf-8'),
-                        path=script_file,
-                        language=language_map.get(ext, 'unknown')
-                    )
+        for path in self._build_paths(skill_dir, rels):
+            scripts[path.name] = SkillScript(
+                name=path.stem,
+                content=self._file_content(path),
+                path=path,
+                language=self.LANGUAGE_MAP.get(path.suffix.lower(), 'unknown')
+            )
         return scripts
 
-    def _load_references(self, skill_dir: Path) -> dict:
-        """加载参考文档"""
+    def _build_references(self, skill_dir: Path, rels: Sequence[str]) -> Dict[str, SkillReference]:
+        """根据相对路径构建参考文档实体"""
         references = {}
-
-        # 从 references 目录加载
-        refs_dir = skill_dir / "references"
-        if refs_dir.exists():
-            for ref_file in refs_dir.iterdir():
-                if ref_file.is_file() and ref_file.suffix.lower() == '.md':
-                    references[ref_file.name] = SkillReference(
-                        name=ref_file.stem,
-                        content=ref_file.read_text(encoding='utf-8'),
-                        path=ref_file
-                    )
-
-        # 同时检查根目录下的 .md 文件
-        for md_file in skill_dir.glob("*.md"):
-            if md_file.name != "SKILL.md" and md_file.name not in references:
-                references[md_file.name] = SkillReference(
-                    name=md_file.stem,
-                    content=md_file.read_text(encoding='utf-8'),
-                    path=md_file
-                )
-
+        for path in self._build_paths(skill_dir, rels):
+            references[path.name] = SkillReference(
+                name=path.stem,
+                content=self._file_content(path),
+                path=path
+            )
         return references
-
-    def _load_assets(self, skill_dir: Path) -> List[Path]:
-        """收集资源文件"""
-        assets = []
-        assets_dir = skill_dir / "assets"
-        if assets_dir.exists():
-            assets = list(assets_dir.iterdir())
-        return assets
@@ -3,11 +3,18 @@ Skill 匹配服务 - 单一职责原则
 
 只负责根据用户输入匹配合适的 Skill
 """
+import asyncio
+import re
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Sequence, Tuple, Union
 
 from ..entities.skill import Skill
-from ..interfaces.llm_backend import ILLMBackend, IMessage
+from ..entities.catalog import CatalogSnapshot, find_skill, derive, root_catalog
+from ..entities.message import Message, MessageRole
+from ..interfaces.llm_backend import ILLMBackend, GenerationOptions, complete, acomplete
+from .bm25_index import BM25Index, normalize_text, tokenize
+from .aho_corasick import AhoCorasick
 
 
 class ISkillMatcher(ABC):
@@ -37,22 +44,111 @@ class ISkillMatcher(ABC):
         """
         pass
 
+    async def amatch(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend
+    ) -> Optional[Skill]:
+        """
+        match 的异步版本
+
+        默认实现在线程池中运行 match；需要调用 LLM 的匹配器应覆盖此方法并使用 backend.acomplete
+        """
+        return await asyncio.to_thread(self.match, user_input, skills, backend)
+
+    def match_topk(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend,
+        k: int = 5
+    ) -> List[Tuple[Skill, float]]:
+        """
+        返回得分最高的 k 个候选
+
+        分数的含义由具体匹配器决定（BM25 分数、余弦相似度、关键词分数等），
+        只保证同一匹配器内可比较。默认实现只返回 match 的结果（分数为 1.0）。
+
+        Returns:
+            (Skill, 分数) 列表，按分数降序
+        """
+        skill = self.match(user_input, skills, backend)
+        return [(skill, 1.0)] if skill is not None and k > 0 else []
+
+    def match_batch(
+        self,
+        user_inputs: Sequence[str],
+        skills: List[Skill],
+        backend: ILLMBackend
+    ) -> List[Optional[Skill]]:
+        """
+        批量匹配
+
+        默认实现逐个调用 match；需要调用 LLM 的匹配器可以把多个请求合并为一次调用
+
+        Returns:
+            与 user_inputs 一一对应的匹配结果
+        """
+        return [self.match(user_input, skills, backend) for user_input in user_inputs]
+
 
 class SemanticSkillMatcher(ISkillMatcher):
     """
     语义 Skill 匹配器
 
-    使用 LLM 进行语义匹配，理解用户意图
+    按代价从低到高分级匹配，只有本地无法判断时才调用 LLM：
+    1. 用户输入中明确出现唯一的 Skill 名称时直接返回
+    2. 本地 BM25 检索打分：归一化后的最高分不低于 threshold，且领先第二名的相对差距
+       不小于 margin 时直接返回（分数除以查询的参照分数，约等于按 IDF 加权的
+       查询词命中比例，与目录规模和查询长度无关）
+    3. 否则把本地得分最高的 top_k 个候选交给 LLM 判断；
+       本地没有任何候选时（如用词完全不同），按 llm_fallback 决定是否让 LLM 查看全部 Skill
 
     遵循单一职责原则 - 只负责语义匹配逻辑
     """
 
-    def __init__(self, threshold: float = 0.5):
+    # 批量路由回答的单行格式，如 "3: pdf"、"3. none"
+    BATCH_ANSWER_PATTERN = re.compile(r'^\s*(\d+)\s*[:.)\-]\s*(.+?)\s*$')
+
+    # 路由调用的输出上限：一个 Skill 名称（或其 JSON 包装）所需的 token 数
+    ANSWER_MAX_TOKENS = 32
+
+    # 本地直接判定的默认阈值和领先幅度
+    DEFAULT_THRESHOLD = 0.15
+    DEFAULT_MARGIN = 0.2
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        margin: float = DEFAULT_MARGIN,
+        top_k: int = 5,
+        local_matcher: Optional['IndexedSkillMatcher'] = None,
+        exact_names: bool = True,
+        llm_fallback: bool = True,
+        batch_size: int = 20
+    ):
         """
         Args:
-            threshold: 匹配阈值（预留，当前使用 LLM 直接匹配）
+            threshold: 本地直接判定所需的最低归一化分数（0 到 1）
+            margin: 本地直接判定所需的领先幅度（(第一名 - 第二名) / 第一名）
+            top_k: 交给 LLM 判断的候选数量
+            local_matcher: 本地检索匹配器（默认 IndexedSkillMatcher）
+            exact_names: 是否启用 Skill 名称精确命中
+            llm_fallback: 本地没有候选时是否让 LLM 在全部 Skill 中选择
+            batch_size: match_batch 中每次 LLM 调用最多包含的请求数
         """
         self.threshold = threshold
+        self.margin = margin
+        self.top_k = top_k
+        self.local_matcher = local_matcher or IndexedSkillMatcher()
+        self.exact_names = exact_names
+        self.llm_fallback = llm_fallback
+        self.batch_size = batch_size
+        # 各级判定次数
+        self.exact_hits = 0
+        self.local_hits = 0
+        self.llm_calls = 0
 
     def match(
         self,
@@ -60,15 +156,159 @@ class SemanticSkillMatcher(ISkillMatcher):
         skills: List[Skill],
         backend: ILLMBackend
     ) -> Optional[Skill]:
-        """使用语义匹配找到最合适的 Skill"""
+        """使用分级匹配找到最合适的 Skill"""
         if not skills:
             return None
 
-        # 构建技能列表描述
-        skill_descriptions = "\n".join([
-            f"- {skill.metadata.name}: {skill.metadata.description}"
-            for skill in skills
-        ])
+        skill, candidates = self._match_locally(user_input, skills)
+        if not candidates:
+            return skill
+        return self._match_with_llm(user_input, candidates, backend)
+
+    async def amatch(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend
+    ) -> Optional[Skill]:
+        """异步分级匹配：本地判定在当前线程完成，只有 LLM 调用需要等待"""
+        if not skills:
+            return None
+
+        skill, candidates = self._match_locally(user_input, skills)
+        if not candidates:
+            return skill
+
+        messages, options = self._routing_request(user_input, candidates)
+        response = await acomplete(backend, messages, options=options)
+        return self._routing_answer(response, candidates, options)
+
+    def match_topk(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend,
+        k: int = 5
+    ) -> List[Tuple[Skill, float]]:
+        """返回本地 BM25 打分最高的 k 个候选（不调用 LLM）"""
+        return self.local_matcher.match_topk(user_input, skills, backend, k)
+
+    def match_batch(
+        self,
+        user_inputs: Sequence[str],
+        skills: List[Skill],
+        backend: ILLMBackend
+    ) -> List[Optional[Skill]]:
+        """
+        批量匹配
+
+        每个请求先在本地分级判定，剩余无法判定的请求每 batch_size 个
+        合并为一次 LLM 调用，由 LLM 逐条给出答案
+        """
+        results: List[Optional[Skill]] = [None] * len(user_inputs)
+        if not skills:
+            return results
+
+        pending = []
+        for i, user_input in enumerate(user_inputs):
+            skill, candidates = self._match_locally(user_input, skills)
+            if candidates:
+                pending.append((i, candidates))
+            else:
+                results[i] = skill
+
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start:start + self.batch_size]
+            answers = self._match_batch_with_llm(
+                [(user_inputs[i], candidates) for i, candidates in chunk],
+                backend
+            )
+            for (i, _), skill in zip(chunk, answers):
+                results[i] = skill
+
+        return results
+
+    def _match_locally(
+        self,
+        user_input: str,
+        skills: Sequence[Skill]
+    ) -> Tuple[Optional[Skill], Sequence[Skill]]:
+        """
+        本地分级判定
+
+        Returns:
+            (Skill, 候选)；候选非空表示需要交给 LLM 在候选中选择
+        """
+        # 1. 名称精确命中
+        if self.exact_names:
+            skill = self._match_name(user_input, skills)
+            if skill is not None:
+                self.exact_hits += 1
+                return skill, ()
+
+        # 2. 本地检索打分
+        ranked = self.local_matcher.rank(user_input, skills, limit=max(self.top_k, 2), normalize=True)
+        if ranked and self._is_confident(ranked):
+            self.local_hits += 1
+            return ranked[0][0], ()
+
+        # 3. 候选接近或分数过低时交给 LLM
+        if ranked:
+            return None, [skill for skill, _ in ranked[:self.top_k]]
+        if self.llm_fallback:
+            return None, skills
+        return None, ()
+
+    def _is_confident(self, ranked: List[tuple[Skill, float]]) -> bool:
+        """本地最高分是否足够高且明显领先"""
+        top_score = ranked[0][1]
+        if top_score < self.threshold:
+            return False
+        if len(ranked) == 1:
+            return True
+        return (top_score - ranked[1][1]) / top_score >= self.margin
+
+    def _match_name(self, user_input: str, skills: List[Skill]) -> Optional[Skill]:
+        """用户输入中出现唯一的 Skill 名称时返回该 Skill"""
+        pattern = derive(skills, (type(self), 'name_pattern'), self._build_name_pattern)
+        if pattern is None:
+            return None
+
+        names = set(pattern.findall(normalize_text(user_input)))
+        if len(names) != 1:
+            return None
+        return find_skill(skills, names.pop())
+
+    @staticmethod
+    def _build_name_pattern(skills: List[Skill]) -> Optional[re.Pattern]:
+        """把所有 Skill 名称编译为一个正则（前后不能紧邻字母、数字或连字符）"""
+        names = sorted({skill.metadata.name for skill in skills}, key=len, reverse=True)
+        if not names:
+            return None
+        alternatives = "|".join(re.escape(name) for name in names)
+        return re.compile(rf'(?<![a-z0-9-])(?:{alternatives})(?![a-z0-9-])')
+
+    def _match_with_llm(
+        self,
+        user_input: str,
+        candidates: Sequence[Skill],
+        backend: ILLMBackend
+    ) -> Optional[Skill]:
+        """让 LLM 在候选中选择"""
+        messages, options = self._routing_request(user_input, candidates)
+        response = complete(backend, messages, options=options)
+        return self._routing_answer(response, candidates, options)
+
+    def _routing_request(
+        self,
+        user_input: str,
+        candidates: Sequence[Skill]
+    ) -> Tuple[List[Dict[str, str]], GenerationOptions]:
+        """构建路由调用的消息和生成参数"""
+        self.llm_calls += 1
+
+        # 构建技能列表描述（全量目录时在快照上只计算一次）
+        skill_descriptions = derive(candidates, (type(self), 'skill_descriptions'), self._describe_skills)
 
         # 构建匹配提示
         prompt = f"""Based on the user's request, determine which skill (if any) is most relevant.
@@ -81,19 +321,88 @@ User request: {user_input}
 Respond with ONLY the skill name (e.g., "pdf" or "docx") if a skill matches, or "none" if no skill is relevant.
 Do not include any explanation."""
 
-        # 调用 LLM 进行匹配
-        messages = [IMessage(role="user", content=prompt)]
-        response = backend.complete([message.to_llm_format() for message in messages])
+        # 输出限制为候选名称之一，支持结构化输出的后端不会生成多余内容
+        options = GenerationOptions(
+            max_tokens=self.ANSWER_MAX_TOKENS,
+            temperature=0,
+            choices=[skill.metadata.name for skill in candidates] + ["none"]
+        )
+
+        messages = [Message(role=MessageRole.USER, content=prompt)]
+        return [message.to_llm_format() for message in messages], options
+
+    @staticmethod
+    def _routing_answer(
+        response: str,
+        candidates: Sequence[Skill],
+        options: GenerationOptions
+    ) -> Optional[Skill]:
+        """解析路由调用的回答"""
+        answer = options.choice(response)
+        if answer is None or answer == "none":
+            return None
 
-        # 清理响应
-        response = response.strip().lower().replace('"', '').replace("'", "").strip()
+        # 只接受候选中的 Skill
+        return find_skill(candidates, answer)
 
-        if response == "none":
-            return None
+    def _match_batch_with_llm(
+        self,
+        items: List[Tuple[str, Sequence[Skill]]],
+        backend: ILLMBackend
+    ) -> List[Optional[Skill]]:
+        """把多个请求合并为一次 LLM 调用，每个请求只接受其候选中的 Skill"""
+        self.llm_calls += 1
+
+        # 所有请求的候选去重后列出一次
+        listed: Dict[str, Skill] = {}
+        for _, candidates in items:
+            for skill in candidates:
+                listed.setdefault(skill.metadata.name, skill)
+        skill_descriptions = self._describe_skills(list(listed.values()))
+
+        requests = "\n".join(
+            f"{number}. {' '.join(user_input.split())}"
+            for number, (user_input, _) in enumerate(items, start=1)
+        )
+
+        prompt = f"""For each numbered user request, determine which skill (if any) is most relevant.
+
+Available skills:
+{skill_descriptions}
 
-        # 查找匹配的 Skill
-        skill_map = {skill.metadata.name: skill for skill in skills}
-        return skill_map.get(response)
+User requests:
+{requests}
+
+Respond with exactly one line per request in the form "<number>: <skill name>", or "<number>: none" if no skill is relevant.
+Do not include any explanation."""
+
+        options = GenerationOptions(max_tokens=self.ANSWER_MAX_TOKENS * len(items), temperature=0)
+        messages = [Message(role=MessageRole.USER, content=prompt)]
+        response = complete(backend, [message.to_llm_format() for message in messages], options=options)
+
+        answers: Dict[int, str] = {}
+        for line in response.splitlines():
+            match = self.BATCH_ANSWER_PATTERN.match(line)
+            if match:
+                answer = match.group(2).strip().lower().replace('"', '').replace("'", "").strip()
+                answers.setdefault(int(match.group(1)), answer)
+
+        results = []
+        for number, (_, candidates) in enumerate(items, start=1):
+            answer = answers.get(number)
+            if not answer or answer == "none":
+                results.append(None)
+            else:
+                results.append(find_skill(candidates, answer))
+        return results
+
+    @staticmethod
+    def _describe_skills(skills: List[Skill]) -> str:
+        """技能列表描述"""
+        return "\n".join([
+            f"- {skill.metadata.name}: {skill.metadata.description}"
+            for skill in skills
+        ])
 
 
 class ExactSkillMatcher(ISkillMatcher):
@@ -102,21 +411,42 @@ class ExactSkillMatcher(ISkillMatcher):
 
     不使用 LLM，基于关键词匹配
 
+    关键词表编译为 Aho–Corasick 自动机，一次扫描用户输入即可为所有 Skill 打分；
+    add_keywords 之后自动机在下一次匹配时重新构建。
+    每个关键词可以带权重（(关键词, 权重) 元组），同一 Skill 的同一关键词
+    无论出现多少次只计一次；输入中出现 Skill 名称额外加 name_weight 分。
+
     遵循单一职责原则 - 只负责关键词匹配
     """
 
-    def __init__(self, keywords: dict[str, list[str]] = None):
+    def __init__(
+        self,
+        keywords: dict[str, list[Union[str, tuple[str, float]]]] = None,
+        word_boundary: bool = False,
+        name_weight: float = 10
+    ):
         """
         Args:
-            keywords: 技能名到关键词列表的映射
+            keywords: 技能名到关键词列表的映射（元素为关键词或 (关键词, 权重)）
+            word_boundary: 英文关键词是否要求完整单词匹配
+            name_weight: 名称命中的分数
         """
         self.keywords = keywords or {}
+        self.word_boundary = word_boundary
+        self.name_weight = name_weight
+        self._automaton: Optional[AhoCorasick[Dict[str, float]]] = None
+        self._build_lock = threading.Lock()
 
-    def add_keywords(self, skill_name: str, words: list[str]):
-        """添加关键词"""
+    def add_keywords(self, skill_name: str, words: list[str], weight: float = 1):
+        """添加关键词（下一次匹配时重新构建自动机）"""
         if skill_name not in self.keywords:
             self.keywords[skill_name] = []
-        self.keywords[skill_name].extend(words)
+        self.keywords[skill_name].extend(words if weight == 1 else [(word, weight) for word in words])
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """直接修改 keywords 后调用，使自动机在下一次匹配时重新构建"""
+        self._automaton = None
 
     def match(
         self,
@@ -125,32 +455,222 @@ class ExactSkillMatcher(ISkillMatcher):
         backend: ILLMBackend
     ) -> Optional[Skill]:
         """使用关键词匹配"""
-        user_input_lower = user_input.lower()
+        scores = self.score(user_input, skills)
 
-        # 计算匹配分数
+        # 计算匹配分数（同分时取靠前的 Skill）
         best_skill = None
         best_score = 0
 
         for skill in skills:
-            score = self._calculate_score(user_input_lower, skill)
+            score = scores.get(skill.metadata.name, 0)
             if score > best_score:
                 best_score = score
                 best_skill = skill
 
         return best_skill if best_score > 0 else None
 
-    def _calculate_score(self, user_input: str, skill: Skill) -> int:
-        """计算匹配分数"""
-        score = 0
+    def match_topk(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend,
+        k: int = 5
+    ) -> List[Tuple[Skill, float]]:
+        """返回关键词分数最高的 k 个候选"""
+        scores = self.score(user_input, skills)
+        ranked = [(skill, scores[skill.metadata.name]) for skill in skills if scores.get(skill.metadata.name, 0) > 0]
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked[:k]
+
+    def score(self, user_input: str, skills: Sequence[Skill]) -> Dict[str, float]:
+        """单次扫描计算各 Skill 的分数（Skill 名称 -> 分数）"""
+        text = user_input.lower()
+        scores: Dict[str, float] = {}
+
+        # 检查关键词匹配
+        seen = set()
+        for _, pattern, weights in self._get_automaton().iter_matches(text):
+            if pattern in seen:
+                continue
+            seen.add(pattern)
+            for name, weight in weights.items():
+                scores[name] = scores.get(name, 0) + weight
 
         # 检查名称匹配
-        if skill.metadata.name in user_input:
-            score += 10
+        names = derive(skills, (type(self), self.word_boundary, 'name_automaton'), self._build_name_automaton)
+        for name in {pattern for _, pattern, _ in names.iter_matches(text)}:
+            scores[name] = scores.get(name, 0) + self.name_weight
+
+        return scores
+
+    def _get_automaton(self) -> AhoCorasick[Dict[str, float]]:
+        """获取关键词自动机（关键词变化后重新构建）"""
+        automaton = self._automaton
+        if automaton is None:
+            with self._build_lock:
+                automaton = self._automaton
+                if automaton is None:
+                    automaton = self._build_keyword_automaton()
+                    self._automaton = automaton
+        return automaton
+
+    def _build_keyword_automaton(self) -> AhoCorasick[Dict[str, float]]:
+        """把关键词表编译为自动机，值为 {Skill 名称: 权重}"""
+        table: Dict[str, Dict[str, float]] = {}
+        for skill_name, words in self.keywords.items():
+            for word in words:
+                keyword, weight = (word, 1) if isinstance(word, str) else word
+                weights = table.setdefault(keyword.lower(), {})
+                weights[skill_name] = weights.get(skill_name, 0) + weight
+
+        automaton = AhoCorasick(word_boundary=self.word_boundary)
+        for keyword, weights in table.items():
+            automaton.add(keyword, weights)
+        automaton.build()
+        return automaton
+
+    def _build_name_automaton(self, skills: Sequence[Skill]) -> AhoCorasick[None]:
+        """把 Skill 名称编译为自动机"""
+        automaton = AhoCorasick(word_boundary=self.word_boundary)
+        for skill in skills:
+            automaton.add(skill.metadata.name, None)
+        automaton.build()
+        return automaton
 
-        # 检查关键词匹配
-        keywords = self.keywords.get(skill.metadata.name, [])
-        for keyword in keywords:
-            if keyword.lower() in user_input:
-                score += 1
 
-        return score
+class IndexedSkillMatcher(ISkillMatcher):
+    """
+    BM25 倒排索引匹配器
+
+    不使用 LLM，在本地对 Skill 的名称和描述（可选正文标题）建立倒排索引，
+    按 BM25 分数排序候选；中文按字符二元组切分。
+    默认不索引正文标题：正文是延迟加载的，索引标题会在首次路由时读取所有 SKILL.md。
+
+    Skill 集合变化时只对新增、替换和删除的 Skill 增量更新索引
+    （以 Skill 对象身份判断是否变化，传入目录快照时同一快照只检查一次；
+    传入普通列表时每次调用都要逐个比对，开销为 O(N)，应尽量传入快照）。
+    同步和检索在同一把锁内完成：针对不同快照的并发请求（如热重载期间）
+    不会在一个请求同步之后、检索之前被另一个请求改写索引。
+    传入子集快照（parent 不为空）时索引保持为完整目录，只在结果中过滤，
+    因此 IDF 始终按完整目录计算，不同子集的请求也不会互相触发重建。
+
+    遵循单一职责原则 - 只负责本地检索打分
+    """
+
+    HEADING_PATTERN = re.compile(r'^#{1,6}[ \t]+(.+?)[ \t#]*$', re.MULTILINE)
+
+    def __init__(
+        self,
+        min_score: float = 0.0,
+        name_weight: int = 3,
+        index_headings: bool = False,
+        k1: float = 1.2,
+        b: float = 0.75
+    ):
+        """
+        Args:
+            min_score: 最低 BM25 分数，低于该分数视为不匹配
+            name_weight: 名称词项的权重（重复次数）
+            index_headings: 是否索引正文中的 Markdown 标题（会读取所有延迟加载的正文）
+            k1: BM25 词频饱和参数
+            b: BM25 文档长度归一化参数
+        """
+        self.min_score = min_score
+        self.name_weight = name_weight
+        self.index_headings = index_headings
+        self._index = BM25Index(k1=k1, b=b)
+        # Skill 名称 -> 已索引的 Skill 对象
+        self._indexed: Dict[str, Skill] = {}
+        self._synced: Optional[Sequence[Skill]] = None
+        self._sync_lock = threading.RLock()
+
+    def match(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend
+    ) -> Optional[Skill]:
+        """返回 BM25 分数最高的 Skill"""
+        ranked = self.rank(user_input, skills, limit=1)
+        if ranked and ranked[0][1] > self.min_score:
+            return ranked[0][0]
+        return None
+
+    def match_topk(
+        self,
+        user_input: str,
+        skills: List[Skill],
+        backend: ILLMBackend,
+        k: int = 5
+    ) -> List[Tuple[Skill, float]]:
+        """返回 BM25 分数最高的 k 个候选"""
+        return [(skill, score) for skill, score in self.rank(user_input, skills, k) if score > self.min_score]
+
+    def rank(
+        self,
+        user_input: str,
+        skills: Sequence[Skill],
+        limit: int = 5,
+        normalize: bool = False
+    ) -> List[tuple[Skill, float]]:
+        """
+        按 BM25 分数排序候选 Skill
+
+        Args:
+            normalize: 是否把分数除以查询的参照分数（见 BM25Index.reference_score），
+                归一化后的分数不超过 1
+
+        Returns:
+            (Skill, 分数) 列表，按分数降序
+        """
+        # 子集快照（如类别）在完整目录的索引上检索后过滤，避免为每个子集重建共享索引
+        universe = root_catalog(skills)
+        tokens = tokenize(user_input)
+        with self._sync_lock:
+            self.sync(universe)
+            indexed = self._indexed
+            if universe is skills:
+                hits = self._index.search(tokens, limit)
+            else:
+                hits = [hit for hit in self._index.search(tokens, len(indexed)) if hit[0] in skills][:limit]
+            scale = self._index.reference_score(tokens) if normalize and hits else None
+        ranked = [(indexed[name], score) for name, score in hits if name in indexed]
+        if scale:
+            ranked = [(skill, min(1.0, score / scale)) for skill, score in ranked]
+        return ranked
+
+    def sync(self, skills: Sequence[Skill]) -> None:
+        """
+        使索引与 Skill 集合一致（只处理发生变化的 Skill）
+
+        快照不可变，同一快照只检查一次；普通列表可能被原地修改，
+        每次调用都要与已索引的 Skill 逐个比对（O(N)）
+        """
+        if skills is self._synced:
+            return
+
+        with self._sync_lock:
+            if skills is self._synced:
+                return
+
+            indexed = dict(self._indexed)
+            current = {skill.metadata.name: skill for skill in skills}
+            for name in indexed.keys() - current.keys():
+                self._index.remove(name)
+                del indexed[name]
+            for name, skill in current.items():
+                if indexed.get(name) is not skill:
+                    self._index.add(name, self._document_tokens(skill))
+                    indexed[name] = skill
+
+            self._indexed = indexed
+            self._synced = skills if isinstance(skills, CatalogSnapshot) else None
+
+    def _document_tokens(self, skill: Skill) -> List[str]:
+        """Skill 的索引词项：名称（加权）、描述和正文标题"""
+        tokens = tokenize(skill.metadata.name) * self.name_weight
+        tokens.extend(tokenize(skill.metadata.description))
+        if self.index_headings:
+            headings = self.HEADING_PATTERN.findall(skill.instructions or '')
+            tokens.extend(tokenize(' '.join(headings)))
+        return tokens
@@ -0,0 +1,233 @@
+"""
+Skill 分类服务 - 单一职责原则
+
+只负责把 Skill 目录划分为类别：优先使用 frontmatter metadata 中声明的类别，
+未声明的 Skill 按描述文本自动聚类
+"""
+import heapq
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from ..entities.skill import Skill
+from ..entities.catalog import CatalogSnapshot
+from .bm25_index import tokenize
+
+
+@dataclass(frozen=True)
+class SkillCategory:
+    """
+    Skill 类别
+
+    skills 为类别内 Skill 组成的快照，派生数据（名称正则、描述列表等）按类别缓存；
+    keywords 为类别内最具代表性的词，用于在路由提示中概括类别
+    """
+    name: str
+    skills: CatalogSnapshot
+    keywords: Tuple[str, ...] = ()
+    declared: bool = False
+
+    def summary(self, max_names: int = 5) -> str:
+        """一行概括：关键词和部分 Skill 名称"""
+        names = [skill.metadata.name for skill in self.skills[:max_names]]
+        if len(self.skills) > max_names:
+            names.append(f"+{len(self.skills) - max_names} more")
+        parts = []
+        if self.keywords:
+            parts.append(f"topics: {', '.join(self.keywords)}")
+        parts.append(f"skills: {', '.join(names)}")
+        return "; ".join(parts)
+
+
+def build_categories(
+    skills: Sequence[Skill],
+    category_key: str = 'category',
+    max_size: Optional[int] = None,
+    keywords: int = 4
+) -> List[SkillCategory]:
+    """
+    划分类别
+
+    类别数和每个类别的大小都约为 sqrt(N)，因此"先选类别、再选 Skill"
+    两步的提示长度都与 sqrt(N) 成正比。
+
+    Args:
+        skills: Skill 集合
+        category_key: frontmatter metadata 中声明类别的字段名
+        max_size: 单个类别的最大 Skill 数（默认 ceil(sqrt(N))，超出时再细分）
+        keywords: 每个类别保留的关键词数
+
+    Returns:
+        类别列表（声明的类别在前，按名称排序）
+    """
+    # 类别快照指向完整目录，匹配器可以复用完整目录的索引
+    parent = skills if isinstance(skills, CatalogSnapshot) else None
+    skills = list(skills)
+    if not skills:
+        return []
+    if max_size is None:
+        max_size = math.ceil(math.sqrt(len(skills)))
+    max_size = max(max_size, 1)
+
+    vectors, df = _weighted_vectors(skills)
+    # 过于常见的词（如 "use"、"when"）和单字母不适合概括类别
+    common = {term for term, count in df.items() if count > max(2, len(skills) // 4) or len(term) < 2}
+    declared: Dict[str, List[int]] = {}
+    undeclared: List[int] = []
+    for i, skill in enumerate(skills):
+        value = skill.metadata.metadata.get(category_key)
+        if isinstance(value, str) and value.strip():
+            declared.setdefault(value.strip(), []).append(i)
+        else:
+            undeclared.append(i)
+
+    categories = []
+    for name in sorted(declared):
+        members = declared[name]
+        groups = _cluster(members, vectors, max_size)
+        for number, group in enumerate(groups, start=1):
+            label = name if len(groups) == 1 else f"{name}-{number}"
+            categories.append(_make_category(label, group, skills, vectors, keywords, common, parent, declared=True))
+
+    if undeclared:
+        groups = _cluster(undeclared, vectors, max_size)
+        taken = {category.name for category in categories}
+        number = 0
+        for group in groups:
+            number += 1
+            while f"group-{number}" in taken:
+                number += 1
+            categories.append(_make_category(f"group-{number}", group, skills, vectors, keywords, common, parent))
+
+    return categories
+
+
+def _make_category(
+    name: str,
+    members: List[int],
+    skills: List[Skill],
+    vectors: List[Dict[str, float]],
+    keywords: int,
+    common: Set[str],
+    parent: Optional[CatalogSnapshot] = None,
+    declared: bool = False
+) -> SkillCategory:
+    """根据成员构建类别，关键词取质心权重最高的非常见词"""
+    centroid = _centroid(members, vectors)
+    top = heapq.nlargest(
+        keywords,
+        ((term, weight) for term, weight in centroid.items() if term not in common),
+        key=lambda item: (item[1], item[0])
+    )
+    return SkillCategory(
+        name=name,
+        skills=CatalogSnapshot((skills[i] for i in members), parent=parent),
+        keywords=tuple(term for term, _ in top),
+        declared=declared
+    )
+
+
+def _weighted_vectors(skills: List[Skill]) -> Tuple[List[Dict[str, float]], Counter]:
+    """名称和描述的 TF-IDF 向量（L2 归一化）及文档频率"""
+    counts = [
+        Counter(tokenize(f"{skill.metadata.name.replace('-', ' ')} {skill.metadata.description}"))
+        for skill in skills
+    ]
+    df = Counter(term for count in counts for term in count)
+    n = len(skills)
+
+    vectors = []
+    for count in counts:
+        vector = {
+            term: (1 + math.log(tf)) * math.log(1 + n / df[term])
+            for term, tf in count.items()
+        }
+        vectors.append(_normalize(vector))
+    return vectors, df
+
+
+def _cluster(members: List[int], vectors: List[Dict[str, float]], max_size: int) -> List[List[int]]:
+    """把成员聚为若干组，每组不超过 max_size（k-means 结果中过大的组按顺序切分）"""
+    groups = []
+    for group in _kmeans(members, vectors, math.ceil(len(members) / max_size)):
+        groups.extend(group[start:start + max_size] for start in range(0, len(group), max_size))
+    return groups
+
+
+def _kmeans(members: List[int], vectors: List[Dict[str, float]], k: int, iterations: int = 10) -> List[List[int]]:
+    """
+    球面 k-means 聚类（确定性）
+
+    以最远点策略选初始中心；打分时通过质心的倒排表只访问共享词，
+    大规模目录下也只需线性于非零项的时间
+    """
+    if k <= 1 or len(members) <= 1:
+        return [list(members)]
+    k = min(k, len(members))
+
+    # 最远点初始化：第一个中心为第一个成员，之后每次选与已有中心最不相似的成员
+    centers = [members[0]]
+    chosen = {members[0]}
+    closest = {i: _dot(vectors[i], vectors[members[0]]) for i in members}
+    while len(centers) < k:
+        candidate = min((i for i in members if i not in chosen), key=lambda i: (closest[i], i))
+        centers.append(candidate)
+        chosen.add(candidate)
+        for i in members:
+            closest[i] = max(closest[i], _dot(vectors[i], vectors[candidate]))
+    centroids = [dict(vectors[i]) for i in centers]
+
+    assignment: Dict[int, int] = {}
+    for _ in range(iterations):
+        postings: Dict[str, List[Tuple[int, float]]] = {}
+        for c, centroid in enumerate(centroids):
+            for term, weight in centroid.items():
+                postings.setdefault(term, []).append((c, weight))
+
+        changed = False
+        for i in members:
+            scores = [0.0] * len(centroids)
+            for term, weight in vectors[i].items():
+                for c, centroid_weight in postings.get(term, ()):
+                    scores[c] += weight * centroid_weight
+            best = max(range(len(centroids)), key=lambda c: (scores[c], -c))
+            if assignment.get(i) != best:
+                assignment[i] = best
+                changed = True
+
+        if not changed:
+            break
+        centroids = [
+            _centroid([i for i in members if assignment[i] == c], vectors)
+            for c in range(len(centroids))
+        ]
+
+    groups: Dict[int, List[int]] = {}
+    for i in members:
+        groups.setdefault(assignment[i], []).append(i)
+    return [groups[c] for c in sorted(groups)]
+
+
+def _centroid(members: List[int], vectors: List[Dict[str, float]]) -> Dict[str, float]:
+    """成员向量之和（归一化）"""
+    total: Dict[str, float] = {}
+    for i in members:
+        for term, weight in vectors[i].items():
+            total[term] = total.get(term, 0.0) + weight
+    return _normalize(total)
+
+
+def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+    """L2 归一化"""
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    if not norm:
+        return vector
+    return {term: weight / norm for term, weight in vector.items()}
+
+
+def _dot(a: Dict[str, float], b: Dict[str, float]) -> float:
+    """稀疏向量点积"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(term, 0.0) for term, weight in a.items())
@@ -0,0 +1,120 @@
+"""
+LRU + TTL 缓存 - 单一职责原则
+
+只负责按键保存带过期时间的值（内存 LRU，可选持久化存储），
+不关心值的含义；路由缓存和响应缓存共用
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class TTLCache:
+    """
+    带过期时间的 LRU 缓存
+
+    条目为 (值, 过期时间)：内存中超出 max_entries 时淘汰最久未访问的条目；
+    提供 store 时写入同时落盘，内存未命中时从 store 读取并回填内存。
+    store 只需提供 get(key) / put(key, value, expires_at) / clear()
+    （如 IRoutingStore、IResponseStore 的实现）。
+
+    lookup 不计数，由调用方在确认命中与否后调用 record，
+    因为"命中"的含义可能依赖值本身（如路由缓存中的 Skill 是否仍存在）
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        store: Optional[Any] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            max_entries: 内存中最多保存的条目数
+            ttl: 有效期（秒），None 表示永不过期
+            store: 持久化存储（可选）
+            clock: 时间函数（返回 Unix 时间戳）
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.store = store
+        self.clock = clock
+        # 键 -> (值, 过期时间)
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: str) -> Optional[Tuple[Any]]:
+        """
+        查找条目
+
+        Returns:
+            (值,)；未命中或已过期时返回 None（值本身可以是 None）
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._entries.move_to_end(key)
+                    return (entry[0],)
+                del self._entries[key]
+
+        if self.store is not None:
+            entry = self.store.get(key)
+            if entry is not None and entry[1] > now:
+                self._put_memory(key, entry)
+                return (entry[0],)
+        return None
+
+    def remember(self, key: str, value: Any) -> None:
+        """写入条目（同时写入持久化存储）"""
+        expires_at = self.clock() + self.ttl if self.ttl is not None else float('inf')
+        entry = (value, expires_at)
+        self._put_memory(key, entry)
+        if self.store is not None:
+            self.store.put(key, *entry)
+
+    def record(self, hit: bool) -> None:
+        """记录一次命中或未命中"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def clear(self) -> None:
+        """清空缓存（计数器保留）"""
+        with self._lock:
+            self._entries.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """缓存统计信息"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / total if total else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _put_memory(self, key: str, entry: Tuple[Any, float]) -> None:
+        """写入内存 LRU，超出容量时淘汰最久未访问的条目"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
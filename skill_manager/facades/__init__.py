@@ -1,4 +1,5 @@
 """Facades - 外观模式（简化使用）"""
 from .skill_manager import SkillManager
+from .async_skill_manager import AsyncSkillManager
 
-__all__ = ['SkillManager']
+__all__ = ['SkillManager', 'AsyncSkillManager']
@@ -0,0 +1,68 @@
+"""
+异步 SkillManager 外观类 - 外观模式
+
+在 SkillManager 的基础上提供 asyncio 执行路径
+"""
+from typing import Dict, List, Optional
+
+from ..core.entities.skill import Skill
+from ..core.interfaces.llm_backend import ILLMBackend, acomplete
+from .skill_manager import SkillManager
+
+
+class AsyncSkillManager(SkillManager):
+    """
+    异步 Skill 管理器
+
+    加载、热重载等管理操作与 SkillManager 相同（同步，通常只在启动时执行）；
+    请求路径提供 async 版本：路由只在需要 LLM 时等待 backend.acomplete，
+    生成调用使用后端的原生异步客户端，因此一个事件循环即可同时处理大量请求，
+    而不必为每个进行中的 LLM 调用占用一个线程。
+
+    使用示例：
+        manager = AsyncSkillManager()
+        backend = OpenAIBackend()
+        response = await manager.aexecute("帮我处理 PDF", backend)
+    """
+
+    async def amatch_skill(self, user_input: str, backend: ILLMBackend) -> Optional[Skill]:
+        """异步匹配最合适的 Skill"""
+        return await self._matcher.amatch(
+            user_input=user_input,
+            skills=self._catalog,
+            backend=backend
+        )
+
+    async def aexecute(
+        self,
+        user_input: str,
+        backend: ILLMBackend,
+        auto_match: bool = True,
+        skill_name: Optional[str] = None,
+        include_references: bool = False,
+        conversation_history: Optional[List[Dict]] = None
+    ) -> str:
+        """异步执行用户请求"""
+        return await self._executor.aexecute(
+            user_input=user_input,
+            backend=backend,
+            skills=self._catalog,
+            conversation_history=self._to_messages(conversation_history),
+            auto_match=auto_match,
+            skill_name=skill_name,
+            include_references=include_references
+        )
+
+    async def aexecute_with_tools(
+        self,
+        user_input: str,
+        backend: ILLMBackend,
+        additional_tools: Optional[List[Dict]] = None,
+        conversation_history: Optional[List[Dict]] = None,
+        top_k: Optional[int] = None
+    ) -> str:
+        """异步使用 function calling 执行"""
+        llm_messages, system_prompt, tools = self._tool_request(
+            user_input, additional_tools, conversation_history, top_k
+        )
+        return await acomplete(backend, llm_messages, system_prompt=system_prompt, tools=tools)
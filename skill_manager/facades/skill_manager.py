@@ -3,16 +3,24 @@ SkillManager 外观类 - 外观模式
 
 提供简化的 API，内部使用依赖注入的 SOLID 架构
 """
+import os
+import logging
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Iterator, Tuple
 
 from ..core.entities.skill import Skill, SkillMetadata
+from ..core.entities.catalog import CatalogSnapshot
 from ..core.entities.message import Message, MessageRole
 from ..core.interfaces.llm_backend import ILLMBackend
+from ..core.interfaces.skill_watcher import ISkillWatcher, SkillChangeSet
 from ..core.services.skill_loader import ISkillLoader, FilesystemSkillLoader
 from ..core.services.skill_matcher import ISkillMatcher, SemanticSkillMatcher
 from ..core.services.prompt_builder import IPromptBuilder, SystemPromptBuilder, ToolCallPromptBuilder
-from ..core.services.skill_executor import ISkillExecutor, SkillExecutor, ToolCallExecutor
+from ..core.services.skill_executor import ISkillExecutor, SkillExecutor
+from ..infrastructure.watchers import create_skill_watcher
+
+logger = logging.getLogger(__name__)
 
 
 class SkillManager:
@@ -32,6 +40,9 @@ class SkillManager:
         response = manager.execute("帮我处理 PDF", backend)
     """
 
+    # execute_with_tools 默认发送的 Skill 工具数上限
+    DEFAULT_TOOL_TOP_K = 8
+
     # 默认的 Skill 搜索目录
     DEFAULT_SKILL_DIRS = [
         "skills",
@@ -64,8 +75,20 @@ class SkillManager:
             matcher=self._matcher,
             prompt_builder=self._prompt_builder
         )
+        # 函数调用模式的构建器（保存本地排序索引，跨调用复用）
+        self._tool_builder = ToolCallPromptBuilder(top_k=self.DEFAULT_TOOL_TOP_K)
+
+        # 写时复制：每次变更都构建新的不可变快照后整体替换，读取方无需加锁
+        self._catalog = CatalogSnapshot()
+        # Skill 目录（绝对路径）-> Skill 名称，仅供写入方使用
+        self._dir_index: Dict[str, str] = {}
+        self._write_lock = threading.RLock()
+        # 已加载过的 Skills 根目录，作为热重载的默认监听目录
+        self._base_dirs: List[Path] = []
 
-        self._skills: Dict[str, Skill] = {}
+        self._watcher: Optional[ISkillWatcher] = None
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
 
         if auto_load:
             self.load_default_skills()
@@ -91,24 +114,154 @@ class SkillManager:
         """加载单个 Skill"""
         skill_dir = Path(skill_dir)
         skill = self._loader.load_skill(skill_dir)
-        self._skills[skill.metadata.name] = skill
+        self._publish(added=[skill])
         return skill
 
     def load_skills_from_directory(self, base_dir: str | Path) -> List[Skill]:
         """从目录加载所有 Skills"""
         base_dir = Path(base_dir)
         skills = self._loader.load_skills_from_directory(base_dir)
-        for skill in skills:
-            self._skills[skill.metadata.name] = skill
+        self._publish(added=skills)
+        with self._write_lock:
+            if base_dir not in self._base_dirs:
+                self._base_dirs.append(base_dir)
         return skills
 
+    # ========================================================================
+    # 热重载方法
+    # ========================================================================
+
+    def unload_skill(self, name: str) -> bool:
+        """
+        卸载指定名称的 Skill
+
+        Returns:
+            是否存在并已卸载
+        """
+        with self._write_lock:
+            skill = self._catalog.get(name)
+            if skill is None:
+                return False
+            self._publish(removed_dirs=[skill.path])
+            return True
+
+    def apply_skill_changes(self, changes: SkillChangeSet) -> None:
+        """
+        增量应用 Skill 目录变化
+
+        只重新加载新增和修改的 Skill，删除的 Skill 被移出目录；
+        重新加载失败的 Skill 保留旧版本
+        """
+        reloaded = []
+        for skill_dir in [*changes.added, *changes.modified]:
+            try:
+                reloaded.append(self._loader.load_skill(Path(skill_dir)))
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to reload skill from {skill_dir}: {e}")
+
+        self._publish(added=reloaded, removed_dirs=changes.removed)
+        logger.info(
+            f"🔄 Skills reloaded: {len(reloaded)} updated, {len(changes.removed)} removed"
+        )
+
+    def start_watching(
+        self,
+        directories: Optional[Iterable[str | Path]] = None,
+        interval: float = 1.0,
+        prefer_inotify: bool = True
+    ) -> None:
+        """
+        在后台线程中监听 Skills 目录并自动增量重新加载
+
+        Args:
+            directories: 监听的根目录（默认为已加载过的目录）
+            interval: 轮询间隔 / 事件等待超时（秒）
+            prefer_inotify: 平台支持时使用 inotify
+        """
+        if self._watch_thread is not None:
+            return
+
+        if directories is None:
+            with self._write_lock:
+                directories = list(self._base_dirs)
+        self._watcher = create_skill_watcher(directories, prefer_inotify=prefer_inotify)
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop,
+            args=(self._watcher, interval),
+            name="skill-watcher",
+            daemon=True
+        )
+        self._watch_thread.start()
+
+    def stop_watching(self) -> None:
+        """停止后台监听"""
+        if self._watch_thread is None:
+            return
+        self._watch_stop.set()
+        self._watcher.close()
+        self._watch_thread.join()
+        self._watch_thread = None
+        self._watcher = None
+
+    def _watch_loop(self, watcher: ISkillWatcher, interval: float) -> None:
+        """后台监听循环"""
+        while not self._watch_stop.is_set():
+            try:
+                changes = watcher.poll(timeout=interval)
+                if changes and not self._watch_stop.is_set():
+                    self.apply_skill_changes(changes)
+            except Exception as e:
+                logger.error(f"❌ Skill watcher error: {e}")
+                self._watch_stop.wait(interval)
+
+    def _publish(
+        self,
+        added: Iterable[Skill] = (),
+        removed_dirs: Iterable[str | Path] = ()
+    ) -> None:
+        """
+        构建新的目录快照并原子替换
+
+        先移除 removed_dirs 以及 added 所在目录原有的 Skill（处理删除和改名），
+        再加入新的 Skill；同名 Skill 来自其他目录时不会被误删
+        """
+        added = list(added)
+        with self._write_lock:
+            skills = dict(self._catalog.names)
+            dir_index = dict(self._dir_index)
+
+            stale_dirs = [*removed_dirs, *(skill.path for skill in added)]
+            for key in {self._dir_key(d) for d in stale_dirs}:
+                name = dir_index.pop(key, None)
+                current = skills.get(name) if name else None
+                if current is not None and self._dir_key(current.path) == key:
+                    del skills[name]
+
+            for skill in added:
+                skills[skill.metadata.name] = skill
+                dir_index[self._dir_key(skill.path)] = skill.metadata.name
+
+            self._dir_index = dir_index
+            self._catalog = CatalogSnapshot(skills.values(), version=self._catalog.version + 1)
+
+    @staticmethod
+    def _dir_key(path: str | Path) -> str:
+        """Skill 目录的规范化键"""
+        return os.path.abspath(path)
+
+    @property
+    def catalog(self) -> CatalogSnapshot:
+        """当前的 Skill 目录快照（不可变，可在任意线程中无锁读取）"""
+        return self._catalog
+
     def get_skill(self, name: str) -> Optional[Skill]:
         """获取指定名称的 Skill"""
-        return self._skills.get(name)
+        return self._catalog.get(name)
 
     def list_skills(self) -> List[SkillMetadata]:
         """列出所有已加载的 Skills 元数据"""
-        return [s.metadata for s in self._skills.values()]
+        return list(self._catalog.metadata)
 
     # ========================================================================
     # 执行方法
@@ -124,21 +277,37 @@ class SkillManager:
         conversation_history: Optional[List[Dict]] = None
     ) -> str:
         """执行用户请求"""
-        history = None
-        if conversation_history:
-            history = [
-                Message(
-                    role=MessageRole(msg["role"]),
-                    content=msg["content"]
-                )
-                for msg in conversation_history
-            ]
-
         return self._executor.execute(
             user_input=user_input,
             backend=backend,
-            skills=list(self._skills.values()),
-            conversation_history=history,
+            skills=self._catalog,
+            conversation_history=self._to_messages(conversation_history),
+            auto_match=auto_match,
+            skill_name=skill_name,
+            include_references=include_references
+        )
+
+    def execute_stream(
+        self,
+        user_input: str,
+        backend: ILLMBackend,
+        auto_match: bool = True,
+        skill_name: Optional[str] = None,
+        include_references: bool = False,
+        conversation_history: Optional[List[Dict]] = None
+    ) -> Iterator[str]:
+        """
+        流式执行用户请求，逐段返回 LLM 响应
+
+        使用示例：
+            for chunk in manager.execute_stream("合并这两个 PDF", backend):
+                print(chunk, end="", flush=True)
+        """
+        return self._executor.execute_stream(
+            user_input=user_input,
+            backend=backend,
+            skills=self._catalog,
+            conversation_history=self._to_messages(conversation_history),
             auto_match=auto_match,
             skill_name=skill_name,
             include_references=include_references
@@ -149,31 +318,51 @@ class SkillManager:
         user_input: str,
         backend: ILLMBackend,
         additional_tools: Optional[List[Dict]] = None,
-        conversation_history: Optional[List[Dict]] = None
+        conversation_history: Optional[List[Dict]] = None,
+        top_k: Optional[int] = None
     ) -> str:
-        """使用 function calling 执行"""
-        tool_builder = ToolCallPromptBuilder()
-        tool_executor = ToolCallExecutor(tool_builder)
-
-        history = None
-        if conversation_history:
-            history = [
-                Message(
-                    role=MessageRole(msg["role"]),
-                    content=msg["content"]
-                )
-                for msg in conversation_history
-            ]
-
-        tools = tool_builder.build_tools_definition(list(self._skills.values()))
+        """
+        使用 function calling 执行
+
+        只发送与用户输入最相关的 top_k 个 Skill 工具（默认 DEFAULT_TOOL_TOP_K）
+        以及 additional_tools
+        """
+        llm_messages, system_prompt, tools = self._tool_request(
+            user_input, additional_tools, conversation_history, top_k
+        )
+        return backend.complete(llm_messages, system_prompt=system_prompt, tools=tools)
+
+    def _tool_request(
+        self,
+        user_input: str,
+        additional_tools: Optional[List[Dict]],
+        conversation_history: Optional[List[Dict]],
+        top_k: Optional[int]
+    ) -> Tuple[List[Dict], Optional[str], List[Dict]]:
+        """构建函数调用模式的消息、系统提示和 tools"""
+        tool_builder = self._tool_builder
+        catalog = self._catalog
+
+        tools = tool_builder.build_tools_definition(catalog, user_input, top_k)
         if additional_tools:
             tools.extend(additional_tools)
 
-        system_prompt = tool_builder.build_system_prompt(None, list(self._skills.values()))
-        messages = tool_builder.build_messages(user_input, history)
-        llm_messages = [msg.to_llm_format() for msg in messages]
+        system_prompt = tool_builder.build_system_prompt(None, catalog)
+        messages = tool_builder.build_messages(user_input, self._to_messages(conversation_history))
+        return [msg.to_llm_format() for msg in messages], system_prompt, tools
 
-        return backend.complete(llm_messages, system_prompt=system_prompt, tools=tools)
+    @staticmethod
+    def _to_messages(conversation_history: Optional[List[Dict]]) -> Optional[List[Message]]:
+        """把字典形式的对话历史转换为 Message 列表"""
+        if not conversation_history:
+            return None
+        return [
+            Message(
+                role=MessageRole(msg["role"]),
+                content=msg["content"]
+            )
+            for msg in conversation_history
+        ]
 
     # ========================================================================
     # 便捷方法
@@ -183,7 +372,7 @@ class SkillManager:
         """生成包含所有 Skills 描述的系统提示"""
         prompt = self._prompt_builder.build_system_prompt(
             skill=None,
-            all_skills=list(self._skills.values())
+            all_skills=self._catalog
         )
         return prompt or ""
 
@@ -191,6 +380,28 @@ class SkillManager:
         """使用 LLM 匹配最合适的 Skill"""
         return self._matcher.match(
             user_input=user_input,
-            skills=list(self._skills.values()),
+            skills=self._catalog,
+            backend=backend
+        )
+
+    def match_skill_topk(
+        self,
+        user_input: str,
+        backend: ILLMBackend,
+        k: int = 5
+    ) -> List[Tuple[Skill, float]]:
+        """返回得分最高的 k 个候选 Skill 及分数"""
+        return self._matcher.match_topk(
+            user_input=user_input,
+            skills=self._catalog,
+            backend=backend,
+            k=k
+        )
+
+    def match_skills(self, user_inputs: List[str], backend: ILLMBackend) -> List[Optional[Skill]]:
+        """批量匹配（LLM 匹配器会把多个请求合并为一次调用）"""
+        return self._matcher.match_batch(
+            user_inputs=user_inputs,
+            skills=self._catalog,
             backend=backend
         )
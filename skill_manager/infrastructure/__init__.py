@@ -1,4 +1,6 @@
 """Infrastructure - 基础设施层"""
 from .config.logging_config import setup_logging, get_logger
+from .cache import SqliteCatalogCache, SqliteRoutingStore, SqliteResponseStore
+from .vectors import NpyVectorStore
 
-__all__ = ['setup_logging', 'get_logger']
+__all__ = ['setup_logging', 'get_logger', 'SqliteCatalogCache', 'SqliteRoutingStore', 'SqliteResponseStore', 'NpyVectorStore']
@@ -2,10 +2,12 @@
 Anthropic Claude 后端实现
 """
 import os
+import json
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
-from ...core.interfaces.llm_backend import ILLMBackend, IMessage, IModelConfig
+from ...core.entities.prompt import SegmentedPrompt
+from ...core.interfaces.llm_backend import ILLMBackend, IMessage, IModelConfig, GenerationOptions
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +16,18 @@ class AnthropicBackend(ILLMBackend):
     """
     Anthropic Claude 后端实现
 
+    结构化输出通过强制调用单个工具实现：工具的 input_schema 即输出的 JSON Schema，
+    返回值为工具参数序列化后的 JSON。
+    分段系统提示（SegmentedPrompt）的稳定前缀标记为 prompt caching 断点
+
     遵循依赖倒置原则 - 实现 ILLMBackend 接口
     """
 
+    DEFAULT_MAX_TOKENS = 4096
+
+    # 结构化输出使用的工具名
+    RESPONSE_TOOL = "respond"
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -34,10 +45,9 @@ class AnthropicBackend(ILLMBackend):
         except ImportError:
             raise ImportError("请安装 anthropic: pip install anthropic")
 
+        self._anthropic = anthropic
         self.model = model
-        self.client = anthropic.Anthropic(
-            api_key=api_key or os.getenv("ANTHROPIC_API_KEY")
-        )
+        self._create_clients(api_key)
 
         logger.info(f"✅ Anthropic backend initialized: model={self.model}")
 
@@ -45,33 +55,133 @@ class AnthropicBackend(ILLMBackend):
         self,
         messages: List[Dict[str, str]],
         system_prompt: Optional[str] = None,
-        tools: Optional[List[Dict[str, Any]]] = None
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
     ) -> str:
         """发送消息并获取响应"""
+        kwargs = self._request_kwargs(messages, system_prompt, tools, options)
+
+        logger.debug(f"📤 Sending {len(messages)} messages to Anthropic ({self.model})")
+
+        response = self.client.messages.create(**kwargs)
+        result = self._response_text(response, "tool_choice" in kwargs)
+
+        logger.debug(f"📥 Received response from Anthropic: {len(result)} characters")
+        return result
+
+    def complete_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> Iterator[str]:
+        """流式发送消息，逐段返回文本增量（结构化输出时一次性返回）"""
+        kwargs = self._request_kwargs(messages, system_prompt, tools, options)
+        if "tool_choice" in kwargs:
+            yield self._response_text(self.client.messages.create(**kwargs), True)
+            return
+
+        logger.debug(f"📤 Streaming {len(messages)} messages to Anthropic ({self.model})")
+
+        with self.client.messages.stream(**kwargs) as stream:
+            yield from stream.text_stream
+
+    async def acomplete(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> str:
+        """使用异步客户端发送消息并获取响应"""
+        kwargs = self._request_kwargs(messages, system_prompt, tools, options)
+
+        logger.debug(f"📤 Sending {len(messages)} messages to Anthropic ({self.model}, async)")
+
+        response = await self.async_client.messages.create(**kwargs)
+        result = self._response_text(response, "tool_choice" in kwargs)
+
+        logger.debug(f"📥 Received response from Anthropic: {len(result)} characters")
+        return result
+
+    def _request_kwargs(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str],
+        tools: Optional[List[Dict[str, Any]]],
+        options: Optional[GenerationOptions]
+    ) -> Dict[str, Any]:
+        """构建 Messages API 请求参数"""
+        options = options or GenerationOptions()
         kwargs = {
             "model": self.model,
-            "max_tokens": 4096,
+            "max_tokens": options.max_tokens or self.DEFAULT_MAX_TOKENS,
             "messages": messages
         }
         if system_prompt:
-            kwargs["system"] = system_prompt
+            kwargs["system"] = self._system_blocks(system_prompt)
         if tools:
             kwargs["tools"] = tools
+        if options.temperature is not None:
+            kwargs["temperature"] = options.temperature
+        if options.stop:
+            kwargs["stop_sequences"] = options.stop
 
-        logger.debug(f"📤 Sending {len(messages)} messages to Anthropic ({self.model})")
+        schema = options.response_schema()
+        if schema is not None:
+            kwargs["tools"] = list(tools or []) + [{
+                "name": self.RESPONSE_TOOL,
+                "description": "Return the final answer.",
+                "input_schema": schema
+            }]
+            kwargs["tool_choice"] = {"type": "tool", "name": self.RESPONSE_TOOL}
+        return kwargs
 
-        response = self.client.messages.create(**kwargs)
-        result = response.content[0].text
+    @staticmethod
+    def _system_blocks(system_prompt: str) -> str | List[Dict[str, Any]]:
+        """
+        系统提示参数
 
-        logger.debug(f"📥 Received response from Anthropic: {len(result)} characters")
-        return result
+        分段提示的稳定前缀单独作为一个带 cache_control 的文本块，
+        多轮对话中服务端复用该前缀的缓存，只有易变部分需要重新处理
+        """
+        if not isinstance(system_prompt, SegmentedPrompt):
+            return system_prompt
+
+        blocks = []
+        if system_prompt.stable_prefix:
+            blocks.append({
+                "type": "text",
+                "text": system_prompt.stable_prefix,
+                "cache_control": {"type": "ephemeral"}
+            })
+        if system_prompt.volatile_suffix:
+            blocks.append({"type": "text", "text": system_prompt.volatile_suffix})
+        return blocks
+
+    def _response_text(self, response: Any, structured: bool) -> str:
+        """提取响应文本；结构化输出时返回工具参数的 JSON"""
+        if structured:
+            return next(
+                (json.dumps(block.input, ensure_ascii=False) for block in response.content
+                 if block.type == "tool_use" and block.name == self.RESPONSE_TOOL),
+                ""
+            )
+        return response.content[0].text
+
+    def _create_clients(self, api_key: Optional[str], base_url: Optional[str] = None) -> None:
+        """创建同步和异步客户端"""
+        api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.client = self._anthropic.Anthropic(api_key=api_key, base_url=base_url)
+        self.async_client = self._anthropic.AsyncAnthropic(api_key=api_key, base_url=base_url)
 
     def get_model_name(self) -> str:
         """获取模型名称"""
         return self.model
 
     def configure(self, config: IModelConfig) -> None:
-        """重新配置后端"""
+        """重新配置后端（同步和异步客户端都按新配置重建）"""
         self.model = config.model
-        self.client = anthropic.Anthropic(api_key=config.api_key)
+        self._create_clients(config.api_key, config.base_url)
         logger.info(f"🔄 Anthropic backend reconfigured: model={self.model}")
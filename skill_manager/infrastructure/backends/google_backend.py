@@ -3,9 +3,9 @@ Google Gemini 后端实现
 """
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
-from ...core.interfaces.llm_backend import ILLMBackend, IMessage, IModelConfig
+from ...core.interfaces.llm_backend import ILLMBackend, IMessage, IModelConfig, GenerationOptions
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +45,62 @@ class GoogleBackend(ILLMBackend):
         self,
         messages: List[Dict[str, str]],
         system_prompt: Optional[str] = None,
-        tools: Optional[List[Dict[str, Any]]] = None
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
     ) -> str:
         """发送消息并获取响应"""
+        contents, config = self._request(messages, system_prompt, tools, options)
+
+        logger.debug(f"📤 Sending {len(messages)} messages to Google ({self.model_name})")
+
+        response = self.model.generate_content(contents, generation_config=config)
+        result = response.text
+
+        logger.debug(f"📥 Received response from Google: {len(result)} characters")
+        return result
+
+    def complete_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> Iterator[str]:
+        """流式发送消息，逐段返回文本"""
+        contents, config = self._request(messages, system_prompt, tools, options)
+
+        logger.debug(f"📤 Streaming {len(messages)} messages to Google ({self.model_name})")
+
+        for chunk in self.model.generate_content(contents, generation_config=config, stream=True):
+            if chunk.parts:
+                yield chunk.text
+
+    async def acomplete(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> str:
+        """使用异步接口发送消息并获取响应"""
+        contents, config = self._request(messages, system_prompt, tools, options)
+
+        logger.debug(f"📤 Sending {len(messages)} messages to Google ({self.model_name}, async)")
+
+        response = await self.model.generate_content_async(contents, generation_config=config)
+        result = response.text
+
+        logger.debug(f"📥 Received response from Google: {len(result)} characters")
+        return result
+
+    def _request(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str],
+        tools: Optional[List[Dict[str, Any]]],
+        options: Optional[GenerationOptions]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """构建请求内容和 generation_config"""
         # 转换消息格式
         contents = []
         for msg in messages:
@@ -60,14 +113,38 @@ class GoogleBackend(ILLMBackend):
             config["system_instruction"] = system_prompt
         if tools:
             config["tools"] = tools
-
-        logger.debug(f"📤 Sending {len(messages)} messages to Google ({self.model_name})")
-
-        response = self.model.generate_content(contents, generation_config=config)
-        result = response.text
-
-        logger.debug(f"📥 Received response from Google: {len(result)} characters")
-        return result
+        if options:
+            config.update(self._generation_config(options))
+        return contents, config
+
+    @classmethod
+    def _generation_config(cls, options: GenerationOptions) -> Dict[str, Any]:
+        """把生成参数转换为 generation_config 字段"""
+        config: Dict[str, Any] = {}
+        if options.max_tokens is not None:
+            config["max_output_tokens"] = options.max_tokens
+        if options.temperature is not None:
+            config["temperature"] = options.temperature
+        if options.stop:
+            config["stop_sequences"] = options.stop
+        schema = options.response_schema()
+        if schema is not None:
+            config["response_mime_type"] = "application/json"
+            config["response_schema"] = cls._gemini_schema(schema)
+        return config
+
+    @classmethod
+    def _gemini_schema(cls, schema: Any) -> Any:
+        """Gemini 的 response_schema 只支持 OpenAPI 子集，去掉不支持的 additionalProperties"""
+        if isinstance(schema, dict):
+            return {
+                key: cls._gemini_schema(value)
+                for key, value in schema.items()
+                if key != "additionalProperties"
+            }
+        if isinstance(schema, list):
+            return [cls._gemini_schema(item) for item in schema]
+        return schema
 
     def get_model_name(self) -> str:
         """获取模型名称"""
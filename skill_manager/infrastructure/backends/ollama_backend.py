@@ -1,10 +1,16 @@
 """
 Ollama 本地模型后端实现
 """
+import json
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional
 
-from ...core.interfaces.llm_backend import ILLMBackend, IMessage, IModelConfig
+from ...core.interfaces.llm_backend import ILLMBackend, IMessage, IModelConfig, GenerationOptions
+
+try:
+    import httpx
+except ImportError:  # httpx 为可选依赖，缺失时 acomplete 回退到线程池
+    httpx = None
 
 # 配置日志
 logger = logging.getLogger(__name__)
@@ -14,10 +20,13 @@ class OllamaBackend(ILLMBackend):
     """
     Ollama 本地模型后端实现
 
+    安装 httpx 时 acomplete 使用异步 HTTP 客户端（首次调用时创建，用 aclose 关闭）
+
     遵循依赖倒置原则 - 实现 ILLMBackend 接口
     """
 
     DEFAULT_BASE_URL = "http://localhost:11434"
+    TIMEOUT = 120
 
     def __init__(
         self,
@@ -45,31 +54,25 @@ class OllamaBackend(ILLMBackend):
             )
 
         self._requests = requests
+        self._async_client = None
         logger.info(f"✅ Ollama backend initialized: model={self.config.model}, base_url={self.config.base_url}")
 
     def complete(
         self,
         messages: List[Dict[str, str]],
         system_prompt: Optional[str] = None,
-        tools: Optional[List[Dict[str, Any]]] = None
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
     ) -> str:
         """发送消息并获取响应"""
-        full_messages = []
-        if system_prompt:
-            full_messages.append({"role": "system", "content": system_prompt})
-        full_messages.extend(messages)
+        payload = self._payload(messages, system_prompt, options)
 
         logger.debug(f"📤 Sending {len(messages)} messages to Ollama ({self.config.model})")
 
-        # 注意：Ollama 的工具调用支持有限，tools 参数暂不使用
         response = self._requests.post(
             f"{self.config.base_url}/api/chat",
-            json={
-                "model": self.config.model,
-                "messages": full_messages,
-                "stream": False
-            },
-            timeout=120
+            json=payload,
+            timeout=self.TIMEOUT
         )
         response.raise_for_status()
         result = response.json()["message"]["content"]
@@ -77,6 +80,112 @@ class OllamaBackend(ILLMBackend):
         logger.debug(f"📥 Received response from Ollama: {len(result)} characters")
         return result
 
+    def complete_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> Iterator[str]:
+        """流式发送消息，逐段返回文本（/api/chat 以 NDJSON 逐行返回）"""
+        payload = self._payload(messages, system_prompt, options)
+        payload["stream"] = True
+
+        logger.debug(f"📤 Streaming {len(messages)} messages to Ollama ({self.config.model})")
+
+        with self._requests.post(
+            f"{self.config.base_url}/api/chat",
+            json=payload,
+            timeout=self.TIMEOUT,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            yield from self._stream_chunks(response.iter_lines())
+
+    @staticmethod
+    def _stream_chunks(lines: Iterable[bytes]) -> Iterator[str]:
+        """解析流式响应的每一行，返回非空的文本片段"""
+        for line in lines:
+            if not line:
+                continue
+            data = json.loads(line)
+            content = data.get("message", {}).get("content")
+            if content:
+                yield content
+            if data.get("done"):
+                break
+
+    async def acomplete(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> str:
+        """使用异步 HTTP 客户端发送消息并获取响应"""
+        if httpx is None:
+            return await super().acomplete(messages, system_prompt, tools, options)
+
+        payload = self._payload(messages, system_prompt, options)
+
+        logger.debug(f"📤 Sending {len(messages)} messages to Ollama ({self.config.model}, async)")
+
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(timeout=self.TIMEOUT)
+        response = await self._async_client.post(f"{self.config.base_url}/api/chat", json=payload)
+        response.raise_for_status()
+        result = response.json()["message"]["content"]
+
+        logger.debug(f"📥 Received response from Ollama: {len(result)} characters")
+        return result
+
+    async def aclose(self) -> None:
+        """关闭异步 HTTP 客户端"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def _payload(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str],
+        options: Optional[GenerationOptions]
+    ) -> Dict[str, Any]:
+        """构建 /api/chat 请求体"""
+        full_messages = []
+        if system_prompt:
+            full_messages.append({"role": "system", "content": system_prompt})
+        full_messages.extend(messages)
+
+        # 注意：Ollama 的工具调用支持有限，tools 参数暂不使用
+        payload = {
+            "model": self.config.model,
+            "messages": full_messages,
+            "stream": False
+        }
+        if options:
+            payload.update(self._generation_payload(options))
+        return payload
+
+    @staticmethod
+    def _generation_payload(options: GenerationOptions) -> Dict[str, Any]:
+        """把生成参数转换为 /api/chat 请求字段（采样参数放在 options，输出约束放在 format）"""
+        model_options: Dict[str, Any] = {}
+        if options.max_tokens is not None:
+            model_options["num_predict"] = options.max_tokens
+        if options.temperature is not None:
+            model_options["temperature"] = options.temperature
+        if options.stop:
+            model_options["stop"] = options.stop
+
+        payload: Dict[str, Any] = {}
+        if model_options:
+            payload["options"] = model_options
+        schema = options.response_schema()
+        if schema is not None:
+            payload["format"] = schema
+        return payload
+
     def get_model_name(self) -> str:
         """获取模型名称"""
         return f"ollama/{self.config.model}"
@@ -5,9 +5,9 @@ OpenAI 后端实现
 """
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
-from ...core.interfaces.llm_backend import ILLMBackend, IMessage, IModelConfig
+from ...core.interfaces.llm_backend import ILLMBackend, IMessage, IModelConfig, GenerationOptions
 
 logger = logging.getLogger(__name__)
 
@@ -34,15 +34,13 @@ class OpenAIBackend(ILLMBackend):
             base_url: API 基础 URL（可选）
         """
         try:
-            from openai import OpenAI
+            import openai
         except ImportError:
             raise ImportError("请安装 openai: pip install openai")
 
+        self._openai = openai
         self.model = model
-        self.client = OpenAI(
-            api_key=api_key or os.getenv("OPENAI_API_KEY"),
-            base_url=base_url
-        )
+        self._create_clients(api_key, base_url)
 
         logger.info(f"✅ OpenAI backend initialized: model={self.model}")
 
@@ -50,17 +48,11 @@ class OpenAIBackend(ILLMBackend):
         self,
         messages: List[Dict[str, str]],
         system_prompt: Optional[str] = None,
-        tools: Optional[List[Dict[str, Any]]] = None
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
     ) -> str:
         """发送消息并获取响应"""
-        full_messages = []
-        if system_prompt:
-            full_messages.append({"role": "system", "content": system_prompt})
-        full_messages.extend(messages)
-
-        kwargs = {"model": self.model, "messages": full_messages}
-        if tools:
-            kwargs["tools"] = tools
+        kwargs = self._request_kwargs(messages, system_prompt, tools, options)
 
         logger.debug(f"📤 Sending {len(messages)} messages to OpenAI ({self.model})")
 
@@ -70,11 +62,90 @@ class OpenAIBackend(ILLMBackend):
         logger.debug(f"📥 Received response from OpenAI: {len(result)} characters")
         return result
 
+    def complete_stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> Iterator[str]:
+        """流式发送消息，逐段返回文本增量"""
+        kwargs = self._request_kwargs(messages, system_prompt, tools, options)
+
+        logger.debug(f"📤 Streaming {len(messages)} messages to OpenAI ({self.model})")
+
+        for chunk in self.client.chat.completions.create(stream=True, **kwargs):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def acomplete(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        options: Optional[GenerationOptions] = None
+    ) -> str:
+        """使用异步客户端发送消息并获取响应"""
+        kwargs = self._request_kwargs(messages, system_prompt, tools, options)
+
+        logger.debug(f"📤 Sending {len(messages)} messages to OpenAI ({self.model}, async)")
+
+        response = await self.async_client.chat.completions.create(**kwargs)
+        result = response.choices[0].message.content
+
+        logger.debug(f"📥 Received response from OpenAI: {len(result)} characters")
+        return result
+
+    def _request_kwargs(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str],
+        tools: Optional[List[Dict[str, Any]]],
+        options: Optional[GenerationOptions]
+    ) -> Dict[str, Any]:
+        """构建 Chat Completions 请求参数"""
+        full_messages = []
+        if system_prompt:
+            full_messages.append({"role": "system", "content": system_prompt})
+        full_messages.extend(messages)
+
+        kwargs = {"model": self.model, "messages": full_messages}
+        if tools:
+            kwargs["tools"] = tools
+        if options:
+            kwargs.update(self._generation_kwargs(options))
+        return kwargs
+
+    @staticmethod
+    def _generation_kwargs(options: GenerationOptions) -> Dict[str, Any]:
+        """把生成参数转换为 Chat Completions 参数"""
+        kwargs: Dict[str, Any] = {}
+        if options.max_tokens is not None:
+            kwargs["max_tokens"] = options.max_tokens
+        if options.temperature is not None:
+            kwargs["temperature"] = options.temperature
+        if options.stop:
+            kwargs["stop"] = options.stop
+        schema = options.response_schema()
+        if schema is not None:
+            kwargs["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": "response", "schema": schema, "strict": True}
+            }
+        return kwargs
+
+    def _create_clients(self, api_key: Optional[str], base_url: Optional[str]) -> None:
+        """创建同步和异步客户端"""
+        api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.client = self._openai.OpenAI(api_key=api_key, base_url=base_url)
+        self.async_client = self._openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
+
     def get_model_name(self) -> str:
         """获取模型名称"""
         return self.model
 
     def configure(self, config: IModelConfig) -> None:
-        """重新配置后端"""
+        """重新配置后端（同步和异步客户端都按新配置重建）"""
         self.model = config.model
+        self._create_clients(config.api_key, config.base_url)
         logger.info(f"🔄 OpenAI backend reconfigured: model={self.model}")
@@ -0,0 +1,7 @@
+"""Cache - 持久化缓存实现"""
+from .catalog_cache import SqliteCatalogCache
+from .kv_store import SqliteKeyValueStore
+from .routing_store import SqliteRoutingStore
+from .response_store import SqliteResponseStore
+
+__all__ = ['SqliteCatalogCache', 'SqliteKeyValueStore', 'SqliteRoutingStore', 'SqliteResponseStore']
@@ -0,0 +1,124 @@
+"""
+SQLite 目录索引缓存实现
+
+实现 ISkillCatalogCache 接口，让短生命周期的进程在热启动时
+只需 stat 源文件即可复用已解析的 Skill 元数据
+"""
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ...core.entities.skill import SkillMetadata
+from ...core.interfaces.catalog_cache import ISkillCatalogCache, CatalogEntry
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteCatalogCache(ISkillCatalogCache):
+    """
+    基于 SQLite 的目录索引缓存
+
+    条目按 Skill 目录的绝对路径（resolve 后）保存，相对路径、符号链接
+    指向同一目录时共用一个条目；.skillignore 只决定遍历哪些目录，
+    每次加载都会重新读取，因此修改后立即生效，无需使条目失效
+
+    遵循依赖倒置原则 - 实现 ISkillCatalogCache 接口
+    """
+
+    DEFAULT_PATH = ".claude/skill_catalog.db"
+
+    # 缓存格式版本：SkillMetadata 字段、frontmatter 解析规则或文件分组规则
+    # （如 SkillDiscovery 清单）变化时递增，以丢弃按旧规则生成的条目
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: str | Path = DEFAULT_PATH):
+        """
+        Args:
+            path: 缓存文件路径（":memory:" 表示仅内存）
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS catalog ("
+            "skill_dir TEXT PRIMARY KEY, "
+            "version INTEGER NOT NULL, "
+            "data TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+        logger.debug(f"📂 Catalog cache opened: {self.path}")
+
+    def get(self, skill_dir: Path) -> Optional[CatalogEntry]:
+        """获取缓存条目"""
+        key = self._key(skill_dir)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, data FROM catalog WHERE skill_dir = ?",
+                (key,)
+            ).fetchone()
+
+        if row is None or row[0] != self.FORMAT_VERSION:
+            return None
+
+        try:
+            data = json.loads(row[1])
+            return CatalogEntry(
+                skill_dir=key,
+                metadata=SkillMetadata(**data["metadata"]),
+                files=data["files"],
+                fingerprints={
+                    rel: tuple(fp) if fp is not None else None
+                    for rel, fp in data["fingerprints"].items()
+                }
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"⚠️ Ignoring corrupt catalog entry for {skill_dir}: {e}")
+            return None
+
+    def put(self, entry: CatalogEntry) -> None:
+        """写入缓存条目；元数据无法序列化为 JSON 时跳过"""
+        try:
+            data = json.dumps({
+                "metadata": entry.metadata.to_dict(),
+                "files": entry.files,
+                "fingerprints": entry.fingerprints,
+            }, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Skip caching {entry.skill_dir}: {e}")
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO catalog (skill_dir, version, data) VALUES (?, ?, ?)",
+                (self._key(entry.skill_dir), self.FORMAT_VERSION, data)
+            )
+            self._conn.commit()
+
+    def remove(self, skill_dir: Path) -> None:
+        """删除缓存条目"""
+        with self._lock:
+            self._conn.execute("DELETE FROM catalog WHERE skill_dir = ?", (self._key(skill_dir),))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._conn.execute("DELETE FROM catalog")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _key(skill_dir: str | Path) -> str:
+        """条目键：解析为绝对路径，同一目录的不同写法对应同一条目"""
+        return str(Path(skill_dir).resolve())
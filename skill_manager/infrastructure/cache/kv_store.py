@@ -0,0 +1,92 @@
+"""
+SQLite 键值存储基类
+
+路由决策存储和 LLM 响应存储共用：每行为 (键, 值, 过期时间)
+"""
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteKeyValueStore:
+    """
+    基于 SQLite 的带过期时间的键值存储
+
+    子类通过 TABLE / VALUE_COLUMN / VALUE_TYPE 指定表名和值列，
+    并实现对应的存储接口（IRoutingStore、IResponseStore 等）
+    """
+
+    TABLE = ""
+    VALUE_COLUMN = "value"
+    # 值列的类型约束（如 "TEXT NOT NULL"）
+    VALUE_TYPE = "TEXT"
+
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path: 数据库文件路径（":memory:" 表示仅内存）
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.TABLE} ("
+            f"key TEXT PRIMARY KEY, "
+            f"{self.VALUE_COLUMN} {self.VALUE_TYPE}, "
+            f"expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+        logger.debug(f"📂 {type(self).__name__} opened: {self.path}")
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """获取 (值, 过期时间)；不存在时返回 None"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self.VALUE_COLUMN}, expires_at FROM {self.TABLE} WHERE key = ?",
+                (key,)
+            ).fetchone()
+        return (row[0], row[1]) if row is not None else None
+
+    def put(self, key: str, value: Any, expires_at: float) -> None:
+        """写入条目（已存在时覆盖）"""
+        with self._lock:
+            self._insert(key, value, expires_at)
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """删除已过期的条目，返回删除的条数"""
+        with self._lock:
+            cursor = self._conn.execute(f"DELETE FROM {self.TABLE} WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """清空所有条目"""
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.TABLE}")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    def _insert(self, key: str, value: Any, expires_at: float) -> None:
+        """写入一行（调用方持有锁并负责提交）"""
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO {self.TABLE} (key, {self.VALUE_COLUMN}, expires_at) VALUES (?, ?, ?)",
+            (key, value, expires_at)
+        )
@@ -0,0 +1,76 @@
+"""
+SQLite LLM 响应存储实现
+
+实现 IResponseStore 接口，让响应缓存在进程重启后仍然有效
+"""
+from pathlib import Path
+from typing import Optional
+
+from ...core.interfaces.response_store import IResponseStore
+from .kv_store import SqliteKeyValueStore
+
+
+class SqliteResponseStore(SqliteKeyValueStore, IResponseStore):
+    """
+    基于 SQLite 的 LLM 响应存储
+
+    设置 max_entries 时只保留最近写入的 max_entries 条响应：
+    写入前发现已满才按 rowid（写入顺序）删除最早的响应，
+    条数在打开时统计一次，之后随写入维护，写入不需要扫描全表。
+    多个进程同时写入同一文件时条数只是近似值，可能暂时超出上限
+
+    遵循依赖倒置原则 - 实现 IResponseStore 接口
+    """
+
+    DEFAULT_PATH = ".claude/llm_responses.db"
+
+    TABLE = "responses"
+    VALUE_COLUMN = "response"
+    VALUE_TYPE = "TEXT NOT NULL"
+
+    def __init__(self, path: str | Path = DEFAULT_PATH, max_entries: Optional[int] = None):
+        """
+        Args:
+            path: 数据库文件路径（":memory:" 表示仅内存）
+            max_entries: 最多保存的响应数，None 表示不限制
+        """
+        if max_entries is not None and max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+
+        super().__init__(path)
+        self.max_entries = max_entries
+        self._count = len(self)
+
+    def put(self, key: str, response: str, expires_at: float) -> None:
+        """写入响应，已满时先删除最早写入的响应"""
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM responses WHERE key = ?", (key,)
+            ).fetchone() is not None
+            if not exists:
+                if self.max_entries is not None and self._count >= self.max_entries:
+                    excess = self._count - self.max_entries + 1
+                    cursor = self._conn.execute(
+                        "DELETE FROM responses WHERE rowid IN ("
+                        "SELECT rowid FROM responses ORDER BY rowid LIMIT ?)",
+                        (excess,)
+                    )
+                    self._count -= cursor.rowcount
+                self._count += 1
+            self._insert(key, response, expires_at)
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """删除已过期的响应，返回删除的条数"""
+        removed = super().purge_expired()
+        with self._lock:
+            self._count -= removed
+        return removed
+
+    def clear(self) -> None:
+        """清空所有响应"""
+        super().clear()
+        with self._lock:
+            self._count = 0
@@ -0,0 +1,32 @@
+"""
+SQLite 路由决策存储实现
+
+实现 IRoutingStore 接口，让路由缓存在进程重启后仍然有效
+"""
+from pathlib import Path
+
+from ...core.interfaces.routing_store import IRoutingStore
+from .kv_store import SqliteKeyValueStore
+
+
+class SqliteRoutingStore(SqliteKeyValueStore, IRoutingStore):
+    """
+    基于 SQLite 的路由决策存储
+
+    值为 Skill 名称（NULL 表示没有匹配）
+
+    遵循依赖倒置原则 - 实现 IRoutingStore 接口
+    """
+
+    DEFAULT_PATH = ".claude/skill_routing.db"
+
+    TABLE = "routing"
+    VALUE_COLUMN = "skill_name"
+    VALUE_TYPE = "TEXT"
+
+    def __init__(self, path: str | Path = DEFAULT_PATH):
+        """
+        Args:
+            path: 数据库文件路径（":memory:" 表示仅内存）
+        """
+        super().__init__(path)
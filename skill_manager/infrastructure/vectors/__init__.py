@@ -0,0 +1,4 @@
+"""Vectors - 向量存储实现"""
+from .npy_store import NpyVectorStore
+
+__all__ = ['NpyVectorStore']
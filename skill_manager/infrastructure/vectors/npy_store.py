@@ -0,0 +1,114 @@
+"""
+内存映射 .npy 向量存储实现
+
+实现 IVectorStore 接口，多个工作进程通过内存映射共享同一份向量矩阵，
+由操作系统页缓存保存一份数据，而不是每个进程各持有一个副本
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from ...core.interfaces.vector_store import IVectorStore
+
+try:
+    import numpy as np
+except ImportError:  # numpy 为可选依赖
+    np = None
+
+logger = logging.getLogger(__name__)
+
+
+class NpyVectorStore(IVectorStore):
+    """
+    基于内存映射 .npy 文件的向量存储
+
+    目录结构：
+        index.json          当前签名、行键和矩阵文件名
+        vectors-<摘要>.npy  float32 矩阵（文件名随内容变化，写入后不再修改）
+
+    写入时先生成新的矩阵文件，再原子替换 index.json，
+    因此并发读取方要么看到旧版本、要么看到新版本，不会读到写了一半的文件。
+
+    遵循依赖倒置原则 - 实现 IVectorStore 接口
+    """
+
+    DEFAULT_PATH = ".claude/skill_vectors"
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, path: str | Path = DEFAULT_PATH):
+        """
+        Args:
+            path: 存储目录
+        """
+        if np is None:
+            raise ImportError("请安装 numpy: pip install numpy")
+
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def load(self, signature: str) -> Optional[Tuple[List[str], Any]]:
+        """读取与签名匹配的矩阵（只读内存映射）"""
+        try:
+            index = json.loads((self.path / self.INDEX_FILE).read_text(encoding='utf-8'))
+            if index.get("signature") != signature:
+                return None
+            matrix = np.load(self.path / index["file"], mmap_mode='r')
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Vector store miss at {self.path}: {e}")
+            return None
+
+        keys = index.get("keys", [])
+        if matrix.ndim != 2 or matrix.shape[0] != len(keys):
+            return None
+        return keys, matrix
+
+    def save(self, signature: str, keys: List[str], matrix: Any) -> Any:
+        """保存矩阵并返回其只读内存映射"""
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        digest = hashlib.blake2b(signature.encode('utf-8'), digest_size=8)
+        digest.update(json.dumps(keys).encode('utf-8'))
+        file_name = f"vectors-{digest.hexdigest()}.npy"
+        target = self.path / file_name
+
+        try:
+            if not target.exists():
+                self._atomic_write(target, lambda f: np.save(f, matrix))
+            # 先打开映射再清理旧文件，避免被其他进程的清理删掉
+            mapped = np.load(target, mmap_mode='r')
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to persist vectors to {self.path}: {e}")
+            return matrix
+
+        index = {"signature": signature, "keys": keys, "file": file_name}
+        self._atomic_write(
+            self.path / self.INDEX_FILE,
+            lambda f: f.write(json.dumps(index, ensure_ascii=False).encode('utf-8'))
+        )
+        self._remove_stale(file_name)
+        return mapped
+
+    def _atomic_write(self, target: Path, write) -> None:
+        """写入临时文件后原子替换"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _remove_stale(self, current: str) -> None:
+        """删除旧版本矩阵文件（已映射的进程在 POSIX 上仍可继续读取）"""
+        for path in self.path.glob("vectors-*.npy"):
+            if path.name != current:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
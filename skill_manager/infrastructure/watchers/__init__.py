@@ -0,0 +1,36 @@
+"""Watchers - Skill 目录变化监听"""
+import logging
+from pathlib import Path
+from typing import Iterable
+
+from ...core.interfaces.skill_watcher import ISkillWatcher
+from .polling_watcher import PollingSkillWatcher
+from .inotify_watcher import InotifySkillWatcher
+
+logger = logging.getLogger(__name__)
+
+
+def create_skill_watcher(
+    directories: Iterable[str | Path],
+    prefer_inotify: bool = True
+) -> ISkillWatcher:
+    """
+    创建 Skill 目录监听器
+
+    Args:
+        directories: 要监听的 Skills 根目录列表
+        prefer_inotify: 平台支持时优先使用 inotify
+
+    Returns:
+        inotify 监听器，不可用时返回轮询监听器
+    """
+    directories = list(directories)
+    if prefer_inotify and InotifySkillWatcher.is_available():
+        try:
+            return InotifySkillWatcher(directories)
+        except OSError as e:
+            logger.warning(f"⚠️ inotify unavailable ({e}), falling back to polling")
+    return PollingSkillWatcher(directories)
+
+
+__all__ = ['create_skill_watcher', 'PollingSkillWatcher', 'InotifySkillWatcher']
@@ -0,0 +1,266 @@
+"""
+基于 Linux inotify 的 Skill 目录监听器
+
+通过 ctypes 调用 libc，无需第三方依赖；
+只对收到事件的 Skill 目录重新计算签名
+"""
+import os
+import ctypes
+import ctypes.util
+import errno
+import select
+import struct
+import logging
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from ...core.interfaces.skill_watcher import SkillChangeSet
+from ...core.services.skill_discovery import SkillDiscovery
+from .polling_watcher import SnapshotSkillWatcher
+
+logger = logging.getLogger(__name__)
+
+# inotify 常量（见 <sys/inotify.h>）
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """加载 libc 并检查 inotify 符号"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class InotifySkillWatcher(SnapshotSkillWatcher):
+    """
+    inotify 监听器
+
+    监听各 Skills 根目录、中间目录、每个 Skill 目录及其 scripts/references/assets 子目录；
+    与 SkillDiscovery 一致，被 .skillignore 忽略或超过 max_depth 的目录既不监听也不报告
+    """
+
+    @staticmethod
+    def is_available() -> bool:
+        """当前平台是否支持 inotify"""
+        return _load_libc() is not None
+
+    def __init__(
+        self,
+        directories: Iterable[str | Path],
+        discovery: Optional[SkillDiscovery] = None
+    ):
+        """
+        Args:
+            directories: 要监听的 Skills 根目录列表
+            discovery: Skill 发现器
+
+        Raises:
+            OSError: 平台不支持 inotify 或初始化失败
+        """
+        super().__init__(directories, discovery)
+
+        self._libc = _load_libc()
+        if self._libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        # 唤醒管道，用于 close() 打断阻塞中的 poll
+        self._wake_r, self._wake_w = os.pipe()
+        self._closed = False
+        self._poll_lock = threading.Lock()
+
+        # wd -> 被监听的目录
+        self._watches: Dict[int, Path] = {}
+        for base_dir in self.directories:
+            self._add_watch(base_dir)
+        for skill_dir in list(self._signatures):
+            self._watch_skill_dir(skill_dir)
+
+    def poll(self, timeout: float = 0.0) -> SkillChangeSet:
+        """等待 inotify 事件并报告受影响的 Skill 目录"""
+        with self._poll_lock:
+            if self._closed:
+                return SkillChangeSet()
+            return self._poll_locked(timeout)
+
+    def _poll_locked(self, timeout: float) -> SkillChangeSet:
+        """poll 的实现（调用方持有 _poll_lock）"""
+        readable, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+        if self._fd not in readable or self._closed:
+            return SkillChangeSet()
+
+        affected: Set[Path] = set()
+        rescan = False
+        # 根目录 -> 忽略规则（每批事件只读取一次 .skillignore）
+        rules: Dict[Path, Callable[[str, str], bool]] = {}
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            rescan |= self._collect_events(data, affected, rules)
+
+        if rescan:
+            # 事件队列溢出或出现新的中间目录时退化为全量对比
+            logger.debug("inotify rescan requested, diffing all skills")
+            affected = set(self._known_and_current_dirs())
+
+        changes = self._diff(sorted(affected))
+        for skill_dir in changes.added:
+            self._watch_skill_dir(skill_dir)
+        return changes
+
+    def close(self) -> None:
+        """关闭 inotify 描述符"""
+        if self._closed:
+            return
+        self._closed = True
+        os.write(self._wake_w, b"x")
+
+        # 等待进行中的 poll 被唤醒返回后再关闭描述符
+        with self._poll_lock:
+            os.close(self._fd)
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+
+    def _collect_events(
+        self,
+        data: bytes,
+        affected: Set[Path],
+        rules: Dict[Path, Callable[[str, str], bool]]
+    ) -> bool:
+        """解析事件缓冲区，把受影响的 Skill 目录加入 affected；返回是否需要全量对比"""
+        offset = 0
+        rescan = False
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "surrogateescape")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                logger.warning("⚠️ inotify queue overflow, rescanning all skills")
+                rescan = True
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            watched = self._watches.get(wd)
+            if watched is None:
+                continue
+
+            path = watched / name if name else watched
+            base_dir = self._base_dir(path)
+            if base_dir is None:
+                continue
+            if path == base_dir / (self.discovery.ignore_file or ""):
+                # 忽略规则变化：重新读取并全量对比
+                rules.pop(base_dir, None)
+                rescan = True
+                continue
+            if base_dir not in rules:
+                rules[base_dir] = self.discovery.load_ignore_rules(base_dir)
+            is_ignored = rules[base_dir]
+
+            skill_dir = self._owning_skill_dir(base_dir, path, is_ignored)
+            created_dir = mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO)
+            if skill_dir is not None:
+                affected.add(skill_dir)
+                if created_dir:
+                    self._watch_skill_dir(skill_dir)
+            elif created_dir and self.discovery.in_scope(base_dir, path, is_ignored):
+                # 新的中间目录：监听它，并全量对比以发现其中已有的 Skills
+                self._add_watch(path)
+                rescan = True
+        return rescan
+
+    def _base_dir(self, path: Path) -> Optional[Path]:
+        """事件路径所在的 Skills 根目录"""
+        for base_dir in self.directories:
+            if path == base_dir or base_dir in path.parents:
+                return base_dir
+        return None
+
+    def _owning_skill_dir(
+        self,
+        base_dir: Path,
+        path: Path,
+        is_ignored: Callable[[str, str], bool]
+    ) -> Optional[Path]:
+        """
+        根据事件路径找到所属的 Skill 目录（最外层已知或包含 SKILL.md 的目录）
+
+        沿途的目录被忽略或超过 max_depth 时返回 None，与 SkillDiscovery 的遍历范围一致
+        """
+        candidate = base_dir
+        for part in path.relative_to(base_dir).parts:
+            candidate = candidate / part
+            if candidate in self._signatures:
+                return candidate
+            if not self.discovery.in_scope(base_dir, candidate, is_ignored):
+                return None
+            if (candidate / "SKILL.md").is_file():
+                return candidate
+        return None
+
+    def _watch_skill_dir(self, skill_dir: Path) -> None:
+        """监听 Skill 目录、其子目录以及到根目录之间的中间目录"""
+        for base_dir in self.directories:
+            try:
+                rel = skill_dir.relative_to(base_dir)
+            except ValueError:
+                continue
+            parent = base_dir
+            for part in rel.parts[:-1]:
+                parent = parent / part
+                self._add_watch(parent)
+            break
+
+        self._add_watch(skill_dir)
+        for sub in self.WATCHED_SUBDIRS:
+            if (skill_dir / sub).is_dir():
+                self._add_watch(skill_dir / sub)
+
+    def _add_watch(self, path: Path) -> None:
+        """添加目录监听（重复添加会返回同一个 wd）"""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            logger.debug(f"inotify_add_watch failed for {path}: {os.strerror(ctypes.get_errno())}")
+            return
+        self._watches[wd] = path
@@ -0,0 +1,126 @@
+"""
+基于 mtime 轮询的 Skill 目录监听器
+
+可移植的后备实现，在不支持 inotify 的平台上使用
+"""
+import os
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ...core.interfaces.skill_watcher import ISkillWatcher, SkillChangeSet
+from ...core.services.skill_discovery import SkillDiscovery
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotSkillWatcher(ISkillWatcher):
+    """
+    基于目录快照对比的监听器基类
+
+    为每个 Skill 目录计算签名（SKILL.md、根目录文件以及
+    scripts/references/assets 中文件的 mtime 和大小），
+    通过对比签名得出新增、修改和删除的 Skill。
+    Skill 目录由 SkillDiscovery 定位，与加载器的嵌套和忽略规则一致
+    """
+
+    # 与 FilesystemSkillLoader 读取的子目录保持一致
+    WATCHED_SUBDIRS = ('scripts', 'references', 'assets')
+
+    def __init__(
+        self,
+        directories: Iterable[str | Path],
+        discovery: Optional[SkillDiscovery] = None
+    ):
+        """
+        Args:
+            directories: 要监听的 Skills 根目录列表
+            discovery: Skill 发现器（默认与 FilesystemSkillLoader 相同）
+        """
+        self.directories = [Path(d) for d in directories]
+        self.discovery = discovery or SkillDiscovery()
+        self._signatures: Dict[Path, tuple] = {}
+        for base_dir in self.directories:
+            for skill_dir in self._list_skill_dirs(base_dir):
+                signature = self._signature(skill_dir)
+                if signature is not None:
+                    self._signatures[skill_dir] = signature
+
+    def _list_skill_dirs(self, base_dir: Path) -> List[Path]:
+        """列出根目录下（含嵌套目录）包含 SKILL.md 的目录"""
+        return self.discovery.find_skill_dirs(base_dir)
+
+    def _signature(self, skill_dir: Path) -> Optional[tuple]:
+        """计算 Skill 目录签名；SKILL.md 不存在时返回 None"""
+        items = []
+        try:
+            with os.scandir(skill_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        st = entry.stat()
+                        items.append((entry.name, st.st_mtime_ns, st.st_size))
+                    elif entry.name in self.WATCHED_SUBDIRS and entry.is_dir():
+                        with os.scandir(entry.path) as subs:
+                            for sub in subs:
+                                st = sub.stat()
+                                items.append((f"{entry.name}/{sub.name}", st.st_mtime_ns, st.st_size))
+        except OSError:
+            return None
+
+        if not any(name == "SKILL.md" for name, _, _ in items):
+            return None
+        return tuple(sorted(items))
+
+    def _diff(self, skill_dirs: Iterable[Path]) -> SkillChangeSet:
+        """对比指定 Skill 目录的签名并更新快照"""
+        changes = SkillChangeSet()
+        for skill_dir in skill_dirs:
+            old = self._signatures.get(skill_dir)
+            new = self._signature(skill_dir)
+            if old == new:
+                continue
+            if new is None:
+                del self._signatures[skill_dir]
+                changes.removed.append(skill_dir)
+            else:
+                self._signatures[skill_dir] = new
+                if old is None:
+                    changes.added.append(skill_dir)
+                else:
+                    changes.modified.append(skill_dir)
+        return changes
+
+    def _known_and_current_dirs(self) -> List[Path]:
+        """已知的 Skill 目录加上各根目录下当前存在的 Skill 目录"""
+        dirs = dict.fromkeys(self._signatures)
+        for base_dir in self.directories:
+            dirs.update(dict.fromkeys(self._list_skill_dirs(base_dir)))
+        return list(dirs)
+
+
+class PollingSkillWatcher(SnapshotSkillWatcher):
+    """
+    轮询监听器
+
+    每次 poll 重新扫描所有 Skill 目录的 mtime；
+    只有签名变化的 Skill 会被报告，重新加载成本与修改数量成正比
+    """
+
+    def __init__(
+        self,
+        directories: Iterable[str | Path],
+        discovery: Optional[SkillDiscovery] = None
+    ):
+        super().__init__(directories, discovery)
+        self._closed = threading.Event()
+
+    def poll(self, timeout: float = 0.0) -> SkillChangeSet:
+        """等待 timeout 秒后扫描一次"""
+        if timeout > 0 and self._closed.wait(timeout):
+            return SkillChangeSet()
+        return self._diff(self._known_and_current_dirs())
+
+    def close(self) -> None:
+        """停止监听"""
+        self._closed.set()
@@ -0,0 +1,29 @@
+"""
+测试共用的辅助工具
+"""
+from pathlib import Path
+
+from skill_manager.core.entities.skill import Skill, SkillMetadata
+
+
+def make_skill(name: str, description: str, instructions: str = "", category: str = None) -> Skill:
+    """创建测试 Skill"""
+    return Skill(
+        metadata=SkillMetadata(
+            name=name,
+            description=description,
+            metadata={"category": category} if category else {}
+        ),
+        instructions=instructions,
+        path=Path(f"/tmp/{name}")
+    )
+
+
+class FakeClock:
+    """可手动推进的时钟"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
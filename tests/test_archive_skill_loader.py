@@ -0,0 +1,111 @@
+"""
+测试归档 Skill 加载服务
+"""
+import unittest
+import tempfile
+import shutil
+import zipfile
+from pathlib import Path
+
+from skill_manager import SkillManager
+from skill_manager.core.services.archive_skill_loader import ArchiveSkillLoader, StaleSkillError
+
+
+class TestArchiveSkillLoader(unittest.TestCase):
+    """测试 ArchiveSkillLoader"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.loader = ArchiveSkillLoader()
+
+    def tearDown(self):
+        """清理测试环境"""
+        self.loader.close()
+        shutil.rmtree(self.test_dir)
+
+    def _create_archive(self, name: str, description: str, api: str = "# API Reference") -> Path:
+        """创建与 package_skill.py 相同布局的 .skill 归档"""
+        archive_path = self.test_dir / f"{name}.skill"
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(
+                f"{name}/SKILL.md",
+                f"---\nname: {name}\ndescription: {description}\n---\n\n# Instructions\n"
+            )
+            zf.writestr(f"{name}/scripts/helper.py", "print('hello')")
+            zf.writestr(f"{name}/references/api.md", api)
+            zf.writestr(f"{name}/assets/logo.png", b"\x89PNG")
+        return archive_path
+
+    def test_load_skill(self):
+        """测试加载单个归档"""
+        archive_path = self._create_archive("test-skill", "A test skill")
+
+        skill = self.loader.load_skill(archive_path)
+
+        self.assertEqual(skill.metadata.name, "test-skill")
+        self.assertIn("Instructions", skill.instructions)
+        self.assertEqual(skill.scripts["helper.py"].language, "python")
+        self.assertFalse(skill.references["api.md"].is_loaded)
+        self.assertEqual(skill.references["api.md"].content, "# API Reference")
+        self.assertEqual([a.name for a in skill.assets], ["logo.png"])
+
+    def test_load_skills_from_directory(self):
+        """测试从目录加载多个归档"""
+        self._create_archive("skill2", "Second skill")
+        self._create_archive("skill1", "First skill")
+        (self.test_dir / "notes.txt").write_text("not a skill")
+
+        manager = SkillManager(loader=self.loader, auto_load=False)
+        manager.load_skills_from_directory(self.test_dir)
+
+        self.assertEqual([m.name for m in manager.list_skills()], ["skill1", "skill2"])
+
+    def test_replaced_archive_is_reopened(self):
+        """测试归档被替换后重新打开，旧句柄被关闭"""
+        archive_path = self._create_archive("test-skill", "A test skill")
+        self.loader.load_skill(archive_path)
+        _, old = self.loader._open(archive_path)
+
+        self._create_archive("test-skill", "An updated test skill", api="# API Reference v2")
+        skill = self.loader.load_skill(archive_path)
+
+        self.assertEqual(skill.metadata.description, "An updated test skill")
+        self.assertEqual(skill.references["api.md"].content, "# API Reference v2")
+        self.assertIsNone(old.fp)
+
+    def test_replaced_archive_invalidates_loaded_skill(self):
+        """测试归档被替换或删除后，已加载 Skill 的未读内容不会从新归档读取"""
+        archive_path = self._create_archive("test-skill", "A test skill")
+        skill = self.loader.load_skill(archive_path)
+
+        self._create_archive("test-skill", "An updated test skill", api="# API Reference v2")
+        with self.assertRaises(StaleSkillError):
+            skill.references["api.md"].content
+
+        self.assertEqual(self.loader.load_skill(archive_path).references["api.md"].content, "# API Reference v2")
+
+        archive_path.unlink()
+        with self.assertRaises(StaleSkillError):
+            skill.scripts["helper.py"].content
+
+    def test_lazy_members_after_close(self):
+        """测试 close() 后首次访问未读取的成员时重新打开归档"""
+        skill = self.loader.load_skill(self._create_archive("test-skill", "A test skill"))
+        self.loader.close()
+
+        self.assertEqual(skill.references["api.md"].content, "# API Reference")
+        self.assertEqual(skill.scripts["helper.py"].content, "print('hello')")
+
+    def test_missing_skill_md(self):
+        """测试缺少 SKILL.md 的归档"""
+        archive_path = self.test_dir / "broken.skill"
+        with zipfile.ZipFile(archive_path, "w") as zf:
+            zf.writestr("broken/README.md", "# Broken")
+
+        with self.assertRaises(FileNotFoundError):
+            self.loader.load_skill(archive_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
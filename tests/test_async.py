@@ -0,0 +1,96 @@
+"""
+测试异步执行路径
+"""
+import asyncio
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from skill_manager import AsyncSkillManager
+from skill_manager.core.interfaces.llm_backend import ILLMBackend
+
+
+class AsyncBackend(ILLMBackend):
+    """原生异步后端：记录同时进行中的调用数"""
+
+    def __init__(self, answer: str = "done"):
+        self.answer = answer
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.system_prompts = []
+
+    def complete(self, messages, system_prompt=None, tools=None, options=None):
+        raise AssertionError("同步接口不应被调用")
+
+    async def acomplete(self, messages, system_prompt=None, tools=None, options=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.system_prompts.append(system_prompt)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        return self.answer
+
+    def get_model_name(self):
+        return "async"
+
+    def configure(self, config):
+        pass
+
+
+class SyncBackend(ILLMBackend):
+    """只实现同步接口的旧后端"""
+
+    def complete(self, messages, system_prompt=None, tools=None):
+        return "sync"
+
+    def get_model_name(self):
+        return "sync"
+
+    def configure(self, config):
+        pass
+
+
+class TestAsyncSkillManager(unittest.IsolatedAsyncioTestCase):
+    """测试 AsyncSkillManager"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        for name, description in [("pdf", "PDF 文件处理：合并、拆分"), ("xlsx", "Excel 表格处理")]:
+            skill_dir = self.test_dir / name
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text(
+                f"---\nname: {name}\ndescription: {description}\n---\n\n# {name} instructions\n",
+                encoding="utf-8"
+            )
+        self.manager = AsyncSkillManager(auto_load=False)
+        self.manager.load_skills_from_directory(self.test_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    async def test_concurrent_requests_share_one_loop(self):
+        """测试大量请求在一个事件循环中并发等待"""
+        backend = AsyncBackend()
+        responses = await asyncio.gather(*[
+            self.manager.aexecute("合并 PDF", backend) for _ in range(200)
+        ])
+
+        self.assertEqual(responses, ["done"] * 200)
+        self.assertGreater(backend.max_in_flight, 100)
+        self.assertIn("# pdf instructions", backend.system_prompts[0])
+
+    async def test_llm_routing_is_awaited(self):
+        """测试需要 LLM 路由时使用 acomplete"""
+        backend = AsyncBackend(answer="xlsx")
+        skill = await self.manager.amatch_skill("处理一下这个", backend)
+        self.assertEqual(skill.metadata.name, "xlsx")
+
+    async def test_sync_backend_falls_back_to_thread(self):
+        """测试只实现同步接口的后端仍可使用"""
+        self.assertEqual(await self.manager.aexecute("合并 PDF", SyncBackend()), "sync")
+        self.assertEqual(await self.manager.aexecute_with_tools("合并 PDF", SyncBackend()), "sync")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+测试路由基准测试
+"""
+import json
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from skill_manager.core.entities.catalog import CatalogSnapshot
+from skill_manager.core.services.skill_matcher import SemanticSkillMatcher, IndexedSkillMatcher
+from skill_manager.benchmark import BenchmarkCase, FakeBackend, load_cases, percentile, run_benchmark, main
+from tests.helpers import make_skill
+
+
+class TestBenchmark(unittest.TestCase):
+    """测试基准测试工具"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.skills = CatalogSnapshot([
+            make_skill("pdf", "PDF 文件处理：合并、拆分、提取表格"),
+            make_skill("xlsx", "Excel 表格处理：公式、图表、数据分析"),
+        ], version=1)
+        self.cases = [
+            BenchmarkCase("合并 PDF", "pdf"),
+            BenchmarkCase("处理表格", "xlsx"),
+            BenchmarkCase("天气", None),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_percentile(self):
+        """测试最近秩百分位数"""
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_run_benchmark_counts_cost(self):
+        """测试准确率、LLM 调用和提示 token 统计"""
+        local = run_benchmark(IndexedSkillMatcher(), self.cases, self.skills)
+        self.assertEqual(local.llm_calls_per_query, 0)
+        self.assertEqual(local.prompt_tokens_per_query, 0)
+
+        topk_llm = SemanticSkillMatcher(threshold=float('inf'), exact_names=False, llm_fallback=False)
+        result = run_benchmark(topk_llm, self.cases, self.skills, name="llm")
+        self.assertEqual(result.matcher, "llm")
+        self.assertEqual(result.accuracy, 1.0)
+        self.assertEqual(result.llm_calls_per_query, 2 / 3)
+        self.assertGreater(result.prompt_tokens_per_query, 0)
+        self.assertLessEqual(result.latency_ms_p50, result.latency_ms_p99)
+
+    def test_fake_backend_is_deterministic(self):
+        """测试模拟后端不使用标注时按词重叠回答"""
+        backend = FakeBackend(oracle=False)
+        prompt = "Available skills:\n- pdf: PDF 合并\n- xlsx: Excel 表格\n\nUser request: 合并文件"
+        answers = {backend.complete([{"role": "user", "content": prompt}]) for _ in range(3)}
+        self.assertEqual(answers, {"pdf"})
+        self.assertEqual(backend.calls, 3)
+
+    def test_cli_writes_json(self):
+        """测试命令行读取 JSONL 并输出 JSON"""
+        skill_dir = self.test_dir / "skills" / "pdf"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("---\nname: pdf\ndescription: PDF 合并\n---\n\n# PDF\n", encoding="utf-8")
+        cases = self.test_dir / "cases.jsonl"
+        cases.write_text(
+            '{"query": "合并 PDF", "expected": "pdf"}\n\n# comment\n{"query": "天气", "expected": null}\n',
+            encoding="utf-8"
+        )
+        output = self.test_dir / "result.json"
+
+        self.assertEqual(len(load_cases(cases)), 2)
+        main([str(cases), "--skills", str(self.test_dir / "skills"), "--matchers", "indexed", "semantic",
+              "--output", str(output)])
+
+        report = json.loads(output.read_text(encoding="utf-8"))
+        self.assertEqual(report["queries"], 2)
+        self.assertEqual([result["matcher"] for result in report["results"]], ["indexed", "semantic"])
+        self.assertEqual(report["results"][0]["accuracy"], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
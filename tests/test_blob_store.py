@@ -0,0 +1,62 @@
+"""
+测试内容寻址存储
+"""
+import gc
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from skill_manager.core.services.blob_store import BlobStore
+from skill_manager.core.services.skill_loader import FilesystemSkillLoader
+
+
+class TestBlobStore(unittest.TestCase):
+    """测试 BlobStore"""
+
+    def test_deduplicates_identical_content(self):
+        """测试相同内容共享同一个 Blob"""
+        store = BlobStore()
+        a = store.put("same content")
+        b = store.put("same content")
+        c = store.put("other content")
+
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.hits, 1)
+        self.assertIs(store.get(a.digest), a)
+
+    def test_unreferenced_blobs_are_released(self):
+        """测试不再被引用的 Blob 被回收"""
+        store = BlobStore()
+        blob = store.put("temporary")
+        digest = blob.digest
+        del blob
+        gc.collect()
+
+        self.assertIsNone(store.get(digest))
+
+    def test_loader_shares_duplicate_references(self):
+        """测试加载器对重复的参考文档去重"""
+        test_dir = Path(tempfile.mkdtemp())
+        try:
+            for name in ("docx", "pptx"):
+                skill_dir = test_dir / name
+                (skill_dir / "references").mkdir(parents=True)
+                (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {name}\n---\n")
+                (skill_dir / "references" / "ooxml.md").write_text("# OOXML reference")
+
+            loader = FilesystemSkillLoader()
+            docx, pptx = loader.load_skills_from_directory(test_dir)
+
+            self.assertIs(
+                docx.references["ooxml.md"].content,
+                pptx.references["ooxml.md"].content
+            )
+        finally:
+            shutil.rmtree(test_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+测试目录索引缓存
+"""
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+
+from skill_manager.core.services.skill_loader import FilesystemSkillLoader
+from skill_manager.infrastructure.cache import SqliteCatalogCache
+
+
+class TestSqliteCatalogCache(unittest.TestCase):
+    """测试 SqliteCatalogCache 与 FilesystemSkillLoader 的配合"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = SqliteCatalogCache(Path(self.test_dir) / "catalog.db")
+
+    def tearDown(self):
+        """清理测试环境"""
+        self.cache.close()
+        shutil.rmtree(self.test_dir)
+
+    def _create_skill(self, name: str, description: str) -> Path:
+        """创建测试 Skill"""
+        skill_dir = Path(self.test_dir) / "skills" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: {description}\n---\n\n# Instructions\n"
+        )
+        return skill_dir
+
+    def test_warm_load_skips_parsing(self):
+        """测试指纹未变化时不重新解析 frontmatter"""
+        skill_dir = self._create_skill("test-skill", "A test skill")
+        (skill_dir / "references").mkdir()
+        (skill_dir / "references" / "api.md").write_text("# API")
+
+        FilesystemSkillLoader(catalog_cache=self.cache).load_skill(skill_dir)
+
+        loader = FilesystemSkillLoader(catalog_cache=self.cache)
+        with mock.patch.object(loader, "_build_metadata", side_effect=AssertionError("parsed")):
+            skill = loader.load_skill(skill_dir)
+
+        self.assertEqual(skill.metadata.name, "test-skill")
+        self.assertEqual(skill.references["api.md"].content, "# API")
+        self.assertIn("Instructions", skill.instructions)
+
+    def test_modified_skill_is_reparsed(self):
+        """测试 SKILL.md 修改后重新解析"""
+        skill_dir = self._create_skill("test-skill", "A test skill")
+        FilesystemSkillLoader(catalog_cache=self.cache).load_skill(skill_dir)
+
+        skill_md = skill_dir / "SKILL.md"
+        skill_md.write_text("---\nname: test-skill\ndescription: Updated description\n---\n\nBody\n")
+        st = skill_md.stat()
+        os.utime(skill_md, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        skill = FilesystemSkillLoader(catalog_cache=self.cache).load_skill(skill_dir)
+        self.assertEqual(skill.metadata.description, "Updated description")
+
+    def test_added_file_invalidates_entry(self):
+        """测试新增脚本后文件列表被刷新"""
+        skill_dir = self._create_skill("test-skill", "A test skill")
+        FilesystemSkillLoader(catalog_cache=self.cache).load_skill(skill_dir)
+
+        scripts_dir = skill_dir / "scripts"
+        scripts_dir.mkdir()
+        (scripts_dir / "helper.py").write_text("print('hello')")
+
+        skill = FilesystemSkillLoader(lazy=True, catalog_cache=self.cache).load_skill(skill_dir)
+        self.assertIn("helper.py", skill.scripts)
+
+    def test_old_format_is_ignored(self):
+        """测试格式版本不同的条目被丢弃并重新解析"""
+        skill_dir = self._create_skill("test-skill", "A test skill")
+        FilesystemSkillLoader(catalog_cache=self.cache).load_skill(skill_dir)
+        self.assertIsNotNone(self.cache.get(skill_dir))
+
+        with mock.patch.object(SqliteCatalogCache, "FORMAT_VERSION", SqliteCatalogCache.FORMAT_VERSION + 1):
+            self.assertIsNone(self.cache.get(skill_dir))
+            skill = FilesystemSkillLoader(catalog_cache=self.cache).load_skill(skill_dir)
+            self.assertEqual(skill.metadata.name, "test-skill")
+            self.assertIsNotNone(self.cache.get(skill_dir))
+
+    def test_relative_and_absolute_paths_share_entry(self):
+        """测试相对路径和绝对路径加载同一 Skill 时共用一个条目"""
+        skill_dir = self._create_skill("test-skill", "A test skill")
+        FilesystemSkillLoader(catalog_cache=self.cache).load_skill(skill_dir)
+
+        relative = Path(os.path.relpath(skill_dir))
+        loader = FilesystemSkillLoader(catalog_cache=self.cache)
+        with mock.patch.object(loader, "_build_metadata", side_effect=AssertionError("parsed")):
+            skill = loader.load_skill(relative)
+        self.assertEqual(skill.metadata.name, "test-skill")
+
+        self.cache.remove(relative)
+        self.assertIsNone(self.cache.get(skill_dir))
+
+    def test_skillignore_applies_on_warm_start(self):
+        """测试修改 .skillignore 后，热启动同样生效"""
+        self._create_skill("alpha", "First skill")
+        self._create_skill("beta", "Second skill")
+        base_dir = Path(self.test_dir) / "skills"
+
+        skills = FilesystemSkillLoader(catalog_cache=self.cache).load_skills_from_directory(base_dir)
+        self.assertEqual([s.metadata.name for s in skills], ["alpha", "beta"])
+
+        (base_dir / ".skillignore").write_text("beta\n")
+        skills = FilesystemSkillLoader(catalog_cache=self.cache).load_skills_from_directory(base_dir)
+        self.assertEqual([s.metadata.name for s in skills], ["alpha"])
+
+
+if __name__ == "__main__":
+    unittest.main()
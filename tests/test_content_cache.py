@@ -0,0 +1,97 @@
+"""
+测试内容缓存
+"""
+import sys
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from skill_manager.core.services.content_cache import ContentCache
+from skill_manager.core.services.skill_loader import FilesystemSkillLoader
+
+
+class TestContentCache(unittest.TestCase):
+    """测试 ContentCache"""
+
+    def test_hit_and_miss_counters(self):
+        """测试命中和未命中计数"""
+        cache = ContentCache()
+        calls = []
+
+        def loader(text):
+            calls.append(text)
+            return text
+
+        self.assertEqual(cache.get_or_load("a", loader, "alpha"), "alpha")
+        self.assertEqual(cache.get_or_load("a", loader, "alpha"), "alpha")
+
+        self.assertEqual(calls, ["alpha"])
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_evicts_least_recently_used(self):
+        """测试超出字节预算时淘汰最久未访问的条目"""
+        text = "x" * 1000
+        cache = ContentCache(max_bytes=sys.getsizeof(text) * 2 + 10)
+        cache.put("a", text)
+        cache.put("b", text + "b")
+        cache.get("a")
+        cache.put("c", text + "c")
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.current_bytes, cache.max_bytes)
+
+    def test_oversized_entry_not_cached(self):
+        """测试超出预算的单个条目不缓存"""
+        cache = ContentCache(max_bytes=100)
+        cache.put("big", "x" * 1000)
+        self.assertEqual(len(cache), 0)
+
+    def test_compressed_storage(self):
+        """测试压缩存储"""
+        text = "# Reference\n" + "repeated line\n" * 1000
+        cache = ContentCache(compress=True)
+        cache.put("ref", text)
+
+        self.assertEqual(cache.get("ref"), text)
+        self.assertLess(cache.current_bytes, sys.getsizeof(text) // 10)
+
+
+class TestLoaderWithContentCache(unittest.TestCase):
+    """测试延迟加载器经由内容缓存读取内容"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        for name in ("hot", "cold"):
+            skill_dir = self.test_dir / name
+            (skill_dir / "references").mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(
+                f"---\nname: {name}\ndescription: {name}\n---\n\n# {name} instructions\n" + "body\n" * 200
+            )
+            (skill_dir / "references" / "guide.md").write_text(f"# {name} guide\n" + "ref\n" * 200)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_cold_content_evicted_and_reloaded(self):
+        """测试冷门内容被淘汰后可以重新加载"""
+        cache = ContentCache(max_bytes=2500)
+        loader = FilesystemSkillLoader(lazy=True, content_cache=cache)
+        cold, hot = loader.load_skills_from_directory(self.test_dir)
+
+        self.assertIn("cold instructions", cold.instructions)
+        self.assertIn("hot instructions", hot.instructions)
+        self.assertIn("hot guide", hot.get_reference("guide.md").content)
+
+        self.assertGreater(cache.evictions, 0)
+        self.assertFalse(cold.is_loaded)
+        self.assertIn("cold instructions", cold.instructions)
+        self.assertEqual(cache.misses, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
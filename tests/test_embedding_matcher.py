@@ -0,0 +1,113 @@
+"""
+测试向量匹配器
+"""
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from skill_manager.core.entities.catalog import CatalogSnapshot
+from tests.helpers import make_skill
+
+try:
+    import numpy as np
+    from skill_manager.core.services.hashing_encoder import HashingTextEncoder
+    from skill_manager.core.services.embedding_matcher import EmbeddingSkillMatcher
+    from skill_manager.infrastructure.vectors import NpyVectorStore
+except ImportError:
+    np = None
+
+
+class CountingEncoder(HashingTextEncoder if np is not None else object):
+    """记录编码次数的编码器"""
+
+    def __init__(self):
+        super().__init__(dimension=256)
+        self.encoded = []
+
+    def encode(self, texts):
+        self.encoded.extend(texts)
+        return super().encode(texts)
+
+
+@unittest.skipUnless(np is not None, "numpy not installed")
+class TestHashingTextEncoder(unittest.TestCase):
+    """测试 HashingTextEncoder"""
+
+    def test_deterministic_and_normalized(self):
+        """测试结果确定且 L2 归一化"""
+        encoder = HashingTextEncoder(dimension=512)
+        a = encoder.encode(["合并 PDF 文件", ""])
+        b = HashingTextEncoder(dimension=512).encode(["合并 PDF 文件"])
+
+        self.assertEqual(a.shape, (2, 512))
+        self.assertEqual(a.dtype, np.float32)
+        np.testing.assert_array_equal(a[0], b[0])
+        self.assertAlmostEqual(float(np.linalg.norm(a[0])), 1.0, places=5)
+        self.assertEqual(float(np.linalg.norm(a[1])), 0.0)
+
+
+@unittest.skipUnless(np is not None, "numpy not installed")
+class TestEmbeddingSkillMatcher(unittest.TestCase):
+    """测试 EmbeddingSkillMatcher"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.skills = CatalogSnapshot([
+            make_skill("pdf", "PDF 文件处理：合并、拆分、提取表格"),
+            make_skill("xlsx", "Excel spreadsheets: formulas, charts, data analysis"),
+            make_skill("mem-weekly", "AI个人记忆系统的周复盘功能"),
+        ], version=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_match_and_batch(self):
+        """测试单个查询和批量查询"""
+        matcher = EmbeddingSkillMatcher()
+
+        self.assertEqual(matcher.match("帮我合并两个文件", self.skills, None).metadata.name, "pdf")
+        batch = matcher.rank_batch(["spreadsheet formula", "周复盘"], self.skills, limit=2)
+        self.assertEqual([ranked[0][0].metadata.name for ranked in batch], ["xlsx", "mem-weekly"])
+        self.assertIsNone(matcher.match("天气", self.skills, None))
+
+        results = matcher.match_batch(["spreadsheet formula", "天气"], self.skills, None)
+        self.assertEqual([skill.metadata.name if skill else None for skill in results], ["xlsx", None])
+        topk = matcher.match_topk("周复盘", self.skills, None, k=3)
+        self.assertEqual(topk[0][0].metadata.name, "mem-weekly")
+        self.assertTrue(all(score >= matcher.min_score for _, score in topk))
+
+    def test_subset_uses_catalog_matrix(self):
+        """测试子集快照在完整目录的矩阵上打分，只返回子集成员"""
+        encoder = CountingEncoder()
+        matcher = EmbeddingSkillMatcher(encoder=encoder)
+        subset = CatalogSnapshot([self.skills[1], self.skills[2]], parent=self.skills)
+
+        ranked = matcher.rank("合并 PDF 文件", subset, limit=5)
+        self.assertTrue(ranked)
+        self.assertNotIn("pdf", [skill.metadata.name for skill, _ in ranked])
+        self.assertIs(matcher._synced, self.skills)
+        self.assertEqual(len(encoder.encoded), len(self.skills) + 1)
+
+    def test_store_is_memory_mapped_and_reused(self):
+        """测试矩阵持久化为内存映射，并在内容未变化时复用"""
+        store = NpyVectorStore(self.test_dir)
+        first = EmbeddingSkillMatcher(encoder=CountingEncoder(), store=store)
+        first.sync(self.skills)
+        self.assertIsInstance(first.sync(self.skills)[2], np.memmap)
+
+        # 另一个进程：完全复用已保存的矩阵
+        encoder = CountingEncoder()
+        second = EmbeddingSkillMatcher(encoder=encoder, store=store)
+        self.assertEqual(second.match("周复盘", self.skills, None).metadata.name, "mem-weekly")
+        self.assertEqual(encoder.encoded, ["周复盘"])
+
+        # 只有新增的 Skill 需要编码
+        encoder.encoded.clear()
+        updated = CatalogSnapshot([*self.skills, make_skill("docx", "Word 文档")], version=2)
+        second.sync(updated)
+        self.assertEqual(len(encoder.encoded), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
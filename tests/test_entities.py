@@ -1,10 +1,12 @@
 """
 测试实体模块
 """
+import threading
 import unittest
 from pathlib import Path
-from skill_manager.core.entities.skill import Skill, SkillMetadata, SkillScript, SkillReference
+from skill_manager.core.entities.skill import Skill, SkillMetadata, SkillScript, SkillReference, LazyValue
 from skill_manager.core.entities.message import Message, MessageRole
+from skill_manager.core.entities.catalog import CatalogSnapshot, find_skill
 
 
 class TestSkillMetadata(unittest.TestCase):
@@ -34,6 +36,53 @@ class TestSkillMetadata(unittest.TestCase):
         self.assertEqual(data["version"], "1.0.0")
 
 
+    def test_slots(self):
+        """测试实体使用 __slots__，没有实例 __dict__"""
+        metadata = SkillMetadata(name="test-skill", description="A test skill")
+        skill = Skill(metadata=metadata, instructions="", path=Path("/tmp/test"))
+        ref = SkillReference(name="api", content="# API", path=Path("/tmp/test/api.md"))
+        for obj in (metadata, skill, ref):
+            self.assertFalse(hasattr(obj, "__dict__"))
+
+
+class TestCatalogSnapshot(unittest.TestCase):
+    """测试 CatalogSnapshot 实体"""
+
+    def _skill(self, name: str) -> Skill:
+        return Skill(
+            metadata=SkillMetadata(name=name, description=f"{name} skill"),
+            instructions="",
+            path=Path(f"/tmp/{name}")
+        )
+
+    def test_lookup(self):
+        """测试序列访问和按名称查找"""
+        pdf, docx = self._skill("pdf"), self._skill("docx")
+        snapshot = CatalogSnapshot([pdf, docx], version=3)
+
+        self.assertEqual(len(snapshot), 2)
+        self.assertIs(snapshot[0], pdf)
+        self.assertIs(snapshot.get("docx"), docx)
+        self.assertIsNone(snapshot.get("xlsx"))
+        self.assertIn("pdf", snapshot)
+        self.assertEqual([m.name for m in snapshot.metadata], ["pdf", "docx"])
+        self.assertIs(find_skill(snapshot, "pdf"), pdf)
+        self.assertIs(find_skill([pdf, docx], "docx"), docx)
+
+    def test_derived_computed_once(self):
+        """测试派生数据每个快照只计算一次"""
+        snapshot = CatalogSnapshot([self._skill("pdf")])
+        calls = []
+
+        def factory(skills):
+            calls.append(1)
+            return [s.metadata.name for s in skills]
+
+        self.assertEqual(snapshot.derived("names", factory), ["pdf"])
+        self.assertEqual(snapshot.derived("names", factory), ["pdf"])
+        self.assertEqual(len(calls), 1)
+
+
 class TestMessage(unittest.TestCase):
     """测试 Message 实体"""
 
@@ -104,6 +153,74 @@ class TestSkill(unittest.TestCase):
         )
         self.assertEqual(skill.full_content, "Test instructions")
 
+    def test_lazy_instructions(self):
+        """测试延迟加载正文"""
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return "Lazy instructions"
+
+        skill = Skill(
+            metadata=SkillMetadata(name="test-skill", description="A test skill"),
+            instructions=LazyValue(loader),
+            path=Path("/tmp/test")
+        )
+        self.assertFalse(skill.is_loaded)
+        self.assertEqual(calls, [])
+        self.assertEqual(skill.instructions, "Lazy instructions")
+        self.assertEqual(skill.instructions, "Lazy instructions")
+        self.assertEqual(calls, [1])
+        self.assertTrue(skill.is_loaded)
+
+
+class PausingLazyValue(LazyValue):
+    """读取 loader 时暂停指定线程，用于构造并发首次读取的交错"""
+
+    def __init__(self, loader, *args):
+        self.paused = None
+        self.pausing = threading.Event()
+        self.resume = threading.Event()
+        super().__init__(loader, *args)
+
+    @property
+    def _loader(self):
+        if threading.current_thread() is self.paused:
+            self.pausing.set()
+            self.resume.wait(5)
+        return self.__dict__['loader']
+
+    @_loader.setter
+    def _loader(self, loader):
+        self.__dict__['loader'] = loader
+
+
+class TestLazyValue(unittest.TestCase):
+    """测试 LazyValue"""
+
+    def test_concurrent_first_read(self):
+        """测试另一个线程在本线程读取过程中完成加载时，不会以空参数调用 loader"""
+        value = PausingLazyValue(lambda path: f"content of {path}", "/tmp/SKILL.md")
+        results, errors = [], []
+
+        def read():
+            try:
+                results.append(value.get())
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=read)
+        value.paused = thread
+        thread.start()
+        self.assertTrue(value.pausing.wait(5))
+
+        # 第二个线程暂停期间，本线程完成首次加载
+        self.assertEqual(value.get(), "content of /tmp/SKILL.md")
+        value.resume.set()
+        thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(results, ["content of /tmp/SKILL.md"])
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,112 @@
+"""
+测试 frontmatter 解析器
+"""
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+from skill_manager.core.services import frontmatter
+from skill_manager.core.services.frontmatter import FrontmatterParser
+
+
+class TestFrontmatterParser(unittest.TestCase):
+    """测试 FrontmatterParser"""
+
+    def setUp(self):
+        self.parser = FrontmatterParser()
+
+    def assert_same_as_yaml(self, text, fast=True):
+        """解析结果与 yaml.safe_load 一致，并检查是否走了快速路径"""
+        fast_hits = self.parser.fast_hits
+        self.assertEqual(self.parser.parse(text), yaml.safe_load(text))
+        self.assertEqual(self.parser.fast_hits - fast_hits, 1 if fast else 0)
+
+    def test_flat_fields(self):
+        """测试扁平 key: value 走快速路径"""
+        self.assert_same_as_yaml(
+            "name: pdf\n"
+            "description: 处理 PDF 文件，支持 (1) 合并，(2) 拆分\n"
+            "license: 'Complete terms in LICENSE.txt'\n"
+            "allowed-tools: \"Read, Write\""
+        )
+
+    def test_block_scalars(self):
+        """测试 > 折叠块和 | 字面块走快速路径"""
+        self.assert_same_as_yaml(
+            "name: content-digest\n"
+            "description: >\n"
+            "  Transform long-form content\n"
+            "  into short-form narratives.\n"
+            "notes: |\n"
+            "  line one\n"
+            "    indented\n"
+            "\n"
+            "  line three\n"
+            "summary: >-\n"
+            "  last block"
+        )
+
+    def test_complex_yaml_falls_back(self):
+        """测试嵌套结构和非字符串纯量交给 YAML 解析器"""
+        self.assert_same_as_yaml(
+            "name: test\ndescription: test\nmetadata:\n  version: 1.0.0",
+            fast=False
+        )
+        self.assert_same_as_yaml("name: test\nversion: 1.0", fast=False)
+        self.assert_same_as_yaml("name: test\nenabled: yes", fast=False)
+        self.assert_same_as_yaml("name: test # comment", fast=False)
+
+    def test_invalid_yaml_raises(self):
+        """测试无效 YAML 仍然由 YAML 解析器报错"""
+        with self.assertRaises(yaml.YAMLError):
+            self.parser.parse("description: methods: writing")
+
+    def test_invalid_yaml_error_matches_safe_load(self):
+        """测试报错信息与 yaml.safe_load 一致，不受是否安装 libyaml 影响"""
+        for text in ("description: methods: writing", "tags: [a, b", "name: 'x", "a:\n\tb"):
+            with self.assertRaises(yaml.YAMLError) as expected:
+                yaml.safe_load(text)
+            for loader in ('CSafeLoader', 'SafeLoader'):
+                if not hasattr(yaml, loader):
+                    continue
+                with mock.patch.object(frontmatter, 'YAML_LOADER', getattr(yaml, loader)):
+                    with self.assertRaises(yaml.YAMLError) as raised:
+                        self.parser.parse(text)
+                self.assertEqual(str(raised.exception), str(expected.exception), loader)
+
+    def test_split(self):
+        """测试拆分 frontmatter 和正文"""
+        self.assertEqual(
+            self.parser.split("---\nname: a\n---\n\n# Body\n"),
+            ("name: a", "# Body")
+        )
+        self.assertEqual(
+            self.parser.split("---  \nname: a\n---  \n# Body"),
+            ("name: a", "# Body")
+        )
+        with self.assertRaises(ValueError):
+            self.parser.split("# No frontmatter")
+
+    def test_read_header_stops_at_delimiter(self):
+        """测试只读取头部，不解码正文"""
+        test_dir = Path(tempfile.mkdtemp())
+        try:
+            skill_md = test_dir / "SKILL.md"
+            skill_md.write_bytes(
+                b"---\r\nname: a\r\ndescription: b\r\n---\r\n" + b"\xff\xfe invalid utf-8"
+            )
+            self.assertEqual(self.parser.read_header(skill_md), "name: a\ndescription: b")
+
+            skill_md.write_text("---\nname: a\n")
+            with self.assertRaises(ValueError):
+                self.parser.read_header(skill_md)
+        finally:
+            shutil.rmtree(test_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,262 @@
+"""
+测试 LLM 后端生成参数
+"""
+import json
+import shutil
+import types
+import tempfile
+import unittest
+from pathlib import Path
+
+from skill_manager import SkillManager
+from skill_manager.core.entities.skill import Skill, SkillMetadata
+from skill_manager.core.entities.prompt import PromptSegment, SegmentedPrompt
+from skill_manager.core.interfaces.llm_backend import ILLMBackend, IModelConfig, GenerationOptions, complete
+from skill_manager.core.services.skill_matcher import SemanticSkillMatcher
+from skill_manager.core.services.prompt_builder import SystemPromptBuilder
+from skill_manager.infrastructure.backends.openai_backend import OpenAIBackend
+from skill_manager.infrastructure.backends.anthropic_backend import AnthropicBackend
+from skill_manager.infrastructure.backends.ollama_backend import OllamaBackend
+from skill_manager.infrastructure.backends.google_backend import GoogleBackend
+
+
+class LegacyBackend(ILLMBackend):
+    """旧签名的后端（不接受 options）"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, messages, system_prompt=None, tools=None):
+        self.calls += 1
+        return "pdf"
+
+    def get_model_name(self):
+        return "legacy"
+
+    def configure(self, config):
+        pass
+
+
+class StructuredBackend(ILLMBackend):
+    """按 options 返回结构化输出的后端"""
+
+    def __init__(self):
+        self.options = []
+
+    def complete(self, messages, system_prompt=None, tools=None, options=None):
+        self.options.append(options)
+        return json.dumps({"answer": options.choices[0]})
+
+    def get_model_name(self):
+        return "structured"
+
+    def configure(self, config):
+        pass
+
+
+class StreamingBackend(ILLMBackend):
+    """逐段返回响应的后端"""
+
+    def __init__(self):
+        self.system_prompts = []
+
+    def complete(self, messages, system_prompt=None, tools=None, options=None):
+        raise AssertionError("流式执行不应调用 complete")
+
+    def complete_stream(self, messages, system_prompt=None, tools=None, options=None):
+        self.system_prompts.append(system_prompt)
+        yield from ["合并", "完成", "。"]
+
+    def get_model_name(self):
+        return "streaming"
+
+    def configure(self, config):
+        pass
+
+
+class TestGenerationOptions(unittest.TestCase):
+    """测试 GenerationOptions"""
+
+    def test_choice_parsing(self):
+        """测试解析结构化输出和纯文本"""
+        options = GenerationOptions(choices=["pdf", "docx", "none"])
+
+        self.assertEqual(options.choice('{"answer": "docx"}'), "docx")
+        self.assertEqual(options.choice('"PDF"'), "pdf")
+        self.assertEqual(options.choice(" none\n"), "none")
+        self.assertIsNone(options.choice("I think pdf"))
+        self.assertEqual(
+            options.response_schema()["properties"]["answer"]["enum"],
+            ["pdf", "docx", "none"]
+        )
+        self.assertIsNone(GenerationOptions(max_tokens=5).response_schema())
+
+    def test_complete_compat(self):
+        """测试旧签名后端按旧方式调用，新后端收到 options"""
+        options = GenerationOptions(max_tokens=8, choices=["pdf"])
+
+        legacy = LegacyBackend()
+        self.assertEqual(complete(legacy, [], options=options), "pdf")
+        self.assertEqual(legacy.calls, 1)
+
+        structured = StructuredBackend()
+        self.assertEqual(complete(structured, [], options=options), '{"answer": "pdf"}')
+        self.assertIs(structured.options[0], options)
+
+    def test_routing_call_is_constrained(self):
+        """测试路由调用限制输出长度和候选"""
+        skills = [
+            Skill(metadata=SkillMetadata(name=name, description="文档"), instructions="", path=Path(f"/tmp/{name}"))
+            for name in ("pdf", "docx")
+        ]
+        backend = StructuredBackend()
+        skill = SemanticSkillMatcher(exact_names=False).match("文档", skills, backend)
+
+        options = backend.options[0]
+        self.assertEqual(skill.metadata.name, options.choices[0])
+        self.assertEqual(options.max_tokens, SemanticSkillMatcher.ANSWER_MAX_TOKENS)
+        self.assertEqual(options.temperature, 0)
+        self.assertEqual(set(options.choices), {"pdf", "docx", "none"})
+
+
+class TestBackendOptionMapping(unittest.TestCase):
+    """测试各后端的参数映射（不需要安装 SDK）"""
+
+    def setUp(self):
+        self.options = GenerationOptions(max_tokens=16, temperature=0, stop=["\n"], choices=["pdf", "none"])
+
+    def test_openai(self):
+        """测试 OpenAI response_format"""
+        kwargs = OpenAIBackend._generation_kwargs(self.options)
+        self.assertEqual(kwargs["max_tokens"], 16)
+        self.assertEqual(kwargs["stop"], ["\n"])
+        self.assertEqual(kwargs["response_format"]["type"], "json_schema")
+        self.assertTrue(kwargs["response_format"]["json_schema"]["strict"])
+
+    def test_ollama(self):
+        """测试 Ollama options 和 format"""
+        payload = OllamaBackend._generation_payload(self.options)
+        self.assertEqual(payload["options"], {"num_predict": 16, "temperature": 0, "stop": ["\n"]})
+        self.assertEqual(payload["format"]["properties"]["answer"]["enum"], ["pdf", "none"])
+
+    def test_google(self):
+        """测试 Gemini response_schema 去掉不支持的字段"""
+        config = GoogleBackend._generation_config(self.options)
+        self.assertEqual(config["max_output_tokens"], 16)
+        self.assertEqual(config["response_mime_type"], "application/json")
+        self.assertNotIn("additionalProperties", config["response_schema"])
+
+
+class TestStreaming(unittest.TestCase):
+    """测试流式执行"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        skill_dir = self.test_dir / "pdf"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: pdf\ndescription: PDF 文件处理：合并、拆分\n---\n\n# pdf instructions\n",
+            encoding="utf-8"
+        )
+        self.manager = SkillManager(auto_load=False)
+        self.manager.load_skills_from_directory(self.test_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_execute_stream(self):
+        """测试 SkillManager 逐段返回后端的输出"""
+        backend = StreamingBackend()
+        chunks = list(self.manager.execute_stream("合并 PDF", backend, skill_name="pdf"))
+
+        self.assertEqual(chunks, ["合并", "完成", "。"])
+        self.assertIn("# pdf instructions", backend.system_prompts[0])
+
+    def test_non_streaming_backend(self):
+        """测试未实现流式接口的后端一次性返回完整响应"""
+        chunks = list(self.manager.execute_stream("合并 PDF", LegacyBackend(), skill_name="pdf"))
+        self.assertEqual(chunks, ["pdf"])
+
+    def test_ollama_stream_parsing(self):
+        """测试解析 Ollama 的 NDJSON 流"""
+        lines = [
+            b'{"message": {"role": "assistant", "content": "Hel"}, "done": false}',
+            b'',
+            b'{"message": {"role": "assistant", "content": "lo"}, "done": false}',
+            b'{"message": {"role": "assistant", "content": ""}, "done": true}',
+        ]
+        self.assertEqual(list(OllamaBackend._stream_chunks(lines)), ["Hel", "lo"])
+
+
+class TestBackendConfigure(unittest.TestCase):
+    """测试重新配置后端时重建客户端（用假的 SDK 模块，不需要安装 SDK）"""
+
+    @staticmethod
+    def fake_sdk(*names):
+        """创建记录构造参数的假 SDK 模块"""
+        module = types.SimpleNamespace()
+        for name in names:
+            setattr(module, name, lambda name=name, **kwargs: (name, kwargs))
+        return module
+
+    def test_openai_rebuilds_async_client(self):
+        """测试 OpenAI 的异步客户端使用新的密钥和地址"""
+        backend = object.__new__(OpenAIBackend)
+        backend._openai = self.fake_sdk("OpenAI", "AsyncOpenAI")
+        backend.configure(IModelConfig(model="gpt-4o-mini", api_key="new-key", base_url="http://proxy"))
+
+        self.assertEqual(backend.async_client, ("AsyncOpenAI", {"api_key": "new-key", "base_url": "http://proxy"}))
+        self.assertEqual(backend.client, ("OpenAI", {"api_key": "new-key", "base_url": "http://proxy"}))
+
+    def test_anthropic_rebuilds_async_client(self):
+        """测试 Anthropic 的异步客户端使用新的密钥"""
+        backend = object.__new__(AnthropicBackend)
+        backend._anthropic = self.fake_sdk("Anthropic", "AsyncAnthropic")
+        backend.configure(IModelConfig(model="claude-haiku", api_key="new-key"))
+
+        self.assertEqual(backend.async_client, ("AsyncAnthropic", {"api_key": "new-key", "base_url": None}))
+        self.assertEqual(backend.get_model_name(), "claude-haiku")
+
+
+class TestSegmentedPrompt(unittest.TestCase):
+    """测试分段系统提示"""
+
+    def test_stable_segments_first(self):
+        """测试稳定分段排在易变分段之前，且本身是完整字符串"""
+        prompt = SegmentedPrompt([
+            PromptSegment("volatile", stable=False),
+            PromptSegment("instructions"),
+            PromptSegment("references"),
+        ])
+
+        self.assertEqual(prompt, "instructions\nreferences\nvolatile")
+        self.assertEqual(prompt.stable_prefix, "instructions\nreferences")
+        self.assertEqual(prompt.volatile_suffix, "volatile")
+
+    def test_anthropic_cache_control(self):
+        """测试 Anthropic 为稳定前缀设置 cache_control"""
+        prompt = SegmentedPrompt([PromptSegment("instructions"), PromptSegment("chunk", stable=False)])
+        blocks = AnthropicBackend._system_blocks(prompt)
+
+        self.assertEqual(blocks[0], {"type": "text", "text": "instructions", "cache_control": {"type": "ephemeral"}})
+        self.assertEqual(blocks[1], {"type": "text", "text": "chunk"})
+        self.assertEqual(AnthropicBackend._system_blocks("plain"), "plain")
+
+    def test_prefix_is_identical_across_turns(self):
+        """测试多轮对话中 Skill 提示逐字节相同"""
+        builder = SystemPromptBuilder()
+        skill = Skill(
+            metadata=SkillMetadata(name="pptx", description="演示文稿"),
+            instructions="# pptx instructions",
+            path=Path("/tmp/pptx")
+        )
+
+        first = builder.build_system_prompt(skill, [skill])
+        second = builder.build_system_prompt(skill, [skill])
+        self.assertIsInstance(first, SegmentedPrompt)
+        self.assertEqual(first.stable_prefix.encode(), second.stable_prefix.encode())
+        self.assertIn("# pptx instructions", first.stable_prefix)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+测试参考文档片段检索
+"""
+import unittest
+from pathlib import Path
+
+from skill_manager.core.entities.skill import Skill, SkillMetadata, SkillReference
+from skill_manager.core.entities.catalog import CatalogSnapshot
+from skill_manager.core.entities.prompt import SegmentedPrompt
+from skill_manager.core.services.prompt_builder import SystemPromptBuilder
+from skill_manager.core.services.reference_index import ReferenceIndex, chunk_markdown, estimate_tokens
+
+GUIDE = """Intro paragraph.
+
+# Tables
+
+Use Table and TableRow.
+
+## Borders
+
+Set borders on each cell.
+
+```python
+# not a heading
+table.borders = True
+```
+
+# Images
+
+Use ImageRun with a buffer.
+"""
+
+
+def make_skill() -> Skill:
+    """创建带参考文档的测试 Skill"""
+    references = {
+        name: SkillReference(name=name, content=content, path=Path(f"/tmp/docx/{name}"))
+        for name, content in [
+            ("guide.md", GUIDE),
+            ("ooxml.md", "# Schema\n\n" + "Raw XML element reference. " * 400),
+        ]
+    }
+    return Skill(
+        metadata=SkillMetadata(name="docx", description="Word 文档处理"),
+        instructions="# docx instructions",
+        path=Path("/tmp/docx"),
+        references=references
+    )
+
+
+class TestChunkMarkdown(unittest.TestCase):
+    """测试按标题切分"""
+
+    def test_headings_and_fences(self):
+        """测试按标题切分，围栏代码块中的 # 不算标题"""
+        chunks = chunk_markdown("guide.md", GUIDE)
+
+        self.assertEqual([chunk.heading for chunk in chunks], ["", "Tables", "Tables > Borders", "Images"])
+        self.assertIn("# not a heading", chunks[2].text)
+        self.assertEqual([chunk.position for chunk in chunks], [0, 1, 2, 3])
+
+    def test_long_section_is_split(self):
+        """测试过长的片段按空行切分"""
+        text = "# Big\n\n" + "\n\n".join("word " * 100 for _ in range(10))
+        chunks = chunk_markdown("big.md", text, max_tokens=200)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(chunk.tokens <= 200 for chunk in chunks))
+
+    def test_long_code_block_and_line_are_split(self):
+        """测试超长的代码块和单行也被切分，代码块的每一部分都有完整围栏"""
+        code = "```python\n" + "\n".join(f"value_{i} = compute({i})" for i in range(400)) + "\n```"
+        chunks = chunk_markdown("code.md", "# Code\n\n" + code + "\n\n" + "x" * 5000, max_tokens=200)
+
+        self.assertTrue(all(chunk.tokens <= 200 for chunk in chunks))
+        fenced = [chunk for chunk in chunks if "value_" in chunk.text]
+        self.assertGreater(len(fenced), 1)
+        self.assertTrue(all(chunk.text.count("```") == 2 for chunk in fenced))
+        self.assertIn("value_399 = compute(399)", fenced[-1].text)
+        self.assertEqual(sum(chunk.text.count("x") for chunk in chunks), 5000)
+
+    def test_every_chunk_fits_small_budget(self):
+        """测试预算小于片段上限时，片段按预算切分，仍能选中"""
+        skill = make_skill()
+        skill.references["ooxml.md"].content = "# Schema\n\n" + "RawXmlElementReference " * 400
+        prompt = SystemPromptBuilder(reference_budget=100).build_system_prompt(
+            skill, CatalogSnapshot([skill]), True, "RawXmlElementReference"
+        )
+        self.assertIn("RawXmlElementReference", prompt.volatile_suffix)
+
+
+class TestReferenceIndex(unittest.TestCase):
+    """测试片段选择"""
+
+    def setUp(self):
+        self.index = ReferenceIndex(make_skill().references)
+
+    def test_relevant_chunks_within_budget(self):
+        """测试只选出相关片段，且总量不超过预算"""
+        chunks = self.index.select("how to set table borders", budget=100)
+
+        self.assertTrue(chunks)
+        self.assertLessEqual(sum(chunk.tokens for chunk in chunks), 100)
+        self.assertIn("Tables > Borders", [chunk.heading for chunk in chunks])
+        self.assertNotIn("ooxml.md", [chunk.reference for chunk in chunks])
+
+    def test_fallback_without_query(self):
+        """测试没有输入时按文档顺序选取开头的片段"""
+        chunks = self.index.select(None, budget=50)
+        self.assertEqual(chunks[0].reference, "guide.md")
+        self.assertEqual(chunks[0].position, 0)
+
+
+class TestReferencePrompt(unittest.TestCase):
+    """测试系统提示中的参考文档"""
+
+    def setUp(self):
+        self.skill = make_skill()
+        self.catalog = CatalogSnapshot([self.skill], version=1)
+
+    def test_budgeted_prompt(self):
+        """测试提示只包含预算内的相关片段，并作为易变分段"""
+        builder = SystemPromptBuilder(reference_budget=200)
+        prompt = builder.build_system_prompt(self.skill, self.catalog, True, "table borders")
+
+        self.assertIsInstance(prompt, SegmentedPrompt)
+        self.assertEqual(prompt.stable_prefix, "# Active Skill: docx\n\n# docx instructions")
+        self.assertIn("Set borders on each cell.", prompt.volatile_suffix)
+        self.assertNotIn("Raw XML element reference.", prompt)
+        self.assertLessEqual(estimate_tokens(prompt.volatile_suffix), 200 + 20)
+
+    def test_index_cached_per_snapshot(self):
+        """测试片段索引按快照只建立一次"""
+        builder = SystemPromptBuilder()
+        first = builder._reference_index(self.skill, self.catalog)
+        self.assertIs(builder._reference_index(self.skill, self.catalog), first)
+
+    def test_unbounded_budget(self):
+        """测试 reference_budget=None 时包含全部参考文档"""
+        builder = SystemPromptBuilder(reference_budget=None)
+        prompt = builder.build_system_prompt(self.skill, self.catalog, True, "table borders")
+        self.assertIn("Raw XML element reference.", prompt.stable_prefix)
+
+
+if __name__ == '__main__':
+    unittest.main()
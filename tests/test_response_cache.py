@@ -0,0 +1,166 @@
+"""
+测试 LLM 响应缓存
+"""
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from skill_manager.core.interfaces.llm_backend import ILLMBackend, GenerationOptions
+from skill_manager.core.services.response_cache import CachingLLMBackend, response_cache_key
+from skill_manager.infrastructure.cache import SqliteResponseStore
+from tests.helpers import FakeClock
+
+
+class CountingBackend(ILLMBackend):
+    """回显最后一条消息并记录调用次数的后端"""
+
+    def __init__(self, model: str = "model-a"):
+        self.model = model
+        self.calls = 0
+
+    def complete(self, messages, system_prompt=None, tools=None, options=None):
+        self.calls += 1
+        return f"{self.model}:{messages[-1]['content']}"
+
+    def complete_stream(self, messages, system_prompt=None, tools=None, options=None):
+        self.calls += 1
+        yield from [self.model, ":", messages[-1]["content"]]
+
+    def get_model_name(self):
+        return self.model
+
+    def configure(self, config):
+        self.model = config.model
+
+
+class LegacyStreamBackend(CountingBackend):
+    """complete_stream 不接受 options 参数的旧式后端"""
+
+    def complete_stream(self, messages, system_prompt=None, tools=None):
+        self.calls += 1
+        yield messages[-1]["content"]
+
+
+class TestCachingLLMBackend(unittest.TestCase):
+    """测试 CachingLLMBackend"""
+
+    def setUp(self):
+        self.backend = CountingBackend()
+        self.options = GenerationOptions(max_tokens=8, temperature=0)
+        self.messages = [{"role": "user", "content": "hello"}]
+
+    def test_deterministic_calls_are_cached(self):
+        """测试 temperature 为 0 的调用命中缓存，其他调用不缓存"""
+        cached = CachingLLMBackend(self.backend)
+
+        self.assertEqual(cached.complete(self.messages, options=self.options), "model-a:hello")
+        self.assertEqual(cached.complete(self.messages, options=self.options), "model-a:hello")
+        self.assertEqual(self.backend.calls, 1)
+
+        cached.complete(self.messages)
+        cached.complete(self.messages)
+        self.assertEqual(self.backend.calls, 3)
+        self.assertEqual(cached.stats()["hits"], 1)
+
+    def test_key_covers_request(self):
+        """测试模型、系统提示和生成参数都参与缓存键"""
+        key = response_cache_key("model-a", self.messages, "system", None, self.options)
+
+        self.assertEqual(key, response_cache_key("model-a", [{"content": "hello", "role": "user"}], "system", None, self.options))
+        self.assertNotEqual(key, response_cache_key("model-b", self.messages, "system", None, self.options))
+        self.assertNotEqual(key, response_cache_key("model-a", self.messages, "other", None, self.options))
+        self.assertNotEqual(key, response_cache_key("model-a", self.messages, "system", None, GenerationOptions(temperature=0)))
+
+    def test_ttl_and_lru(self):
+        """测试过期和容量淘汰"""
+        clock = FakeClock()
+        cached = CachingLLMBackend(self.backend, max_entries=1, ttl=60, deterministic_only=False, clock=clock)
+
+        cached.complete(self.messages)
+        clock.now += 61
+        cached.complete(self.messages)
+        self.assertEqual(self.backend.calls, 2)
+
+        cached.complete([{"role": "user", "content": "other"}])
+        cached.complete(self.messages)
+        self.assertEqual(self.backend.calls, 4)
+        self.assertEqual(len(cached), 1)
+
+    def test_stream_is_recorded(self):
+        """测试流式调用完整结束后写入缓存，命中时一次性返回"""
+        cached = CachingLLMBackend(self.backend)
+
+        self.assertEqual(list(cached.complete_stream(self.messages, options=self.options)), ["model-a", ":", "hello"])
+        self.assertEqual(list(cached.complete_stream(self.messages, options=self.options)), ["model-a:hello"])
+        self.assertEqual(cached.complete(self.messages, options=self.options), "model-a:hello")
+        self.assertEqual(self.backend.calls, 1)
+
+    def test_stream_without_options_support(self):
+        """测试被包装后端的 complete_stream 不接受 options 时按旧签名调用"""
+        backend = LegacyStreamBackend()
+        cached = CachingLLMBackend(backend)
+
+        self.assertEqual(list(cached.complete_stream(self.messages, options=self.options)), ["hello"])
+        self.assertEqual(list(cached.complete_stream(self.messages, options=self.options)), ["hello"])
+        self.assertEqual(backend.calls, 1)
+
+
+class TestSqliteResponseStore(unittest.TestCase):
+    """测试 SqliteResponseStore"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.path = self.test_dir / "responses.db"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_replay_after_restart(self):
+        """测试新进程（新的内存层）从磁盘命中"""
+        options = GenerationOptions(temperature=0)
+        messages = [{"role": "user", "content": "hello"}]
+
+        store = SqliteResponseStore(self.path)
+        CachingLLMBackend(CountingBackend(), store=store).complete(messages, options=options)
+        store.close()
+
+        backend = CountingBackend()
+        store = SqliteResponseStore(self.path)
+        cached = CachingLLMBackend(backend, store=store)
+        self.assertEqual(cached.complete(messages, options=options), "model-a:hello")
+        self.assertEqual(backend.calls, 0)
+        store.close()
+
+    def test_size_cap(self):
+        """测试超出容量时删除最早写入的响应"""
+        store = SqliteResponseStore(":memory:", max_entries=2)
+        for key in ("a", "b", "c"):
+            store.put(key, key.upper(), float("inf"))
+
+        self.assertEqual(len(store), 2)
+        self.assertIsNone(store.get("a"))
+        self.assertEqual(store.get("c"), ("C", float("inf")))
+
+        # 覆盖已有的键不删除其他响应
+        store.put("c", "C2", float("inf"))
+        self.assertEqual(store.get("b"), ("B", float("inf")))
+        store.close()
+
+    def test_size_cap_after_reopen(self):
+        """测试重新打开后按已有条数继续限制容量"""
+        path = self.test_dir / "responses.db"
+        store = SqliteResponseStore(path, max_entries=2)
+        for key in ("a", "b"):
+            store.put(key, key.upper(), float("inf"))
+        store.close()
+
+        store = SqliteResponseStore(path, max_entries=2)
+        store.put("c", "C", float("inf"))
+        self.assertEqual(len(store), 2)
+        self.assertIsNone(store.get("a"))
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
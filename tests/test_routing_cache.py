@@ -0,0 +1,124 @@
+"""
+测试路由缓存
+"""
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from skill_manager.core.entities.catalog import CatalogSnapshot
+from skill_manager.core.services.skill_matcher import ISkillMatcher
+from skill_manager.core.services.routing_cache import CachingSkillMatcher, normalize_query
+from skill_manager.infrastructure.cache import SqliteRoutingStore
+from tests.helpers import make_skill, FakeClock
+
+
+class CountingMatcher(ISkillMatcher):
+    """按关键词匹配并记录调用次数的匹配器"""
+
+    def __init__(self):
+        self.calls = []
+
+    def match(self, user_input, skills, backend):
+        self.calls.append(user_input)
+        for skill in skills:
+            if skill.metadata.name in user_input.lower():
+                return skill
+        return None
+
+
+class TestNormalizeQuery(unittest.TestCase):
+    """测试输入规范化"""
+
+    def test_case_width_and_whitespace(self):
+        """测试大小写、全角半角和空白折叠"""
+        self.assertEqual(normalize_query("帮我处理 PDF"), normalize_query("帮我处理pdf"))
+        self.assertEqual(normalize_query("  帮我处理ＰＤＦ\n"), "帮我处理pdf")
+        self.assertEqual(normalize_query("Merge   two\tPDFs"), "merge two pdfs")
+
+
+class TestCachingSkillMatcher(unittest.TestCase):
+    """测试 CachingSkillMatcher"""
+
+    def setUp(self):
+        self.skills = CatalogSnapshot([
+            make_skill("pdf", "PDF 文件处理"),
+            make_skill("xlsx", "Excel 表格处理"),
+        ], version=1)
+        self.inner = CountingMatcher()
+        self.clock = FakeClock()
+        self.matcher = CachingSkillMatcher(self.inner, max_entries=2, ttl=60, clock=self.clock)
+
+    def test_hit_on_equivalent_input(self):
+        """测试等价输入命中缓存，"无匹配"同样被缓存"""
+        self.assertEqual(self.matcher.match("帮我处理 PDF", self.skills, None).metadata.name, "pdf")
+        self.assertEqual(self.matcher.match("帮我处理pdf", self.skills, None).metadata.name, "pdf")
+        self.assertIsNone(self.matcher.match("天气", self.skills, None))
+        self.assertIsNone(self.matcher.match("天气", self.skills, None))
+
+        self.assertEqual(len(self.inner.calls), 2)
+        self.assertEqual(self.matcher.stats()['hit_ratio'], 0.5)
+
+    def test_ttl_and_lru(self):
+        """测试过期和容量淘汰"""
+        self.matcher.match("pdf", self.skills, None)
+        self.clock.now += 61
+        self.matcher.match("pdf", self.skills, None)
+        self.assertEqual(len(self.inner.calls), 2)
+
+        self.matcher.match("xlsx", self.skills, None)
+        self.matcher.match("other", self.skills, None)
+        self.assertEqual(len(self.matcher), 2)
+        self.matcher.match("pdf", self.skills, None)
+        self.assertEqual(len(self.inner.calls), 5)
+
+    def test_catalog_change_invalidates(self):
+        """测试目录内容变化后旧决策失效，内容不变的新快照继续命中"""
+        self.matcher.match("pdf", self.skills, None)
+        same = CatalogSnapshot(list(self.skills), version=2)
+        self.matcher.match("pdf", same, None)
+        self.assertEqual(len(self.inner.calls), 1)
+
+        changed = CatalogSnapshot([make_skill("pdf", "新的描述")], version=3)
+        self.matcher.match("pdf", changed, None)
+        self.assertEqual(len(self.inner.calls), 2)
+
+    def test_match_batch_deduplicates(self):
+        """测试批量匹配只委托未命中且去重后的请求"""
+        self.matcher.match("pdf", self.skills, None)
+        results = self.matcher.match_batch(["PDF", "xlsx", "XLSX ", "天气"], self.skills, None)
+
+        self.assertEqual(
+            [skill.metadata.name if skill else None for skill in results],
+            ["pdf", "xlsx", "xlsx", None]
+        )
+        self.assertEqual(self.inner.calls, ["pdf", "xlsx", "天气"])
+
+
+class TestSqliteRoutingStore(unittest.TestCase):
+    """测试持久化路由决策"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.skills = CatalogSnapshot([make_skill("pdf", "PDF 文件处理")], version=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_decisions_survive_restart(self):
+        """测试新进程（新的匹配器实例）复用持久化的决策"""
+        path = self.test_dir / "routing.db"
+        store = SqliteRoutingStore(path)
+        CachingSkillMatcher(CountingMatcher(), store=store).match("PDF", self.skills, None)
+        CachingSkillMatcher(CountingMatcher(), ttl=None, store=store).match("天气", self.skills, None)
+        store.close()
+
+        inner = CountingMatcher()
+        matcher = CachingSkillMatcher(inner, store=SqliteRoutingStore(path))
+        self.assertEqual(matcher.match("pdf", self.skills, None).metadata.name, "pdf")
+        self.assertIsNone(matcher.match("天气", self.skills, None))
+        self.assertEqual(inner.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
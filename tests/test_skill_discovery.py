@@ -0,0 +1,87 @@
+"""
+测试 Skill 发现服务
+"""
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from skill_manager.core.services.skill_discovery import SkillDiscovery
+
+
+class TestSkillDiscovery(unittest.TestCase):
+    """测试 SkillDiscovery"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.base_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """清理测试环境"""
+        shutil.rmtree(self.base_dir)
+
+    def _create_skill(self, rel_path: str) -> Path:
+        """创建只包含 SKILL.md 的 Skill 目录"""
+        skill_dir = self.base_dir / rel_path
+        skill_dir.mkdir(parents=True)
+        name = skill_dir.name
+        (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {name}\n---\n")
+        return skill_dir
+
+    def test_discovers_nested_skills(self):
+        """测试发现嵌套目录中的 Skills"""
+        self._create_skill("pdf")
+        self._create_skill("bundle/json-canvas")
+        self._create_skill("bundle/obsidian-bases")
+
+        dirs = SkillDiscovery().find_skill_dirs(self.base_dir)
+
+        self.assertEqual(
+            [d.relative_to(self.base_dir).as_posix() for d in dirs],
+            ["bundle/json-canvas", "bundle/obsidian-bases", "pdf"]
+        )
+
+    def test_max_depth(self):
+        """测试深度限制"""
+        self._create_skill("a/b/deep-skill")
+
+        self.assertEqual(SkillDiscovery(max_depth=2).find_skill_dirs(self.base_dir), [])
+        self.assertEqual(len(SkillDiscovery(max_depth=3).find_skill_dirs(self.base_dir)), 1)
+
+    def test_ignore_file(self):
+        """测试 .skillignore 忽略规则"""
+        self._create_skill("keep")
+        self._create_skill("drafts/wip")
+        self._create_skill("old-copy")
+        (self.base_dir / ".skillignore").write_text("# comment\ndrafts/\n*-copy\n")
+
+        dirs = SkillDiscovery().find_skill_dirs(self.base_dir)
+
+        self.assertEqual([d.name for d in dirs], ["keep"])
+
+    def test_manifest(self):
+        """测试生成文件清单"""
+        skill_dir = self._create_skill("pptx")
+        (skill_dir / "scripts").mkdir()
+        (skill_dir / "scripts" / "thumbnail.py").write_text("")
+        (skill_dir / "references").mkdir()
+        (skill_dir / "references" / "ooxml.md").write_text("")
+        (skill_dir / "references" / "notes.txt").write_text("")
+        (skill_dir / "ooxml.md").write_text("")
+        (skill_dir / "html2pptx.md").write_text("")
+        (skill_dir / "assets").mkdir()
+        (skill_dir / "assets" / "logo.png").write_bytes(b"")
+
+        [manifest] = SkillDiscovery().discover(self.base_dir)
+
+        self.assertEqual(manifest.skill_md, skill_dir / "SKILL.md")
+        self.assertEqual([p.name for p in manifest.scripts], ["thumbnail.py"])
+        self.assertEqual(
+            [p.relative_to(skill_dir).as_posix() for p in manifest.references],
+            ["references/ooxml.md", "html2pptx.md"]
+        )
+        self.assertEqual([p.name for p in manifest.assets], ["logo.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()
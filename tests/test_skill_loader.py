@@ -87,6 +87,56 @@ This is a test skill.
         skill_names = {s.metadata.name for s in skills}
         self.assertEqual(skill_names, {"skill1", "skill2"})
 
+    def test_parallel_load_preserves_order(self):
+        """测试并发加载保持确定的顺序并隔离错误"""
+        for name in ["skill-c", "skill-a", "skill-b"]:
+            self._create_skill(name, f"Skill {name}")
+        broken = Path(self.test_dir) / "broken"
+        broken.mkdir()
+        (broken / "SKILL.md").write_text("no frontmatter")
+
+        loader = FilesystemSkillLoader(max_workers=4)
+        skills = loader.load_skills_from_directory(Path(self.test_dir))
+
+        self.assertEqual(
+            [s.metadata.name for s in skills],
+            ["skill-a", "skill-b", "skill-c"]
+        )
+        self.assertEqual(len(loader.load_timings), 4)
+        self.assertEqual(len(loader.get_slowest_skills(2)), 2)
+
+    def test_lazy_load_skill(self):
+        """测试延迟加载只解析 frontmatter"""
+        skill_dir = self._create_skill("test-skill", "A test skill")
+        refs_dir = skill_dir / "references"
+        refs_dir.mkdir()
+        (refs_dir / "api.md").write_text("# API Reference")
+        (skill_dir / "scripts").mkdir()
+        (skill_dir / "scripts" / "helper.py").write_text("print('hello')")
+
+        loader = FilesystemSkillLoader(lazy=True)
+        skill = loader.load_skill(skill_dir)
+
+        self.assertEqual(skill.metadata.name, "test-skill")
+        self.assertFalse(skill.is_loaded)
+
+        # 首次访问后才读取磁盘内容
+        (refs_dir / "api.md").write_text("# Updated API Reference")
+        self.assertIn("instructions", skill.instructions.lower())
+        self.assertEqual(skill.references["api.md"].content, "# Updated API Reference")
+        self.assertTrue(skill.references["api.md"].is_loaded)
+        self.assertFalse(skill.is_loaded)  # scripts 尚未访问
+
+    def test_lazy_load_invalid_frontmatter(self):
+        """测试延迟加载仍然校验 frontmatter"""
+        skill_dir = Path(self.test_dir) / "broken"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("# No frontmatter")
+
+        loader = FilesystemSkillLoader(lazy=True)
+        with self.assertRaises(ValueError):
+            loader.load_skill(skill_dir)
+
 
 if __name__ == "__main__":
     unittest.main()
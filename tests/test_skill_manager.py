@@ -87,6 +87,29 @@ This is a test skill.
         self.assertIsNotNone(skill)
         self.assertEqual(skill.metadata.name, "test-skill")
 
+    def test_catalog_snapshot_is_immutable(self):
+        """测试重新加载发布新快照，旧快照保持不变"""
+        manager = SkillManager(auto_load=False)
+        manager.load_skill(self._create_skill("skill1", "First skill"))
+        before = manager.catalog
+
+        manager.load_skill(self._create_skill("skill2", "Second skill"))
+        after = manager.catalog
+
+        self.assertEqual([s.metadata.name for s in before], ["skill1"])
+        self.assertEqual([s.metadata.name for s in after], ["skill1", "skill2"])
+        self.assertGreater(after.version, before.version)
+        self.assertIs(after.get("skill2"), manager.get_skill("skill2"))
+
+    def test_unload_skill(self):
+        """测试卸载 Skill"""
+        manager = SkillManager(auto_load=False)
+        manager.load_skill(self._create_skill("test-skill", "A test skill"))
+
+        self.assertTrue(manager.unload_skill("test-skill"))
+        self.assertIsNone(manager.get_skill("test-skill"))
+        self.assertFalse(manager.unload_skill("test-skill"))
+
     def test_execute(self):
         """测试执行"""
         skill_dir = self._create_skill("test-skill", "A test skill")
@@ -102,6 +125,89 @@ This is a test skill.
 
         self.assertEqual(response, "Mock response")
 
+    def test_execute_with_legacy_prompt_builder(self):
+        """测试 build_system_prompt 不接受 user_input 的自定义构建器仍可使用"""
+        from skill_manager.core.services.prompt_builder import SystemPromptBuilder
+
+        class LegacyPromptBuilder(SystemPromptBuilder):
+            def build_system_prompt(self, skill, all_skills, include_references=False):
+                return f"legacy:{skill.metadata.name if skill else None}"
+
+        prompts = []
+
+        class PromptRecordingBackend(MockBackend):
+            def complete(self, messages, system_prompt=None, tools=None):
+                prompts.append(system_prompt)
+                return "Mock response"
+
+            def complete_stream(self, messages, system_prompt=None, tools=None):
+                prompts.append(system_prompt)
+                yield "Mock response"
+
+        manager = SkillManager(auto_load=False, prompt_builder=LegacyPromptBuilder())
+        manager.load_skill(self._create_skill("test-skill", "A test skill"))
+        backend = PromptRecordingBackend()
+
+        self.assertEqual(manager.execute("Test input", backend, skill_name="test-skill"), "Mock response")
+        self.assertEqual("".join(manager.execute_stream("Test input", backend, skill_name="test-skill")), "Mock response")
+        self.assertEqual(prompts, ["legacy:test-skill", "legacy:test-skill"])
+
+    def test_tool_executor_with_legacy_builder(self):
+        """测试 build_tools_definition 只接受 skills 的自定义构建器仍可使用"""
+        from skill_manager.core.services.prompt_builder import ToolCallPromptBuilder
+        from skill_manager.core.services.skill_executor import ToolCallExecutor
+
+        class LegacyToolBuilder(ToolCallPromptBuilder):
+            def build_tools_definition(self, skills):
+                return super().build_tools_definition(skills)
+
+        captured = []
+
+        class ToolRecordingBackend(MockBackend):
+            def complete(self, messages, system_prompt=None, tools=None):
+                captured.append(tools)
+                return "Mock response"
+
+        manager = SkillManager(auto_load=False)
+        manager.load_skill(self._create_skill("test-skill", "A test skill"))
+        executor = ToolCallExecutor(LegacyToolBuilder())
+
+        response = executor.execute("Test input", ToolRecordingBackend(), manager.catalog)
+        self.assertEqual(response, "Mock response")
+        self.assertEqual([tool["function"]["name"] for tool in captured[0]], ["activate_skill_test_skill"])
+
+    def test_execute_with_tools_sends_relevant_subset(self):
+        """测试函数调用模式只发送相关的工具定义，并保留调用方的工具"""
+        manager = SkillManager(auto_load=False)
+        for name, description in [
+            ("pdf", "Merge and split PDF files"),
+            ("xlsx", "Excel spreadsheet formulas"),
+            ("docx", "Word document tracked changes"),
+        ]:
+            manager.load_skill(self._create_skill(name, description))
+
+        captured = []
+
+        class ToolRecordingBackend(MockBackend):
+            def complete(self, messages, system_prompt=None, tools=None):
+                captured.append(tools)
+                return "Mock response"
+
+        extra = {"type": "function", "function": {"name": "search"}}
+        backend = ToolRecordingBackend()
+        manager.execute_with_tools("merge two PDF files", backend, additional_tools=[extra], top_k=1)
+        manager.execute_with_tools("merge two PDF files", backend, top_k=None)
+
+        manager.execute_with_tools("天气怎么样", backend, top_k=2)
+
+        names = [tool["function"]["name"] for tool in captured[0]]
+        self.assertEqual(names, ["activate_skill_pdf", "search"])
+        self.assertEqual(len(captured[1]), 3)
+        # 本地没有任何命中时仍按目录顺序发送 top_k 个工具
+        self.assertEqual(len(captured[2]), 2)
+        # 缓存的定义列表不会被 additional_tools 污染
+        self.assertNotIn(extra, captured[1])
+
     def test_default_skill_dirs(self):
         """测试默认目录列表"""
         self.assertEqual(
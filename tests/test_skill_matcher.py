@@ -0,0 +1,375 @@
+"""
+测试 Skill 匹配器
+"""
+import threading
+import unittest
+from pathlib import Path
+
+from skill_manager.core.entities.skill import Skill, SkillMetadata, LazyValue
+from skill_manager.core.entities.catalog import CatalogSnapshot
+from skill_manager.core.services.bm25_index import BM25Index, tokenize
+from skill_manager.core.services.aho_corasick import AhoCorasick
+from skill_manager.core.services.skill_matcher import IndexedSkillMatcher, SemanticSkillMatcher, ExactSkillMatcher
+from skill_manager.core.services.skill_taxonomy import build_categories
+from skill_manager.core.services.hierarchical_matcher import HierarchicalSkillMatcher
+from skill_manager.core.services.prompt_builder import SystemPromptBuilder
+from skill_manager.core.interfaces.llm_backend import ILLMBackend
+from tests.helpers import make_skill
+
+
+class RecordingBackend(ILLMBackend):
+    """记录提示并返回固定回答的模拟后端"""
+
+    def __init__(self, answer: str = "none"):
+        self.answer = answer
+        self.prompts = []
+
+    def complete(self, messages, system_prompt=None, tools=None):
+        self.prompts.append(messages[-1]["content"])
+        return self.answer
+
+    def get_model_name(self):
+        return "recording"
+
+    def configure(self, config):
+        pass
+
+
+class TestTokenize(unittest.TestCase):
+    """测试分词"""
+
+    def test_cjk_bigrams(self):
+        """测试中文按二元组切分，英文按单词切分"""
+        self.assertEqual(tokenize("处理PDF文件"), ["处理", "pdf", "文件"])
+        self.assertEqual(tokenize("周复盘"), ["周复", "复盘"])
+        self.assertEqual(tokenize("中"), ["中"])
+
+    def test_normalization(self):
+        """测试全角字符和大小写规范化，并去掉停用词"""
+        self.assertEqual(tokenize("Merge the ＰＤＦ files"), ["merge", "pdf", "files"])
+
+
+class TestBM25Index(unittest.TestCase):
+    """测试 BM25Index"""
+
+    def test_incremental_updates(self):
+        """测试增量添加、替换和删除文档"""
+        index = BM25Index()
+        index.add("a", ["pdf", "merge"])
+        index.add("b", ["excel", "table"])
+        self.assertEqual(index.search(["pdf"])[0][0], "a")
+
+        index.add("a", ["word"])
+        self.assertEqual(index.search(["pdf"]), [])
+
+        index.remove("b")
+        self.assertEqual(index.search(["excel"]), [])
+        self.assertEqual(len(index), 1)
+
+
+class TestIndexedSkillMatcher(unittest.TestCase):
+    """测试 IndexedSkillMatcher"""
+
+    def setUp(self):
+        self.skills = [
+            make_skill("pdf", "PDF 文件处理：合并、拆分、提取表格"),
+            make_skill("mem-weekly", "AI个人记忆系统的周复盘功能"),
+            make_skill("canvas-design", "Create posters and visual art", "# Poster Layout\n\nText"),
+        ]
+        self.matcher = IndexedSkillMatcher()
+
+    def test_match_chinese_and_english(self):
+        """测试中英文查询"""
+        self.assertEqual(self.matcher.match("帮我合并 PDF", self.skills, None).metadata.name, "pdf")
+        self.assertEqual(self.matcher.match("写一个周复盘", self.skills, None).metadata.name, "mem-weekly")
+        self.assertIsNone(self.matcher.match("天气怎么样", self.skills, None))
+
+    def test_headings_are_opt_in(self):
+        """测试默认不读取延迟加载的正文，开启 index_headings 时索引标题"""
+        calls = []
+
+        def load_body():
+            calls.append(1)
+            return "# Poster Layout\n\nText"
+
+        lazy = Skill(
+            metadata=SkillMetadata(name="canvas-design", description="Create posters and visual art"),
+            instructions=LazyValue(load_body),
+            path=Path("/tmp/canvas-design")
+        )
+        skills = self.skills[:2] + [lazy]
+
+        self.assertIsNone(self.matcher.match("layout", skills, None))
+        self.assertEqual(calls, [])
+
+        matcher = IndexedSkillMatcher(index_headings=True)
+        self.assertEqual(matcher.match("poster layout", skills, None).metadata.name, "canvas-design")
+        self.assertEqual(calls, [1])
+
+    def test_incremental_rebuild(self):
+        """测试 Skill 变化时增量更新索引"""
+        snapshot = CatalogSnapshot(self.skills, version=1)
+        self.matcher.rank("pdf", snapshot)
+
+        replaced = make_skill("pdf", "Excel 表格处理")
+        updated = CatalogSnapshot([replaced, self.skills[1]], version=2)
+
+        self.assertIsNone(self.matcher.match("poster", updated, None))
+        self.assertIs(self.matcher.match("表格", updated, None), replaced)
+
+    def test_concurrent_snapshots(self):
+        """测试针对另一个快照的并发请求不会在同步与检索之间改写索引"""
+        first = CatalogSnapshot(self.skills, version=1)
+        second = CatalogSnapshot([make_skill("xlsx", "Excel 表格处理")], version=2)
+        search = self.matcher._index.search
+        other = []
+
+        def racing_search(tokens, limit):
+            if not other:
+                thread = threading.Thread(target=lambda: other.append(self.matcher.rank("表格", second)))
+                other.append(thread)
+                thread.start()
+                thread.join(timeout=0.2)
+            return search(tokens, limit)
+
+        self.matcher._index.search = racing_search
+        ranked = self.matcher.rank("帮我合并 PDF", first)
+        other[0].join()
+
+        self.assertIs(ranked[0][0], self.skills[0])
+        self.assertEqual(other[1][0][0].metadata.name, "xlsx")
+
+
+class TestSemanticSkillMatcher(unittest.TestCase):
+    """测试分级匹配"""
+
+    def setUp(self):
+        self.skills = CatalogSnapshot([
+            make_skill("pdf", "PDF 文件处理：合并、拆分、提取表格"),
+            make_skill("xlsx", "Excel 表格处理：公式、图表、数据分析"),
+            make_skill("docx", "Word 文档处理：修订、批注、格式"),
+            make_skill("mem-weekly", "AI个人记忆系统的周复盘功能"),
+        ])
+
+    def test_exact_name_skips_llm(self):
+        """测试输入中出现唯一 Skill 名称时不调用 LLM"""
+        backend = RecordingBackend()
+        matcher = SemanticSkillMatcher()
+
+        self.assertEqual(matcher.match("用 docx 写一份报告", self.skills, backend).metadata.name, "docx")
+        self.assertEqual(backend.prompts, [])
+        self.assertEqual(matcher.exact_hits, 1)
+
+    def test_threshold_uses_normalized_score(self):
+        """测试阈值比较归一化分数：与目录规模无关，主要由无关词组成的请求交给 LLM"""
+        local = IndexedSkillMatcher()
+        for extra in (0, 200):
+            skills = CatalogSnapshot(
+                list(self.skills) + [make_skill(f"filler-{i}", f"unrelated topic {i}") for i in range(extra)]
+            )
+            ranked = local.rank("周复盘", skills, normalize=True)
+            self.assertEqual(ranked[0][0].metadata.name, "mem-weekly")
+            self.assertGreater(ranked[0][1], 0.5)
+            self.assertLessEqual(ranked[0][1], 1.0)
+
+        backend = RecordingBackend()
+        matcher = SemanticSkillMatcher(llm_fallback=False)
+        self.assertIsNone(matcher.match("周复盘之后顺便查一下明天北京天气怎么样", self.skills, backend))
+        self.assertEqual(matcher.llm_calls, 1)
+
+    def test_confident_local_match_skips_llm(self):
+        """测试本地得分明显领先时不调用 LLM"""
+        backend = RecordingBackend()
+        matcher = SemanticSkillMatcher()
+
+        self.assertEqual(matcher.match("帮我做周复盘", self.skills, backend).metadata.name, "mem-weekly")
+        self.assertEqual(matcher.llm_calls, 0)
+
+    def test_ambiguous_match_sends_only_top_candidates(self):
+        """测试候选接近时只把前 top_k 个候选交给 LLM"""
+        backend = RecordingBackend(answer="xlsx")
+        matcher = SemanticSkillMatcher(top_k=2)
+
+        skill = matcher.match("处理表格", self.skills, backend)
+
+        self.assertEqual(skill.metadata.name, "xlsx")
+        self.assertEqual(matcher.llm_calls, 1)
+        self.assertIn("- pdf:", backend.prompts[0])
+        self.assertNotIn("- mem-weekly:", backend.prompts[0])
+
+    def test_llm_answer_outside_candidates_ignored(self):
+        """测试 LLM 返回候选以外的名称时视为不匹配"""
+        backend = RecordingBackend(answer="mem-weekly")
+        matcher = SemanticSkillMatcher(top_k=2)
+        self.assertIsNone(matcher.match("处理表格", self.skills, backend))
+
+    def test_match_batch_packs_ambiguous_requests(self):
+        """测试批量匹配只把无法本地判定的请求合并为一次 LLM 调用"""
+        backend = RecordingBackend(answer="1: xlsx\n2: none")
+        matcher = SemanticSkillMatcher(top_k=2)
+
+        results = matcher.match_batch(
+            ["用 docx 写报告", "处理表格", "write a memo", "帮我做周复盘"],
+            self.skills,
+            backend
+        )
+
+        self.assertEqual(
+            [skill.metadata.name if skill else None for skill in results],
+            ["docx", "xlsx", None, "mem-weekly"]
+        )
+        self.assertEqual(matcher.llm_calls, 1)
+        self.assertIn("1. 处理表格", backend.prompts[0])
+        self.assertIn("2. write a memo", backend.prompts[0])
+
+    def test_match_topk(self):
+        """测试返回带分数的候选"""
+        ranked = SemanticSkillMatcher().match_topk("处理表格", self.skills, RecordingBackend(), k=2)
+        self.assertEqual(len(ranked), 2)
+        self.assertGreaterEqual(ranked[0][1], ranked[1][1])
+
+    def test_no_local_candidates_falls_back_to_llm(self):
+        """测试本地没有候选时按配置让 LLM 查看全部 Skill"""
+        backend = RecordingBackend(answer="docx")
+        self.assertEqual(SemanticSkillMatcher().match("write a memo", self.skills, backend).metadata.name, "docx")
+        self.assertIn("- mem-weekly:", backend.prompts[0])
+
+        self.assertIsNone(SemanticSkillMatcher(llm_fallback=False).match("write a memo", self.skills, backend))
+        self.assertEqual(len(backend.prompts), 1)
+
+
+class TestAhoCorasick(unittest.TestCase):
+    """测试 Aho–Corasick 自动机"""
+
+    def test_overlapping_patterns(self):
+        """测试重叠模式全部命中"""
+        automaton = AhoCorasick()
+        for pattern in ("he", "she", "his", "hers"):
+            automaton.add(pattern, pattern)
+
+        matches = sorted((start, pattern) for start, pattern, _ in automaton.iter_matches("ushers"))
+        self.assertEqual(matches, [(1, "she"), (2, "he"), (2, "hers")])
+
+    def test_word_boundary(self):
+        """测试英文单词边界，中文不受影响"""
+        automaton = AhoCorasick(word_boundary=True)
+        automaton.add("pdf", "pdf")
+
+        self.assertEqual(len(list(automaton.iter_matches("pdfs and xpdf"))), 0)
+        self.assertEqual(len(list(automaton.iter_matches("合并pdf文件"))), 1)
+
+
+class TestExactSkillMatcher(unittest.TestCase):
+    """测试关键词匹配"""
+
+    def setUp(self):
+        self.skills = [
+            make_skill("pdf", "PDF"),
+            make_skill("xlsx", "Excel"),
+        ]
+
+    def test_keywords_and_weights(self):
+        """测试关键词权重，同一关键词只计一次"""
+        matcher = ExactSkillMatcher({"pdf": ["合并", "拆分"]})
+        matcher.add_keywords("xlsx", ["表格"], weight=3)
+
+        self.assertEqual(matcher.score("合并合并表格", self.skills), {"pdf": 1, "xlsx": 3})
+        self.assertEqual(matcher.match("合并合并表格", self.skills, None).metadata.name, "xlsx")
+
+    def test_name_match_and_rebuild(self):
+        """测试名称命中加分，add_keywords 后重新构建自动机"""
+        matcher = ExactSkillMatcher()
+        self.assertEqual(matcher.match("convert to PDF", self.skills, None).metadata.name, "pdf")
+        self.assertIsNone(matcher.match("做个报表", self.skills, None))
+
+        matcher.add_keywords("xlsx", ["报表"])
+        self.assertEqual(matcher.match("做个报表", self.skills, None).metadata.name, "xlsx")
+
+
+class TestSkillTaxonomy(unittest.TestCase):
+    """测试类别划分"""
+
+    def test_declared_and_clustered(self):
+        """测试声明的类别优先，过大的类别细分，未声明的自动聚类"""
+        skills = [make_skill(f"office-{i}", "Word Excel 文档", category="office") for i in range(6)]
+        skills += [make_skill(f"pdf-{i}", "PDF 合并拆分") for i in range(3)]
+        skills += [make_skill(f"mem-{i}", "个人记忆复盘") for i in range(3)]
+
+        categories = build_categories(skills, max_size=4)
+        declared = [category for category in categories if category.declared]
+
+        self.assertGreaterEqual(len(declared), 2)
+        self.assertTrue(all(category.name.startswith("office-") for category in declared))
+        self.assertTrue(all(len(category.skills) <= 4 for category in categories))
+        self.assertEqual(sum(len(category.skills) for category in categories), len(skills))
+        clustered = {
+            frozenset(skill.metadata.name.split("-")[0] for skill in category.skills)
+            for category in categories if not category.declared
+        }
+        self.assertEqual(clustered, {frozenset({"pdf"}), frozenset({"mem"})})
+
+
+class TestHierarchicalSkillMatcher(unittest.TestCase):
+    """测试两级路由"""
+
+    def setUp(self):
+        self.skills = CatalogSnapshot(
+            [make_skill(f"office-{i}", f"Office 文档 {i} " + "x" * 200, category="office") for i in range(8)]
+            + [make_skill(f"media-{i}", f"图片视频 {i} " + "x" * 200, category="media") for i in range(8)],
+            version=1
+        )
+
+    def test_category_then_skill(self):
+        """测试先选类别（提示中只有类别概括），再在类别内匹配"""
+        backend = RecordingBackend(answer="media")
+        matcher = HierarchicalSkillMatcher(ExactSkillMatcher(), flat_limit=10, max_category_size=8)
+
+        # 本地打分能明确区分类别时不调用 LLM
+        self.assertEqual(matcher.match("用 media-3 处理", self.skills, backend).metadata.name, "media-3")
+        self.assertEqual((matcher.local_hits, matcher.llm_calls), (1, 0))
+
+        # 两个类别得分接近时让 LLM 选类别
+        self.assertEqual(matcher.match("用 3 号处理", self.skills, backend), None)
+        self.assertEqual(matcher.llm_calls, 1)
+        self.assertIn("- media: ", backend.prompts[0])
+        self.assertNotIn("x" * 200, backend.prompts[0])
+
+        # 类别内没有提到的 Skill 不会被选中
+        self.assertIsNone(matcher.match("用 3 号 office-3 处理", self.skills, RecordingBackend(answer="media")))
+        self.assertIsNone(matcher.match("天气", self.skills, RecordingBackend(answer="none")))
+
+    def test_categories_share_catalog_index(self):
+        """测试类别内匹配复用完整目录的索引，不同类别的请求不会重建索引"""
+        local = IndexedSkillMatcher()
+        matcher = HierarchicalSkillMatcher(SemanticSkillMatcher(local_matcher=local), flat_limit=10, max_category_size=8)
+        media, office = matcher.categories(self.skills)
+        self.assertEqual((media.name, office.name), ("media", "office"))
+
+        self.assertIs(office.skills.parent, self.skills)
+        self.assertEqual([skill.metadata.name for skill, _ in local.rank("图片视频 3", media.skills)][:1], ["media-3"])
+        self.assertTrue(all(skill in office.skills for skill, _ in local.rank("文档 3", office.skills)))
+        self.assertEqual(local.rank("图片视频", office.skills), [])
+
+        self.assertIs(local._synced, self.skills)
+        self.assertEqual(len(local._indexed), len(self.skills))
+
+    def test_small_catalog_is_flat(self):
+        """测试小目录不分层"""
+        backend = RecordingBackend()
+        matcher = HierarchicalSkillMatcher(ExactSkillMatcher())
+        self.assertEqual(matcher.match("用 office-3 处理", self.skills, backend).metadata.name, "office-3")
+        self.assertEqual(backend.prompts, [])
+
+    def test_compact_available_skills_prompt(self):
+        """测试大目录的可用 Skills 列表按类别分组、只列名称"""
+        prompt = SystemPromptBuilder(compact_threshold=10).build_system_prompt(None, self.skills)
+        self.assertIn("- **office-1**", prompt)
+        self.assertIn("office-7", prompt)
+        self.assertNotIn("x" * 200, prompt)
+
+        full = SystemPromptBuilder().build_system_prompt(None, self.skills)
+        self.assertIn("x" * 200, full)
+
+
+if __name__ == "__main__":
+    unittest.main()
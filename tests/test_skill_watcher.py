@@ -0,0 +1,141 @@
+"""
+测试 Skill 目录监听与热重载
+"""
+import os
+import time
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from skill_manager import SkillManager
+from skill_manager.infrastructure.watchers import PollingSkillWatcher, InotifySkillWatcher
+
+
+def _write_skill(base_dir: Path, dir_name: str, name: str, description: str) -> Path:
+    """写入测试 Skill，并推进 mtime 以避免时间精度导致的漏检"""
+    skill_dir = base_dir / dir_name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    skill_md = skill_dir / "SKILL.md"
+    existed = skill_md.exists()
+    skill_md.write_text(f"---\nname: {name}\ndescription: {description}\n---\n\nBody\n")
+    if existed:
+        st = skill_md.stat()
+        os.utime(skill_md, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    return skill_dir
+
+
+class TestPollingSkillWatcher(unittest.TestCase):
+    """测试 PollingSkillWatcher"""
+
+    watcher_class = PollingSkillWatcher
+
+    def setUp(self):
+        """设置测试环境"""
+        self.base_dir = Path(tempfile.mkdtemp())
+        _write_skill(self.base_dir, "skill-a", "skill-a", "First")
+        _write_skill(self.base_dir, "skill-b", "skill-b", "Second")
+        self.watcher = self.watcher_class([self.base_dir])
+
+    def tearDown(self):
+        """清理测试环境"""
+        self.watcher.close()
+        shutil.rmtree(self.base_dir)
+
+    def _poll_until_changed(self):
+        """等待直到检测到变化"""
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            changes = self.watcher.poll(timeout=0.1)
+            if changes:
+                return changes
+        self.fail("no changes detected")
+
+    def test_no_changes(self):
+        """测试无变化时返回空集合"""
+        self.assertFalse(self.watcher.poll(timeout=0.01))
+
+    def test_detects_add_modify_remove(self):
+        """测试检测新增、修改和删除"""
+        _write_skill(self.base_dir, "skill-a", "skill-a", "Updated")
+        changes = self._poll_until_changed()
+        self.assertEqual(changes.modified, [self.base_dir / "skill-a"])
+
+        _write_skill(self.base_dir, "skill-c", "skill-c", "Third")
+        changes = self._poll_until_changed()
+        self.assertEqual(changes.added, [self.base_dir / "skill-c"])
+
+        shutil.rmtree(self.base_dir / "skill-b")
+        changes = self._poll_until_changed()
+        self.assertEqual(changes.removed, [self.base_dir / "skill-b"])
+
+    def test_ignored_and_deep_dirs_are_not_reported(self):
+        """测试被忽略或超过最大深度的 SKILL.md 不被报告，与加载器一致"""
+        # 先创建目录并让监听器处理，再在其中写入 SKILL.md
+        (self.base_dir / "node_modules").mkdir()
+        (self.base_dir / "a" / "b" / "c").mkdir(parents=True)
+        self.assertFalse(self.watcher.poll(timeout=0.1))
+
+        _write_skill(self.base_dir, "node_modules/pkg", "pkg", "Ignored")
+        _write_skill(self.base_dir, "a/b/c/deep", "deep", "Too deep")
+        deadline = time.time() + 0.5
+        while time.time() < deadline:
+            self.assertFalse(self.watcher.poll(timeout=0.1))
+
+        _write_skill(self.base_dir, "group/skill-d", "skill-d", "Nested")
+        changes = self._poll_until_changed()
+        self.assertEqual(changes.added, [self.base_dir / "group" / "skill-d"])
+
+
+@unittest.skipUnless(InotifySkillWatcher.is_available(), "inotify not available")
+class TestInotifySkillWatcher(TestPollingSkillWatcher):
+    """测试 InotifySkillWatcher"""
+
+    watcher_class = InotifySkillWatcher
+
+
+class TestSkillManagerHotReload(unittest.TestCase):
+    """测试 SkillManager 增量热重载"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.base_dir = Path(tempfile.mkdtemp())
+        _write_skill(self.base_dir, "skill-a", "skill-a", "First")
+        _write_skill(self.base_dir, "skill-b", "skill-b", "Second")
+        self.manager = SkillManager(auto_load=False)
+        self.manager.load_skills_from_directory(self.base_dir)
+
+    def tearDown(self):
+        """清理测试环境"""
+        self.manager.stop_watching()
+        shutil.rmtree(self.base_dir)
+
+    def test_apply_changes_only_touches_changed_skills(self):
+        """测试只有变化的 Skill 被替换"""
+        watcher = PollingSkillWatcher([self.base_dir])
+        untouched = self.manager.get_skill("skill-b")
+
+        _write_skill(self.base_dir, "skill-a", "skill-renamed", "Renamed")
+        self.manager.apply_skill_changes(watcher.poll())
+
+        names = {m.name for m in self.manager.list_skills()}
+        self.assertEqual(names, {"skill-renamed", "skill-b"})
+        self.assertIs(self.manager.get_skill("skill-b"), untouched)
+
+        shutil.rmtree(self.base_dir / "skill-b")
+        self.manager.apply_skill_changes(watcher.poll())
+        self.assertIsNone(self.manager.get_skill("skill-b"))
+
+    def test_background_watching(self):
+        """测试后台线程自动重新加载"""
+        self.manager.start_watching(interval=0.05)
+        _write_skill(self.base_dir, "skill-c", "skill-c", "Third")
+
+        deadline = time.time() + 5
+        while time.time() < deadline and self.manager.get_skill("skill-c") is None:
+            time.sleep(0.02)
+        self.assertIsNotNone(self.manager.get_skill("skill-c"))
+
+
+if __name__ == "__main__":
+    unittest.main()
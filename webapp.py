@@ -3,6 +3,7 @@ LLM Skills Manager - Streamlit Web 应用
 
 支持 Skill CRUD 和用户会话交互
 """
+import itertools
 import streamlit as st
 from pathlib import Path
 import tempfile
@@ -142,17 +143,19 @@ if page == "💬 聊天":
             # 确定使用的 Skill
             skill_name = None if selected_skill == "自动匹配" else selected_skill
 
-            # 执行
+            # 执行（流式显示，首个 token 到达即开始渲染）
             with st.chat_message("assistant"):
+                stream = iter(st.session_state.manager.execute_stream(
+                    user_input=prompt,
+                    backend=backend,
+                    auto_match=(skill_name is None),
+                    skill_name=skill_name,
+                    conversation_history=st.session_state.conversation_history,
+                ))
+                # 路由（可能调用 LLM）在首次迭代时进行，首个片段到达前显示等待提示
                 with st.spinner("思考中..."):
-                    response = st.session_state.manager.execute(
-                        user_input=prompt,
-                        backend=backend,
-                        auto_match=(skill_name is None),
-                        skill_name=skill_name,
-                        conversation_history=st.session_state.conversation_history,
-                    )
-                    st.markdown(response)
+                    first = next(stream, "")
+                response = st.write_stream(itertools.chain([first], stream))
 
             # 保存响应
             st.session_state.messages.append({"role": "assistant", "content": response})
@@ -199,7 +202,7 @@ elif page == "📚 Skills 管理":
 
                     # 删除按钮
                     if st.button(f"删除", key=f"delete_{skill_meta.name}"):
-                        st.session_state.manager._skills.pop(skill_meta.name, None)
+                        st.session_state.manager.unload_skill(skill_meta.name)
                         st.rerun()
 
     with col2: